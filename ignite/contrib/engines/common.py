@@ -62,7 +62,8 @@ def setup_common_training_handlers(
         with_pbars (bool, optional): if True, two progress bars on epochs and optionally on iterations are attached
         with_pbar_on_iters (bool, optional): if True, a progress bar on iterations is attached to the trainer.
         log_every_iters (int, optional): logging interval for :class:`~ignite.contrib.metrics.handlers.GpuInfo` and for
-            epoch-wise progress bar.
+            epoch-wise progress bar. In distributed configuration, running averages of `output_names` are
+            synchronized across processes with the same interval.
         device (str of torch.device, optional): Optional device specification in case of distributed computation usage.
     """
     kwargs = dict(
@@ -141,7 +142,10 @@ def _setup_common_training_handlers(
 
         for i, n in enumerate(output_names):
             RunningAverage(
-                output_transform=partial(output_transform, index=i, name=n), epoch_bound=False, device=device
+                output_transform=partial(output_transform, index=i, name=n),
+                epoch_bound=False,
+                device=device,
+                sync_every=log_every_iters,
             ).attach(trainer, n)
 
     if with_pbars:
@@ -1,4 +1,13 @@
-from collections import OrderedDict
+import functools
+import json
+import math
+import os
+import threading
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from enum import Enum
+from time import perf_counter
 
 import torch
 
@@ -113,11 +122,14 @@ class BasicTimeProfiler:
         engine._event_handlers[Events.STARTED].append((self._as_last_started, (engine,), {}))
 
         for e, m in zip(self._events, self._fmethods):
-            engine._event_handlers[e].insert(0, (m, (engine,), {}))
+            engine._add_first_event_handler(e, m)
 
         for e, m in zip(self._events, self._lmethods):
             engine._event_handlers[e].append((m, (engine,), {}))
 
+        # Handlers are modified inplace, thus compiled dispatch tables should be rebuilt
+        engine._compiled_event_handlers.clear()
+
         # Let's go
         self._event_handlers_timer.reset()
 
@@ -204,7 +216,7 @@ class BasicTimeProfiler:
             raise TypeError("Argument engine should be ignite.engine.Engine, " "but given {}".format(type(engine)))
 
         if not engine.has_event_handler(self._as_first_started):
-            engine._event_handlers[Events.STARTED].insert(0, (self._as_first_started, (engine,), {}))
+            engine._add_first_event_handler(Events.STARTED, self._as_first_started)
 
     @staticmethod
     def _compute_basic_stats(data):
@@ -438,3 +450,684 @@ Handlers names:
         )
         print(output_message)
         return output_message
+
+
+class _StreamingStats:
+    # Count, total, mean and std (Welford's algorithm), min and max of a stream of durations. Percentiles are
+    # estimated with a histogram of logarithmic buckets (as in DDSketch) with a bounded relative error. Durations
+    # below 1ns share a bucket, thus the number of buckets is bounded by the dynamic range of the stream.
+
+    _min_value = 1e-9
+
+    def __init__(self, relative_accuracy=0.01):
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._buckets = {}
+
+    def update(self, value):
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        key = math.ceil(math.log(max(value, self._min_value)) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, q):
+        if self.count == 0:
+            return None
+        rank = q / 100.0 * (self.count - 1)
+        cumsum = 0
+        for key in sorted(self._buckets):
+            cumsum += self._buckets[key]
+            if cumsum > rank:
+                break
+        # bucket `key` holds values in (gamma ** (key - 1), gamma ** key]
+        value = 2.0 * self._gamma ** key / (self._gamma + 1.0)
+        return min(max(value, self.min), self.max)
+
+    def as_dict(self, percentiles):
+        out = [("total", self.total if self.count > 0 else "not yet triggered")]
+        if self.count > 0:
+            out += [
+                ("count", self.count),
+                ("min", self.min),
+                ("max", self.max),
+                ("mean", self.mean),
+                ("std", self.std),
+            ]
+            out += [("p{}".format(q), self.percentile(q)) for q in percentiles]
+        return OrderedDict(out)
+
+
+def _get_handler_name(func):
+    func = Engine._unwrap_handler(func)
+    return func.__qualname__ if hasattr(func, "__qualname__") else func.__class__.__name__
+
+
+class _EngineInstrumentation:
+    # Handlers of an engine wrapped by a profiler and probes inserted around them for the duration of a run. Wrapped
+    # handlers call `on_return(start, end)` with the times they were called and returned at.
+
+    def __init__(self, engine, owner):
+        self.engine = engine
+        self.owner = owner
+        self._probes = []
+        self._wrapped_handlers = {}
+
+    def wrap_handlers(self, event_name, make_callback):
+        # `make_callback(name)` returns `on_return` of the handler named `name`
+        handlers = self.engine._event_handlers[event_name]
+        names = {}
+        for i, (func, args, kwargs) in enumerate(handlers):
+            if getattr(func, "__self__", None) is self.owner:
+                continue
+            name = _get_handler_name(func)
+            names[name] = names.get(name, 0) + 1
+            if names[name] > 1:
+                name = "{} ({})".format(name, names[name])
+            handlers[i] = (self._wrap_handler(event_name, func, make_callback(name)), args, kwargs)
+        # Handlers are modified inplace, thus compiled dispatch tables should be rebuilt
+        self.engine._compiled_event_handlers.clear()
+
+    def _wrap_handler(self, event_name, func, on_return):
+        # handlers on filtered events are wrappers checking the filter: time the wrapped handler and wrap it again
+        event_filter = getattr(func, "__dict__", {}).get("_event_filter", None)
+        handler = func.__wrapped__ if event_filter is not None else func
+
+        @functools.wraps(handler)
+        def timed_handler(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                on_return(start, perf_counter())
+
+        # setup input handler as parent to make has_event_handler work
+        timed_handler._parent = weakref.ref(handler)
+        if event_filter is not None:
+            timed_handler = self.engine._handler_wrapper(timed_handler, event_name, event_filter)
+            timed_handler._parent = weakref.ref(handler)
+        self._wrapped_handlers[timed_handler] = (event_name, func)
+        return timed_handler
+
+    def add_probes(self, event_name, first, last):
+        # probes are called with the engine before and after all handlers of the event
+        if first is not None:
+            self.engine._add_first_event_handler(event_name, first)
+            self._probes.append((event_name, first))
+        if last is not None:
+            self.engine._event_handlers[event_name].append((last, (self.engine,), {}))
+            self._probes.append((event_name, last))
+        self.engine._compiled_event_handlers.clear()
+
+    def restore(self):
+        engine = self.engine
+        for e, probe in self._probes:
+            engine._event_handlers[e] = [h for h in engine._event_handlers[e] if h[0] is not probe]
+        for e in set(e for e, _ in self._wrapped_handlers.values()):
+            handlers = engine._event_handlers[e]
+            for i, (func, args, kwargs) in enumerate(handlers):
+                if func in self._wrapped_handlers:
+                    handlers[i] = (self._wrapped_handlers[func][1], args, kwargs)
+        self._probes = []
+        self._wrapped_handlers = {}
+        engine._compiled_event_handlers.clear()
+
+
+class StreamingTimeProfiler:
+    """
+    StreamingTimeProfiler profiles data loading, data processing, events and every single event handler of an engine
+    with a memory footprint independent of the length of the run.
+
+    Unlike :class:`~ignite.contrib.handlers.time_profilers.BasicTimeProfiler`, which stores a time per iteration and
+    per event, durations are aggregated on the fly into count, total, mean, std, min, max and percentiles estimated
+    with a bounded relative error. Data without length and an unknown `epoch_length` are supported. Optionally, times
+    of the most recent iterations are kept in a ring buffer.
+
+    Time spent in each handler registered on the engine when the run starts is measured on its own: handlers are
+    wrapped for the duration of the run and restored on `COMPLETED`, or at the start of the next run if the previous
+    one was interrupted by an exception. Handlers added during the run are accounted in the time of their event only.
+    The overhead is a couple of clock reads per handler call, so the profiler can be left attached in production.
+
+    Args:
+        history_size (int, optional): number of most recent iterations for which dataflow and processing times are
+            kept. Default, 0.
+        percentiles (sequence of float, optional): percentiles to report. Default, (50, 90, 99).
+        relative_accuracy (float, optional): relative accuracy of reported percentiles. Default, 0.01.
+
+    Examples:
+
+    .. code-block:: python
+
+        profiler = StreamingTimeProfiler(history_size=1000)
+        profiler.attach(trainer)
+
+        @trainer.on(Events.EPOCH_COMPLETED(every=10))
+        def log_intermediate_results():
+            profiler.print_results(profiler.get_results())
+
+        trainer.run(dataloader, max_epochs=100)
+
+        # time of each handler of ITERATION_COMPLETED
+        profiler.get_results()["handlers_stats"]["ITERATION_COMPLETED"]
+
+    """
+
+    events_to_ignore = BasicTimeProfiler.events_to_ignore
+
+    def __init__(self, history_size=0, percentiles=(50, 90, 99), relative_accuracy=0.01):
+        if not isinstance(history_size, int) or history_size < 0:
+            raise ValueError(
+                "Argument history_size should be a non-negative integer, but given {}".format(history_size)
+            )
+        if not (0 < relative_accuracy < 1):
+            raise ValueError("Argument relative_accuracy should be in (0, 1), but given {}".format(relative_accuracy))
+
+        self._history_size = history_size
+        self._percentiles = tuple(percentiles)
+        self._relative_accuracy = relative_accuracy
+
+        self._instrumentation = None
+        self._reset()
+
+    def _reset(self):
+        self.dataflow_stats = _StreamingStats(self._relative_accuracy)
+        self.processing_stats = _StreamingStats(self._relative_accuracy)
+        self.event_handlers_stats = OrderedDict()
+        self.handlers_stats = OrderedDict()
+        self.history = deque(maxlen=self._history_size)
+
+        self._event_starts = {}
+        self._dataflow_start = None
+        self._processing_start = None
+        self._dataflow_time = 0.0
+
+    def attach(self, engine):
+        if not isinstance(engine, Engine):
+            raise TypeError("Argument engine should be ignite.engine.Engine, " "but given {}".format(type(engine)))
+
+        if not engine.has_event_handler(self._as_first_started):
+            engine._add_first_event_handler(Events.STARTED, self._as_first_started)
+
+    def detach(self, engine):
+        if engine.has_event_handler(self._as_first_started, Events.STARTED):
+            engine.remove_event_handler(self._as_first_started, Events.STARTED)
+        self._restore()
+
+    def _restore(self):
+        if self._instrumentation is not None:
+            self._instrumentation.restore()
+            self._instrumentation = None
+
+    def _as_first_started(self, engine):
+        self._restore()
+        self._reset()
+        self._event_starts[Events.STARTED] = perf_counter()
+
+        self._instrumentation = _EngineInstrumentation(engine, owner=self)
+        for e in engine._allowed_events:
+            if e in self.events_to_ignore:
+                continue
+            self.event_handlers_stats[e] = _StreamingStats(self._relative_accuracy)
+            handlers_stats = self.handlers_stats.setdefault(e, OrderedDict())
+
+            def make_callback(name, handlers_stats=handlers_stats):
+                stats = handlers_stats[name] = _StreamingStats(self._relative_accuracy)
+                return lambda start, end: stats.update(end - start)
+
+            self._instrumentation.wrap_handlers(e, make_callback)
+            first = functools.partial(self._as_first, e) if e != Events.STARTED else None
+            self._instrumentation.add_probes(e, first, functools.partial(self._as_last, e))
+
+    def _as_first(self, event_name, engine):
+        now = perf_counter()
+        self._event_starts[event_name] = now
+
+        if event_name == Events.GET_BATCH_COMPLETED and self._dataflow_start is not None:
+            self._dataflow_time = now - self._dataflow_start
+            self.dataflow_stats.update(self._dataflow_time)
+            self._dataflow_start = None
+        elif event_name == Events.ITERATION_COMPLETED and self._processing_start is not None:
+            t = now - self._processing_start
+            self.processing_stats.update(t)
+            self._processing_start = None
+            if self._history_size > 0:
+                self.history.append((engine.state.epoch, engine.state.iteration, t, self._dataflow_time))
+
+    def _as_last(self, event_name, engine):
+        now = perf_counter()
+        start = self._event_starts.pop(event_name, None)
+        if start is not None:
+            self.event_handlers_stats[event_name].update(now - start)
+
+        if event_name == Events.GET_BATCH_STARTED:
+            self._dataflow_start = now
+        elif event_name == Events.ITERATION_STARTED:
+            self._processing_start = now
+        elif event_name == Events.COMPLETED:
+            self._restore()
+
+    def get_results(self):
+        """
+        Method to fetch the aggregated profiler results. It can be called during or after the run.
+
+        .. code-block:: python
+
+            results = profiler.get_results()
+
+        Results contain stats of the processing function, of the dataflow, of all handlers of each event and of each
+        handler. Stats are the total time, the number of calls, min, max, mean, std and percentiles (in seconds).
+        """
+
+        def event_key(e):
+            return str(e.name).replace(".", "_")
+
+        total_eh_time = sum([s.total for s in self.event_handlers_stats.values()])
+        return OrderedDict(
+            [
+                ("processing_stats", self.processing_stats.as_dict(self._percentiles)),
+                ("dataflow_stats", self.dataflow_stats.as_dict(self._percentiles)),
+                (
+                    "event_handlers_stats",
+                    dict(
+                        [(event_key(e), s.as_dict(self._percentiles)) for e, s in self.event_handlers_stats.items()]
+                        + [("total_time", total_eh_time)]
+                    ),
+                ),
+                (
+                    "handlers_stats",
+                    {
+                        event_key(e): OrderedDict([(n, s.as_dict(self._percentiles)) for n, s in handlers.items()])
+                        for e, handlers in self.handlers_stats.items()
+                    },
+                ),
+            ]
+        )
+
+    def write_results(self, output_path):
+        """
+        Method to store the times of the most recent iterations kept with `history_size` to a csv file
+
+        .. code-block:: python
+
+            profiler.write_results('path_to_dir/awesome_filename.csv')
+
+        Example output:
+
+        .. code-block:: text
+
+            -----------------------------------------------------------------
+            epoch iteration processing_stats dataflow_stats
+            1.0     1.0        0.00003         0.252387
+            1.0     2.0        0.00029         0.252342
+
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            print("Need pandas to write results as files")
+            return
+
+        results_df = pd.DataFrame(
+            data=list(self.history), columns=["epoch", "iteration", "processing_stats", "dataflow_stats"],
+        )
+        results_df.to_csv(output_path, index=False)
+
+    @staticmethod
+    def print_results(results):
+        """
+        Method to print the aggregated results from the profiler
+
+        .. code-block:: python
+
+            profiler.print_results(results)
+
+        Example output:
+
+        .. code-block:: text
+
+            --------------------------------------------
+            - Time profiling results:
+            --------------------------------------------
+            Processing function time stats (in seconds):
+                total: 2.7412999770604074e-05
+                count: 2
+                min: 1.3081999895803165e-05
+                max: 1.433099987480091e-05
+                mean: 1.3706499885302037e-05
+                std: 8.831763693706307e-07
+                p50: 1.3081999895803165e-05
+                p90: 1.433099987480091e-05
+                p99: 1.433099987480091e-05
+
+            ...
+
+            - Events.ITERATION_COMPLETED:
+                total: 0.2003411054611206
+                ...
+            Handlers:
+            - log_training_loss:
+                total: 0.2001240253448486
+                ...
+            --------------------------------------------
+        """
+
+        def odict_to_str(d, indent="\t"):
+            out = ""
+            for k, v in d.items():
+                out += "{}{}: {}\n".format(indent, k, v)
+            return out
+
+        output_message = """
+--------------------------------------------
+- Time profiling results:
+--------------------------------------------
+
+Processing function time stats (in seconds):
+{processing_stats}
+Dataflow time stats (in seconds):
+{dataflow_stats}
+Time stats of event handlers (in seconds):
+- Total time spent:
+\t{total_time}
+""".format(
+            processing_stats=odict_to_str(results["processing_stats"]),
+            dataflow_stats=odict_to_str(results["dataflow_stats"]),
+            total_time=results["event_handlers_stats"]["total_time"],
+        )
+
+        for e, stats in results["event_handlers_stats"].items():
+            if e == "total_time" or stats["total"] == "not yet triggered":
+                continue
+            output_message += "\n- Events.{}:\n{}".format(e, odict_to_str(stats))
+            handlers = results["handlers_stats"].get(e, {})
+            if len(handlers) > 0:
+                output_message += "Handlers:\n"
+                for name, handler_stats in handlers.items():
+                    output_message += "- {}:\n{}".format(name, odict_to_str(handler_stats))
+
+        print(output_message)
+        return output_message
+
+
+class _SpanBuffer:
+    # Ring buffer of spans (name, category, thread, start, end) stored in flat typed arrays, with interned names and
+    # categories. Once full, oldest spans are overwritten.
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.labels = []
+        self._label_ids = {}
+        self._names = array("l")
+        self._cats = array("l")
+        self._tids = array("Q")
+        self._starts = array("d")
+        self._ends = array("d")
+        self._next = 0
+        self.num_dropped = 0
+
+    def _intern(self, label):
+        label_id = self._label_ids.get(label, None)
+        if label_id is None:
+            label_id = self._label_ids[label] = len(self.labels)
+            self.labels.append(label)
+        return label_id
+
+    def append(self, name, cat, tid, start, end):
+        name, cat = self._intern(name), self._intern(cat)
+        if len(self._starts) < self.capacity:
+            self._names.append(name)
+            self._cats.append(cat)
+            self._tids.append(tid)
+            self._starts.append(start)
+            self._ends.append(end)
+            return
+        i = self._next
+        self._names[i], self._cats[i], self._tids[i], self._starts[i], self._ends[i] = name, cat, tid, start, end
+        self._next = (i + 1) % self.capacity
+        self.num_dropped += 1
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        n = len(self._starts)
+        for i in list(range(self._next, n)) + list(range(0, self._next)):
+            yield (
+                self.labels[self._names[i]],
+                self.labels[self._cats[i]],
+                self._tids[i],
+                self._starts[i],
+                self._ends[i],
+            )
+
+
+class _EngineTrace:
+    # Per engine state of TraceProfiler during a run
+
+    def __init__(self, name):
+        self.name = name
+        self.instrumentation = None
+        self.sampled = {}
+        self.event_starts = {}
+        self.dataflow_start = None
+        self.processing_start = None
+
+
+class TraceProfiler:
+    """
+    TraceProfiler records the timeline of engines' runs and exports it in the Chrome Trace Event format, which can be
+    visualized with `chrome://tracing` or `Perfetto <https://ui.perfetto.dev>`_.
+
+    The following spans are recorded:
+
+    - the dispatch of each event, i.e. the time spent in all its handlers, named after the event,
+    - each handler registered on the engine when the run starts, named after the handler,
+    - the process function, named `process_function`,
+    - fetching the next batch from the data iterator, named `dataflow`.
+
+    Several engines can be attached to the same profiler, e.g. a trainer and an evaluator run on trainer's
+    `EPOCH_COMPLETED`. Spans are recorded on the thread firing the events and are tagged with the name of their
+    engine as category: the evaluator's run then appears nested in the trainer's handler.
+
+    Spans are kept in a compact in-memory buffer of at most `max_spans` spans, oldest spans being dropped once it is
+    full. To bound the overhead on long runs, spans of iteration events (`GET_BATCH_STARTED`, `GET_BATCH_COMPLETED`,
+    `ITERATION_STARTED`, `ITERATION_COMPLETED`), of their handlers, of the process function and of the dataflow can
+    be recorded every `every` iterations only.
+
+    As with :class:`~ignite.contrib.handlers.time_profilers.StreamingTimeProfiler`, handlers are wrapped for the
+    duration of each run.
+
+    Args:
+        every (int, optional): iteration spans are recorded every `every` iterations. Default, 1.
+        max_spans (int, optional): maximum number of spans kept in memory. Default, 1000000.
+
+    Examples:
+
+    .. code-block:: python
+
+        profiler = TraceProfiler(every=10)
+        profiler.attach(trainer, name="trainer")
+        profiler.attach(evaluator, name="evaluator")
+
+        @trainer.on(Events.EPOCH_COMPLETED)
+        def run_validation():
+            evaluator.run(val_loader)
+
+        trainer.run(train_loader, max_epochs=10)
+        profiler.write_results("path_to_dir/trace.json")
+
+    """
+
+    events_to_ignore = BasicTimeProfiler.events_to_ignore
+
+    _iteration_events = (
+        Events.GET_BATCH_STARTED,
+        Events.GET_BATCH_COMPLETED,
+        Events.ITERATION_STARTED,
+        Events.ITERATION_COMPLETED,
+    )
+
+    def __init__(self, every=1, max_spans=1000000):
+        if not isinstance(every, int) or every < 1:
+            raise ValueError("Argument every should be a positive integer, but given {}".format(every))
+        if not isinstance(max_spans, int) or max_spans < 1:
+            raise ValueError("Argument max_spans should be a positive integer, but given {}".format(max_spans))
+
+        self._every = every
+        self._spans = _SpanBuffer(max_spans)
+        self._engines = {}
+        self._start_time = perf_counter()
+
+    def attach(self, engine, name="engine"):
+        """Attaches the profiler to the engine.
+
+        Args:
+            engine (Engine): engine to profile.
+            name (str, optional): name of the engine in the trace. Default, "engine".
+        """
+        if not isinstance(engine, Engine):
+            raise TypeError("Argument engine should be ignite.engine.Engine, " "but given {}".format(type(engine)))
+
+        if engine not in self._engines:
+            self._engines[engine] = _EngineTrace(name)
+            engine._add_first_event_handler(Events.STARTED, self._as_first_started)
+
+    def detach(self, engine):
+        trace = self._engines.pop(engine, None)
+        if trace is None:
+            return
+        if engine.has_event_handler(self._as_first_started, Events.STARTED):
+            engine.remove_event_handler(self._as_first_started, Events.STARTED)
+        self._restore(trace)
+
+    @staticmethod
+    def _restore(trace):
+        if trace.instrumentation is not None:
+            trace.instrumentation.restore()
+            trace.instrumentation = None
+
+    def _record(self, trace, name, start, end):
+        self._spans.append(name, trace.name, threading.get_ident(), start, end)
+
+    def _as_first_started(self, engine):
+        trace = self._engines[engine]
+        self._restore(trace)
+        trace.event_starts = {Events.STARTED: perf_counter()}
+        trace.sampled = {}
+        trace.dataflow_start = None
+        trace.processing_start = None
+
+        trace.instrumentation = _EngineInstrumentation(engine, owner=self)
+        for e in engine._allowed_events:
+            if e in self.events_to_ignore:
+                continue
+
+            def make_callback(name, e=e):
+                def on_return(start, end):
+                    if trace.sampled.get(e, True):
+                        self._record(trace, name, start, end)
+
+                return on_return
+
+            trace.instrumentation.wrap_handlers(e, make_callback)
+            first = functools.partial(self._as_first, e) if e != Events.STARTED else None
+            trace.instrumentation.add_probes(e, first, functools.partial(self._as_last, e))
+
+    @staticmethod
+    def _get_event_name(event_name):
+        if isinstance(event_name, Enum):
+            return "{}.{}".format(type(event_name).__name__, event_name.name)
+        return str(event_name)
+
+    def _is_sampled(self, event_name, engine):
+        if self._every == 1 or event_name not in self._iteration_events:
+            return True
+        iteration = engine.state.iteration
+        # batches are fetched before the iteration counter is incremented
+        if event_name in (Events.GET_BATCH_STARTED, Events.GET_BATCH_COMPLETED):
+            iteration += 1
+        return (iteration - 1) % self._every == 0
+
+    def _as_first(self, event_name, engine):
+        now = perf_counter()
+        trace = self._engines[engine]
+        sampled = trace.sampled[event_name] = self._is_sampled(event_name, engine)
+        trace.event_starts[event_name] = now
+
+        if event_name == Events.GET_BATCH_COMPLETED and trace.dataflow_start is not None:
+            if sampled:
+                self._record(trace, "dataflow", trace.dataflow_start, now)
+            trace.dataflow_start = None
+        elif event_name == Events.ITERATION_COMPLETED and trace.processing_start is not None:
+            if sampled:
+                self._record(trace, "process_function", trace.processing_start, now)
+            trace.processing_start = None
+
+    def _as_last(self, event_name, engine):
+        now = perf_counter()
+        trace = self._engines[engine]
+        start = trace.event_starts.pop(event_name, None)
+        if start is not None and trace.sampled.get(event_name, True):
+            self._record(trace, self._get_event_name(event_name), start, now)
+
+        if event_name == Events.GET_BATCH_STARTED:
+            trace.dataflow_start = now
+        elif event_name == Events.ITERATION_STARTED:
+            trace.processing_start = now
+        elif event_name == Events.COMPLETED:
+            self._restore(trace)
+
+    def get_results(self):
+        """
+        Method to fetch the recorded spans as a dictionary in the Chrome Trace Event format. Spans are complete
+        events (`"ph": "X"`) with timestamps and durations in microseconds.
+
+        .. code-block:: python
+
+            trace = profiler.get_results()
+            trace["traceEvents"][0]
+            # {"name": "Events.STARTED", "cat": "trainer", "ph": "X", "ts": 12.3, "dur": 4.5, "pid": 1234, "tid": 1}
+
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start - self._start_time) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": tid,
+            }
+            for name, cat, tid, start, end in self._spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"num_dropped": self._spans.num_dropped}}
+
+    def write_results(self, output_path):
+        """
+        Method to store the recorded spans to a json file in the Chrome Trace Event format
+
+        .. code-block:: python
+
+            profiler.write_results('path_to_dir/trace.json')
+
+        """
+        with open(output_path, "w") as f:
+            json.dump(self.get_results(), f)
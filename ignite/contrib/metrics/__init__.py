@@ -1,5 +1,5 @@
 import ignite.contrib.metrics.regression
-from ignite.contrib.metrics.average_precision import AveragePrecision
+from ignite.contrib.metrics.average_precision import AveragePrecision, BinnedAveragePrecision
 from ignite.contrib.metrics.gpu_info import GpuInfo
-from ignite.contrib.metrics.precision_recall_curve import PrecisionRecallCurve
-from ignite.contrib.metrics.roc_auc import ROC_AUC, RocCurve
+from ignite.contrib.metrics.precision_recall_curve import BinnedPrecisionRecallCurve, PrecisionRecallCurve
+from ignite.contrib.metrics.roc_auc import ROC_AUC, BinnedROC_AUC, BinnedRocCurve, RocCurve
@@ -0,0 +1,98 @@
+from abc import abstractmethod
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import torch
+
+from ignite.exceptions import NotComputableError
+from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
+
+
+class _BaseBinnedCurve(Metric):
+    # Base class for streaming binary classification curves.
+    # Predictions in [0, 1] are quantized into `num_bins` uniform bins and per-bin counts of negative and positive
+    # samples are accumulated in `_histogram` of shape (2, num_bins) on the metric's device. Child classes implement
+    # `_compute` from the reduced histogram.
+
+    def __init__(
+        self,
+        num_bins: int = 1000,
+        output_transform: Callable = lambda x: x,
+        device: Optional[Union[str, torch.device]] = None,
+    ):
+        if not isinstance(num_bins, int) or num_bins < 1:
+            raise ValueError("Argument num_bins should be a positive integer, but given {}".format(num_bins))
+
+        self._num_bins = num_bins
+        self._histogram = None
+        super(_BaseBinnedCurve, self).__init__(output_transform=output_transform, device=device)
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        self._histogram = torch.zeros(2, self._num_bins, dtype=torch.int64, device=self._device)
+
+    def _check_shape(self, output: Sequence[torch.Tensor]) -> None:
+        y_pred, y = output
+        if y_pred.shape != y.shape:
+            raise ValueError("Input data shapes should be the same, but given {} and {}".format(y_pred.shape, y.shape))
+
+        if not (y_pred.ndimension() == 1 or (y_pred.ndimension() == 2 and y_pred.shape[1] == 1)):
+            raise ValueError("Input y_pred should have shape (N,) or (N, 1), but given {}".format(y_pred.shape))
+
+    @reinit__is_reduced
+    def update(self, output: Sequence[torch.Tensor]) -> None:
+        self._check_shape(output)
+        y_pred, y = output
+
+        bins = (y_pred.detach().flatten() * self._num_bins).long().clamp_(0, self._num_bins - 1)
+        # negatives are counted in the first row and positives in the second row
+        indices = bins + self._num_bins * (y.flatten() == 1).long()
+        counts = torch.bincount(indices, minlength=2 * self._num_bins).reshape(2, self._num_bins)
+        self._histogram += counts.to(self._histogram)
+
+    def _cumulative_counts(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        # counts of false and true positives for decreasing thresholds, restricted to non-empty bins
+        negatives, positives = self._histogram.double().flip(dims=(1,))
+        thresholds = torch.arange(self._num_bins - 1, -1, -1, dtype=torch.float64, device=negatives.device)
+        thresholds /= self._num_bins
+        mask = (negatives + positives) > 0
+        fps = negatives.cumsum(dim=0)[mask]
+        tps = positives.cumsum(dim=0)[mask]
+        return fps, tps, thresholds[mask]
+
+    def _roc_curve(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        fps, tps, thresholds = self._cumulative_counts()
+        if fps[-1] == 0 or tps[-1] == 0:
+            raise NotComputableError(
+                "{} requires both positive and negative samples to be computed.".format(self.__class__.__name__)
+            )
+        zero = fps.new_zeros(1)
+        fpr = torch.cat([zero, fps]) / fps[-1]
+        tpr = torch.cat([zero, tps]) / tps[-1]
+        thresholds = torch.cat([thresholds[:1] + 1, thresholds])
+        return fpr, tpr, thresholds
+
+    def _precision_recall_curve(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        fps, tps, thresholds = self._cumulative_counts()
+        if tps[-1] == 0:
+            raise NotComputableError(
+                "{} requires at least one positive sample to be computed.".format(self.__class__.__name__)
+            )
+        precision = tps / (tps + fps)
+        recall = tps / tps[-1]
+        # stop when full recall is attained
+        last = int(torch.nonzero(tps == tps[-1])[0]) + 1
+        precision = torch.cat([precision[:last].flip(dims=(0,)), precision.new_ones(1)])
+        recall = torch.cat([recall[:last].flip(dims=(0,)), recall.new_zeros(1)])
+        return precision, recall, thresholds[:last].flip(dims=(0,))
+
+    @sync_all_reduce("_histogram")
+    def compute(self):
+        if self._histogram.sum() == 0:
+            raise NotComputableError(
+                "{} must have at least one example before it can be computed.".format(self.__class__.__name__)
+            )
+        return self._compute()
+
+    @abstractmethod
+    def _compute(self):
+        pass
@@ -1,3 +1,8 @@
+from typing import Callable, Optional, Union
+
+import torch
+
+from ignite.contrib.metrics._binned import _BaseBinnedCurve
 from ignite.metrics import EpochMetric
 
 
@@ -40,3 +45,51 @@ class PrecisionRecallCurve(EpochMetric):
 
     def __init__(self, output_transform=lambda x: x):
         super(PrecisionRecallCurve, self).__init__(precision_recall_curve_compute_fn, output_transform=output_transform)
+
+
+class BinnedPrecisionRecallCurve(_BaseBinnedCurve):
+    """Computes precision-recall pairs for binary classification task with bounded memory.
+
+    Contrary to :class:`~ignite.contrib.metrics.PrecisionRecallCurve`, predictions are not stored: they are
+    quantized into `num_bins` uniform bins on `[0, 1]` and only per-bin counts of positive and negative samples are
+    accumulated on the metric's device. In distributed configuration, counts are reduced across all processes.
+
+    The result is a tuple of tensors `(precision, recall, thresholds)` ordered as in
+    `sklearn.metrics.precision_recall_curve <http://scikit-learn.org/stable/modules/generated/
+    sklearn.metrics.precision_recall_curve.html#sklearn.metrics.precision_recall_curve>`_, where thresholds are the
+    lower edges of the non-empty bins in increasing order.
+
+    Args:
+        num_bins (int, optional): number of bins. Memory usage is proportional to it. Default, 1000.
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        device (str of torch.device, optional): device where counts are accumulated and reduced.
+
+    BinnedPrecisionRecallCurve expects y of shape `(N,)` or `(N, 1)` comprised of 0's and 1's. y_pred must be
+    probability estimates of the same shape. To apply an activation to y_pred, use output_transform as shown below:
+
+    .. code-block:: python
+
+        def activated_output_transform(output):
+            y_pred, y = output
+            y_pred = torch.sigmoid(y_pred)
+            return y_pred, y
+
+        pr_curve = BinnedPrecisionRecallCurve(output_transform=activated_output_transform)
+
+    """
+
+    def __init__(
+        self,
+        num_bins: int = 1000,
+        output_transform: Callable = lambda x: x,
+        device: Optional[Union[str, torch.device]] = None,
+    ):
+        super(BinnedPrecisionRecallCurve, self).__init__(
+            num_bins=num_bins, output_transform=output_transform, device=device
+        )
+
+    def _compute(self):
+        return self._precision_recall_curve()
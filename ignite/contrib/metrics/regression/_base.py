@@ -1,8 +1,13 @@
+import math
 from abc import abstractmethod
 
 import torch
+import torch.distributed as dist
 
+from ignite.exceptions import NotComputableError
 from ignite.metrics import EpochMetric, Metric
+from ignite.metrics.epoch_metric import _all_gather_variable_size
+from ignite.metrics.metric import reinit__is_reduced
 
 
 def _check_output_shapes(output):
@@ -56,8 +61,10 @@ class _BaseRegressionEpoch(EpochMetric):
     # `update` method check the shapes and call internal overloaded method `_update`.
     # Class internally stores complete history of predictions and targets of type float32.
 
-    def __init__(self, compute_fn, output_transform=lambda x: x):
-        super(_BaseRegressionEpoch, self).__init__(compute_fn=compute_fn, output_transform=output_transform)
+    def __init__(self, compute_fn, output_transform=lambda x: x, device=None, mmap_dir=None):
+        super(_BaseRegressionEpoch, self).__init__(
+            compute_fn=compute_fn, output_transform=output_transform, device=device, mmap_dir=mmap_dir
+        )
 
     def _check_type(self, output):
         _check_output_types(output)
@@ -65,3 +72,137 @@ class _BaseRegressionEpoch(EpochMetric):
 
     def _check_shape(self, output):
         _check_output_shapes(output)
+
+
+class _QuantileSketch:
+    # Mergeable streaming quantile sketch (KLL) of bounded size.
+    # Items of level h have a weight 2 ** h. When a level exceeds its capacity, it is sorted and every other item is
+    # promoted to the next level, alternating the offset between compactions to keep estimations unbiased without
+    # random number generation. The rank error of a quantile is of order 1 / k.
+
+    def __init__(self, k: int):
+        self.k = k
+        self._levels = []
+        self._offsets = []
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(int(math.ceil(self.k * (2.0 / 3.0) ** depth)), 2)
+
+    def _add_level(self, device) -> None:
+        self._levels.append(torch.empty(0, dtype=torch.float64, device=device))
+        self._offsets.append(0)
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if items.numel() > self._capacity(level):
+                items = torch.sort(items)[0]
+                n = items.numel() // 2 * 2
+                if level + 1 == len(self._levels):
+                    self._add_level(items.device)
+                offset = self._offsets[level]
+                self._offsets[level] = 1 - offset
+                self._levels[level + 1] = torch.cat([self._levels[level + 1], items[offset:n:2]])
+                self._levels[level] = items[n:]
+            level += 1
+
+    def update(self, values: torch.Tensor) -> None:
+        values = values.detach().flatten().to(torch.float64)
+        if len(self._levels) == 0:
+            self._add_level(values.device)
+        self._levels[0] = torch.cat([self._levels[0], values])
+        self._compress()
+
+    def merge(self, levels) -> None:
+        for level, items in enumerate(levels):
+            if level == len(self._levels):
+                self._add_level(items.device)
+            self._levels[level] = torch.cat([self._levels[level], items.to(self._levels[level])])
+        self._compress()
+
+    def num_items(self) -> int:
+        return sum(items.numel() for items in self._levels)
+
+    def quantile(self, q: float) -> float:
+        values = torch.cat(self._levels)
+        weights = torch.cat([torch.full_like(items, 2.0 ** level) for level, items in enumerate(self._levels)])
+        values, indices = torch.sort(values)
+        cumulative_weights = torch.cumsum(weights[indices], dim=0)
+        target = q * cumulative_weights[-1]
+        index = torch.nonzero(cumulative_weights >= target)[0, 0]
+        return values[index].item()
+
+
+class _BaseRegressionMedian(_BaseRegressionEpoch):
+    # Base class for median-based regression metrics.
+    # By default, all errors are stored as in `_BaseRegressionEpoch`, optionally in memory-mapped files in
+    # `mmap_dir`, and the exact median is computed. If `sketch_size` is provided, errors are summarized by a
+    # `_QuantileSketch` of bounded size, merged across processes in distributed configuration.
+
+    def __init__(self, error_fn, output_transform=lambda x: x, sketch_size=None, mmap_dir=None, device=None):
+        if sketch_size is not None and (not isinstance(sketch_size, int) or sketch_size < 2):
+            raise ValueError(
+                "Argument sketch_size should be an integer greater than 1, but given {}".format(sketch_size)
+            )
+
+        if sketch_size is not None and mmap_dir is not None:
+            raise ValueError("Arguments sketch_size and mmap_dir are mutually exclusive.")
+
+        def compute_fn(y_pred, y):
+            return torch.median(error_fn(y_pred, y)).item()
+
+        self._error_fn = error_fn
+        self._sketch_size = sketch_size
+        super(_BaseRegressionMedian, self).__init__(
+            compute_fn=compute_fn, output_transform=output_transform, device=device, mmap_dir=mmap_dir
+        )
+
+    @reinit__is_reduced
+    def reset(self):
+        if self._sketch_size is None:
+            super(_BaseRegressionMedian, self).reset()
+        else:
+            self._sketch = _QuantileSketch(self._sketch_size)
+
+    @reinit__is_reduced
+    def update(self, output):
+        if self._sketch_size is None:
+            super(_BaseRegressionMedian, self).update(output)
+            return
+
+        self._check_shape(output)
+        _check_output_types(output)
+        y_pred, y = output
+        self._sketch.update(self._error_fn(y_pred.flatten(), y.flatten()))
+
+    def compute(self):
+        if self._sketch_size is None:
+            return super(_BaseRegressionMedian, self).compute()
+
+        if dist.is_available() and dist.is_initialized() and dist.get_world_size() > 1:
+            # processes without examples join the gather with empty levels, all processes raise if none has examples
+            stats = torch.tensor([len(self._sketch._levels), self._sketch.num_items()], device=self._device)
+            dist.all_reduce(stats, op=dist.ReduceOp.MAX)
+            num_levels, max_num_items = [int(v) for v in stats.tolist()]
+            if max_num_items == 0:
+                raise NotComputableError(
+                    "{} must have at least one example before it can be computed.".format(self.__class__.__name__)
+                )
+            levels = []
+            for level in range(num_levels):
+                if level < len(self._sketch._levels):
+                    items = self._sketch._levels[level]
+                else:
+                    items = torch.empty(0, dtype=torch.float64)
+                levels.append(_all_gather_variable_size(items, self._device))
+            sketch = _QuantileSketch(self._sketch_size)
+            sketch.merge(levels)
+            return sketch.quantile(0.5)
+
+        if self._sketch.num_items() == 0:
+            raise NotComputableError(
+                "{} must have at least one example before it can be computed.".format(self.__class__.__name__)
+            )
+        return self._sketch.quantile(0.5)
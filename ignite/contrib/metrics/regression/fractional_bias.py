@@ -22,16 +22,16 @@ class FractionalBias(_BaseRegression):
     """
 
     def reset(self):
-        self._sum_of_errors = 0.0
+        self._sum_of_errors = self._scalar_state(0.0)
         self._num_examples = 0
 
     def _update(self, output):
         y_pred, y = output
         errors = 2 * (y.view_as(y_pred) - y_pred) / (y_pred + y.view_as(y_pred))
-        self._sum_of_errors += torch.sum(errors).item()
+        self._sum_of_errors += self._as_state(torch.sum(errors), self._sum_of_errors)
         self._num_examples += y.shape[0]
 
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError("FractionalBias must have at least one example before it can be computed.")
-        return self._sum_of_errors / self._num_examples
+        return float(self._sum_of_errors) / self._num_examples
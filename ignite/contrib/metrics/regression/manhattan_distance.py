@@ -21,12 +21,12 @@ class ManhattanDistance(_BaseRegression):
     """
 
     def reset(self):
-        self._sum_of_errors = 0.0
+        self._sum_of_errors = self._scalar_state(0.0)
 
     def _update(self, output):
         y_pred, y = output
         errors = y.view_as(y_pred) - y_pred
-        self._sum_of_errors += torch.sum(errors).item()
+        self._sum_of_errors += self._as_state(torch.sum(errors), self._sum_of_errors)
 
     def compute(self):
-        return self._sum_of_errors
+        return float(self._sum_of_errors)
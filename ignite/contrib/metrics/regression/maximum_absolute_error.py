@@ -22,15 +22,18 @@ class MaximumAbsoluteError(_BaseRegression):
     """
 
     def reset(self):
-        self._max_of_absolute_errors = -1
+        self._max_of_absolute_errors = self._scalar_state(-1.0)
 
     def _update(self, output):
         y_pred, y = output
-        mae = torch.abs(y_pred - y.view_as(y_pred)).max().item()
-        if self._max_of_absolute_errors < mae:
+        mae = self._as_state(torch.abs(y_pred - y.view_as(y_pred)).max(), self._max_of_absolute_errors)
+        if isinstance(mae, torch.Tensor):
+            self._max_of_absolute_errors = torch.max(self._max_of_absolute_errors, mae)
+        elif self._max_of_absolute_errors < mae:
             self._max_of_absolute_errors = mae
 
     def compute(self):
-        if self._max_of_absolute_errors < 0:
+        max_of_absolute_errors = float(self._max_of_absolute_errors)
+        if max_of_absolute_errors < 0:
             raise NotComputableError("MaximumAbsoluteError must have at least one example before it can be computed.")
-        return self._max_of_absolute_errors
+        return max_of_absolute_errors
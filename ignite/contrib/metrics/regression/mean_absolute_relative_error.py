@@ -22,7 +22,7 @@ class MeanAbsoluteRelativeError(_BaseRegression):
     """
 
     def reset(self):
-        self._sum_of_absolute_relative_errors = 0.0
+        self._sum_of_absolute_relative_errors = self._scalar_state(0.0)
         self._num_samples = 0
 
     def _update(self, output):
@@ -30,7 +30,9 @@ class MeanAbsoluteRelativeError(_BaseRegression):
         if (y == 0).any():
             raise NotComputableError("The ground truth has 0.")
         absolute_error = torch.abs(y_pred - y.view_as(y_pred)) / torch.abs(y.view_as(y_pred))
-        self._sum_of_absolute_relative_errors += torch.sum(absolute_error).item()
+        self._sum_of_absolute_relative_errors += self._as_state(
+            torch.sum(absolute_error), self._sum_of_absolute_relative_errors
+        )
         self._num_samples += y.size()[0]
 
     def compute(self):
@@ -38,4 +40,4 @@ class MeanAbsoluteRelativeError(_BaseRegression):
             raise NotComputableError(
                 "MeanAbsoluteRelativeError must have at least" "one sample before it can be computed."
             )
-        return self._sum_of_absolute_relative_errors / self._num_samples
+        return float(self._sum_of_absolute_relative_errors) / self._num_samples
@@ -1,14 +1,17 @@
 import torch
 
-from ignite.contrib.metrics.regression._base import _BaseRegressionEpoch
+from ignite.contrib.metrics.regression._base import _BaseRegressionMedian
+
+
+def _median_absolute_percentage_errors(y_pred, y):
+    return 100.0 * torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred))
 
 
 def median_absolute_percentage_error_compute_fn(y_pred, y):
-    e = torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred))
-    return 100.0 * torch.median(e).item()
+    return torch.median(_median_absolute_percentage_errors(y_pred, y)).item()
 
 
-class MedianAbsolutePercentageError(_BaseRegressionEpoch):
+class MedianAbsolutePercentageError(_BaseRegressionMedian):
     r"""
     Calculates the Median Absolute Percentage Error:
 
@@ -23,15 +26,31 @@ class MedianAbsolutePercentageError(_BaseRegressionEpoch):
 
     .. warning::
 
-        Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
-
+        By default, current implementation stores all input data (output and target) in as tensors before computing
+        a metric. This can potentially lead to a memory error if the input data is larger than available RAM. In this
+        case, use `sketch_size` to compute an approximation in bounded memory or `mmap_dir` to store data on disk.
+
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        sketch_size (int, optional): if provided, errors are summarized by a streaming quantile sketch of
+            size proportional to `sketch_size` instead of being stored, and an approximation of the median is
+            computed. The rank error of the approximation is of order `1 / sketch_size`. Default, None.
+        mmap_dir (str, optional): if provided, exact mode stores data in memory-mapped temporary files in this
+            directory instead of RAM. Default, None.
+        device (str of torch.device, optional): device used to gather data in distributed configuration.
 
     __ https://arxiv.org/abs/1809.03006
 
     """
 
-    def __init__(self, output_transform=lambda x: x):
+    def __init__(self, output_transform=lambda x: x, sketch_size=None, mmap_dir=None, device=None):
         super(MedianAbsolutePercentageError, self).__init__(
-            median_absolute_percentage_error_compute_fn, output_transform
+            _median_absolute_percentage_errors,
+            output_transform=output_transform,
+            sketch_size=sketch_size,
+            mmap_dir=mmap_dir,
+            device=device,
         )
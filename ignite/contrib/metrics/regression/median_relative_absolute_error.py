@@ -23,13 +23,24 @@ class MedianRelativeAbsoluteError(_BaseRegressionEpoch):
 
     .. warning::
 
-        Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
-
+        Current implementation stores all input data (output and target) in as tensors before computing a metric,
+        as errors are relative to the mean of all targets. This can potentially lead to a memory error if the input
+        data is larger than available RAM. In this case, use `mmap_dir` to store data on disk.
+
+    Args:
+        output_transform (callable, optional): a callable that is used to transform the
+            :class:`~ignite.engine.Engine`'s `process_function`'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        mmap_dir (str, optional): if provided, data is stored in memory-mapped temporary files in this directory
+            instead of RAM. Default, None.
+        device (str of torch.device, optional): device used to gather data in distributed configuration.
 
     __ https://arxiv.org/abs/1809.03006
 
     """
 
-    def __init__(self, output_transform=lambda x: x):
-        super(MedianRelativeAbsoluteError, self).__init__(median_relative_absolute_error_compute_fn, output_transform)
+    def __init__(self, output_transform=lambda x: x, mmap_dir=None, device=None):
+        super(MedianRelativeAbsoluteError, self).__init__(
+            median_relative_absolute_error_compute_fn, output_transform, device=device, mmap_dir=mmap_dir
+        )
@@ -20,19 +20,19 @@ class R2Score(_BaseRegression):
 
     def reset(self):
         self._num_examples = 0
-        self._sum_of_errors = 0
-        self._y_sq_sum = 0
-        self._y_sum = 0
+        self._sum_of_errors = self._scalar_state(0.0)
+        self._y_sq_sum = self._scalar_state(0.0)
+        self._y_sum = self._scalar_state(0.0)
 
     def _update(self, output):
         y_pred, y = output
         self._num_examples += y.shape[0]
-        self._sum_of_errors += torch.sum(torch.pow(y_pred - y, 2)).item()
+        self._sum_of_errors += self._as_state(torch.sum(torch.pow(y_pred - y, 2)), self._sum_of_errors)
 
-        self._y_sum += torch.sum(y).item()
-        self._y_sq_sum += torch.sum(torch.pow(y, 2)).item()
+        self._y_sum += self._as_state(torch.sum(y), self._y_sum)
+        self._y_sq_sum += self._as_state(torch.sum(torch.pow(y, 2)), self._y_sq_sum)
 
     def compute(self):
         if self._num_examples == 0:
             raise NotComputableError("R2Score must have at least one example before it can be computed.")
-        return 1 - self._sum_of_errors / (self._y_sq_sum - (self._y_sum ** 2) / self._num_examples)
+        return 1 - float(self._sum_of_errors) / (float(self._y_sq_sum) - (float(self._y_sum) ** 2) / self._num_examples)
@@ -33,6 +33,14 @@ def _prepare_batch(
     )
 
 
+def _loss_item(x, y, y_pred, loss):
+    return loss.item()
+
+
+def _detached_loss(x, y, y_pred, loss):
+    return loss.detach()
+
+
 def create_supervised_trainer(
     model: torch.nn.Module,
     optimizer: torch.optim.Optimizer,
@@ -40,8 +48,10 @@ def create_supervised_trainer(
     device: Optional[Union[str, torch.device]] = None,
     non_blocking: bool = False,
     prepare_batch: Callable = _prepare_batch,
-    output_transform: Callable = lambda x, y, y_pred, loss: loss.item(),
+    output_transform: Optional[Callable] = None,
     deterministic: bool = False,
+    gradient_accumulation_steps: int = 1,
+    deferred_loss: bool = False,
 ) -> Engine:
     """
     Factory function for creating a trainer for supervised models.
@@ -57,13 +67,39 @@ def create_supervised_trainer(
         prepare_batch (callable, optional): function that receives `batch`, `device`, `non_blocking` and outputs
             tuple of tensors `(batch_x, batch_y)`.
         output_transform (callable, optional): function that receives 'x', 'y', 'y_pred', 'loss' and returns value
-            to be assigned to engine's state.output after each iteration. Default is returning `loss.item()`.
+            to be assigned to engine's state.output after each iteration. Default is returning `loss.item()`, or
+            `loss.detach()` if `deferred_loss` is True.
         deterministic (bool, optional): if True, returns deterministic engine of type
             :class:`~ignite.engine.deterministic.DeterministicEngine`, otherwise :class:`~ignite.engine.Engine`
             (default: False).
+        gradient_accumulation_steps (int, optional): number of iterations to accumulate gradients over before
+            the optimizer step. Loss is divided by this number before backward pass, such that accumulated gradients
+            correspond to the mean loss over the effective batch (default: 1). Accumulation cycles restart at each
+            epoch: if the epoch length is not a multiple of `gradient_accumulation_steps`, the optimizer step is
+            done on the remaining iterations of the epoch, with loss divided by their number. If the epoch length is
+            unknown (first epoch over an iterator without length), this last step is done on `EPOCH_COMPLETED` and
+            loss is divided by `gradient_accumulation_steps`.
+        deferred_loss (bool, optional): if True and `output_transform` is not provided, `engine.state.output` is the
+            loss as a detached tensor on the device of the model, instead of a Python number (default: False).
     Note:
         `engine.state.output` for this engine is defined by `output_transform` parameter and is the loss
         of the processed batch by default.
+    Note:
+        Default `output_transform` calls `loss.item()` which synchronizes host and device at every iteration.
+        With `deferred_loss=True`, the loss is kept as a device tensor. Host and device are then synchronized only
+        when a handler reads the value as a number, e.g. a logger attached on `Events.ITERATION_COMPLETED(every=K)`.
+
+        .. code-block:: python
+
+            # effective batch size is 4 * batch_size and loss is not synchronized at every iteration
+            trainer = create_supervised_trainer(
+                model, optimizer, loss_fn, device="cuda", gradient_accumulation_steps=4, deferred_loss=True
+            )
+
+            @trainer.on(Events.ITERATION_COMPLETED(every=100))
+            def log_loss(engine):
+                print("loss: {:.4f}".format(engine.state.output.item()))
+
     .. warning::
         The internal use of `device` has changed.
         `device` will now *only* be used to move the input data to the correct device.
@@ -75,6 +111,14 @@ def create_supervised_trainer(
         Engine: a trainer engine with supervised update function.
     """
 
+    if gradient_accumulation_steps < 1:
+        raise ValueError(
+            "Argument gradient_accumulation_steps should be positive, but given {}".format(gradient_accumulation_steps)
+        )
+
+    if output_transform is None:
+        output_transform = _detached_loss if deferred_loss else _loss_item
+
     device_type = device.type if isinstance(device, torch.device) else device
     on_tpu = "xla" in device_type if device_type is not None else False
 
@@ -84,23 +128,54 @@ def create_supervised_trainer(
         except ImportError:
             raise RuntimeError("In order to run on TPU, please install PyTorch XLA")
 
+    pending_step = False
+
+    def _step() -> None:
+        nonlocal pending_step
+        if on_tpu:
+            xm.optimizer_step(optimizer, barrier=True)
+        else:
+            optimizer.step()
+        pending_step = False
+
     def _update(engine: Engine, batch: Sequence[torch.Tensor]) -> Union[Any, Tuple[torch.Tensor]]:
+        nonlocal pending_step
         model.train()
-        optimizer.zero_grad()
+        # accumulation cycles restart at each epoch, such that the last cycle of an epoch may be shorter
+        epoch_length = engine.state.epoch_length
+        iteration = engine.state.iteration - 1
+        if epoch_length is not None:
+            iteration %= epoch_length
+        if iteration % gradient_accumulation_steps == 0:
+            optimizer.zero_grad()
         x, y = prepare_batch(batch, device=device, non_blocking=non_blocking)
         y_pred = model(x)
         loss = loss_fn(y_pred, y)
-        loss.backward()
-
-        if on_tpu:
-            xm.optimizer_step(optimizer, barrier=True)
+        if gradient_accumulation_steps > 1:
+            cycle_length = gradient_accumulation_steps
+            if epoch_length is not None:
+                cycle_start = iteration - iteration % gradient_accumulation_steps
+                cycle_length = min(cycle_length, epoch_length - cycle_start)
+            (loss / cycle_length).backward()
         else:
-            optimizer.step()
+            loss.backward()
+
+        pending_step = True
+        if (iteration + 1) % gradient_accumulation_steps == 0 or iteration + 1 == epoch_length:
+            _step()
 
         return output_transform(x, y, y_pred, loss)
 
     trainer = Engine(_update) if not deterministic else DeterministicEngine(_update)
 
+    if gradient_accumulation_steps > 1:
+
+        @trainer.on(Events.EPOCH_COMPLETED)
+        def _step_last_cycle(engine: Engine) -> None:
+            # epoch length is unknown during the first epoch over an iterator without length
+            if pending_step:
+                _step()
+
     return trainer
 
 
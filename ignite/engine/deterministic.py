@@ -1,16 +1,24 @@
 import random
 import warnings
+import weakref
 from collections import OrderedDict
 from functools import wraps
-from typing import Callable, Generator, Iterator, Optional
+from typing import Any, Callable, Generator, Iterable, Iterator, Mapping, Optional, Sequence
 
 import torch
 
 from ignite.engine.engine import Engine
 from ignite.engine.events import Events
+from ignite.engine.utils import _copy_dataloader
 from ignite.utils import manual_seed
 
-__all__ = ["update_dataloader", "keep_random_state", "ReproducibleBatchSampler", "DeterministicEngine"]
+__all__ = [
+    "update_dataloader",
+    "keep_random_state",
+    "ReproducibleBatchSampler",
+    "ShardedFileDataset",
+    "DeterministicEngine",
+]
 
 
 def update_dataloader(
@@ -26,19 +34,37 @@ def update_dataloader(
     Returns:
         torch.utils.data.DataLoader
     """
-    params_keys = [k for k in dataloader.__dict__.keys() if not k.startswith("_")]
-    for k in ["batch_size", "sampler", "drop_last", "batch_sampler", "dataset_kind"]:
-        if k in params_keys:
-            params_keys.remove(k)
-    params = {k: getattr(dataloader, k) for k in params_keys}
-    params["batch_sampler"] = new_batch_sampler
-    return type(dataloader)(**params)
+    return _copy_dataloader(dataloader, batch_sampler=new_batch_sampler)
+
+
+def _as_int64_array(values: Iterable[int]) -> Any:
+    # contiguous int64 array of values, filled without keeping them as a list of Python ints if numpy is available
+    try:
+        import numpy as np
+    except ImportError:
+        return torch.tensor(list(values), dtype=torch.int64)
+    return np.fromiter(values, dtype=np.int64)
+
+
+def _arange_int64(stop: int, step: int = 1) -> Any:
+    # same array type as `_as_int64_array`, filled without iterating in Python
+    try:
+        import numpy as np
+    except ImportError:
+        return torch.arange(0, stop, step, dtype=torch.int64)
+    return np.arange(0, stop, step, dtype=np.int64)
 
 
 class ReproducibleBatchSampler(torch.utils.data.sampler.BatchSampler):
     """Reproducible batch sampler. This class internally iterates and stores indices of the input batch sampler.
     This helps to start providing data batches from an iteration in a deterministic way.
 
+    Indices of an epoch are stored in a single contiguous int64 array (numpy array, or torch tensor if numpy is not
+    available) with the offsets of the batches, and batches are yielded as views of this array. Starting from an
+    iteration does not copy indices. If the batch sampler is a `torch.utils.data.sampler.BatchSampler`, indices are
+    read directly from its sampler, in the same order and with the same random draws, and indices of a
+    `torch.utils.data.SequentialSampler` are generated without iterating it.
+
     Usage:
 
         Setup dataloader with `ReproducibleBatchSampler` and start providing data batches from an iteration:
@@ -62,28 +88,165 @@ class ReproducibleBatchSampler(torch.utils.data.sampler.BatchSampler):
             raise TypeError("Argument batch_sampler should be torch.utils.data.sampler.BatchSampler")
 
         self.batch_indices = None
+        self.batch_offsets = None
         self.batch_sampler = batch_sampler
         self.start_iteration = start_iteration
         self.sampler = self.batch_sampler.sampler
+        self._first_batch = 0
 
     def setup_batch_indices(self) -> None:
-        self.batch_indices = []
-        for batch in self.batch_sampler:
-            self.batch_indices.append(batch)
+        if type(self.batch_sampler) is torch.utils.data.sampler.BatchSampler:
+            # batches are consecutive chunks of sampler's indices
+            if type(self.sampler) is torch.utils.data.sampler.SequentialSampler:
+                self.batch_indices = _arange_int64(len(self.sampler))
+            else:
+                self.batch_indices = _as_int64_array(iter(self.sampler))
+            n = len(self.batch_indices)
+            batch_size = self.batch_sampler.batch_size
+            if self.batch_sampler.drop_last:
+                n = (n // batch_size) * batch_size
+            # the last batch ends at n, it may be partial
+            self.batch_offsets = _arange_int64(n + batch_size, batch_size)
+            self.batch_offsets[-1] = n
+        else:
+            offsets = [0]
+
+            def indices():
+                for batch in self.batch_sampler:
+                    offsets.append(offsets[-1] + len(batch))
+                    yield from batch
 
+            self.batch_indices = _as_int64_array(indices())
+            self.batch_offsets = _as_int64_array(offsets)
+
+        self._first_batch = 0
         if self.start_iteration is not None:
-            self.batch_indices = self.batch_indices[self.start_iteration :]
+            self._first_batch = self.start_iteration
             self.start_iteration = None
 
     def __iter__(self) -> Generator:
         self.setup_batch_indices()
-        for batch in self.batch_indices:
-            yield batch
+        for i in range(self._first_batch, len(self.batch_offsets) - 1):
+            yield self.batch_indices[int(self.batch_offsets[i]) : int(self.batch_offsets[i + 1])]
 
     def __len__(self) -> int:
         return len(self.batch_sampler)
 
 
+class _WorkerSeededDataset(torch.utils.data.Dataset):
+    # Map-style dataset wrapper seeding the random state of persistent workers from a seed in shared memory.
+    # The main process updates the seed before starting an iteration over the dataloader, a worker is seeded
+    # with `seed + worker_id` when it fetches its first sample after the update.
+
+    def __init__(self, dataset: torch.utils.data.Dataset):
+        self.dataset = dataset
+        self.seed = torch.zeros(1, dtype=torch.int64).share_memory_()
+        self._worker_seed = None
+
+    def set_seed(self, seed: int) -> None:
+        self.seed.fill_(seed)
+
+    def __getitem__(self, index: Any) -> Any:
+        seed = self.seed.item()
+        if seed != self._worker_seed:
+            self._worker_seed = seed
+            worker_info = torch.utils.data.get_worker_info()
+            manual_seed(seed + (worker_info.id if worker_info is not None else 0))
+        return self.dataset[index]
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+
+def _read_line(f) -> Optional[str]:
+    line = f.readline()
+    if len(line) == 0:
+        return None
+    return line.decode("utf-8").rstrip("\n")
+
+
+class ShardedFileDataset(torch.utils.data.IterableDataset):
+    """Iterable dataset of samples stored sequentially in shard files. The dataset implements the resumable dataflow
+    protocol of :class:`~ignite.engine.deterministic.DeterministicEngine`: its position is the index of the current
+    shard and the byte offset of the next sample in it, such that resuming a run seeks directly in the shard instead
+    of reading again all previous samples.
+
+    Usage:
+
+        .. code-block:: python
+
+            dataset = ShardedFileDataset(["data-00000.jsonl", "data-00001.jsonl"], transform=json.loads)
+            trainer = DeterministicEngine(train_step)
+
+            # trainer.state_dict() contains the position of the dataset as "dataflow_state"
+            to_save = {"trainer": trainer, "model": model, "optimizer": optimizer}
+            trainer.add_event_handler(Events.ITERATION_COMPLETED(every=1000), Checkpoint(to_save, save_handler))
+
+            trainer.run(DataLoader(dataset, batch_size=32), max_epochs=10, epoch_length=10000)
+
+    Note:
+        The position is tracked in the process iterating over the dataset, thus the dataset should be used directly
+        or with `torch.utils.data.DataLoader` with `num_workers=0`.
+
+    Args:
+        files (sequence of str): paths of the shard files, read in the given order.
+        read_sample (callable, optional): function reading the next sample from a file opened in binary mode. It
+            returns the sample, or `None` at the end of the file. By default, samples are the lines of the files
+            decoded as UTF-8 strings.
+        transform (callable, optional): function applied on each read sample.
+    """
+
+    def __init__(
+        self, files: Sequence[str], read_sample: Optional[Callable] = None, transform: Optional[Callable] = None
+    ):
+        if len(files) < 1:
+            raise ValueError("Argument files should contain at least one file")
+
+        self.files = list(files)
+        self.read_sample = read_sample if read_sample is not None else _read_line
+        self.transform = transform
+        self._position = (0, 0)
+        self._start_position = None
+
+    def __iter__(self) -> Generator:
+        shard, offset = self._start_position if self._start_position is not None else (0, 0)
+        self._start_position = None
+        self._position = (shard, offset)
+        while shard < len(self.files):
+            with open(self.files[shard], "rb") as f:
+                f.seek(offset)
+                while True:
+                    sample = self.read_sample(f)
+                    if sample is None:
+                        break
+                    self._position = (shard, f.tell())
+                    yield self.transform(sample) if self.transform is not None else sample
+            shard, offset = shard + 1, 0
+            self._position = (shard, offset)
+
+    def state_dict(self) -> Mapping:
+        """Returns the position of the next sample to read."""
+        return {"shard": self._position[0], "offset": self._position[1]}
+
+    def load_state_dict(self, state_dict: Mapping) -> None:
+        """Sets the position from which the next iterator over the dataset starts."""
+        self._start_position = (state_dict["shard"], state_dict["offset"])
+
+
+def _is_resumable(obj: Any) -> bool:
+    return callable(getattr(obj, "state_dict", None)) and callable(getattr(obj, "load_state_dict", None))
+
+
+def _get_resumable_data(data: Iterable) -> Optional[Any]:
+    # Returns the object implementing the resumable dataflow protocol for the data, if any. With DataLoader, the
+    # position of an iterable dataset is only known in the main process.
+    if isinstance(data, torch.utils.data.DataLoader):
+        if data._dataset_kind != torch.utils.data.dataloader._DatasetKind.Iterable or data.num_workers > 0:
+            return None
+        data = data.dataset
+    return data if _is_resumable(data) else None
+
+
 def _get_rng_states():
     output = [random.getstate(), torch.get_rng_state()]
     try:
@@ -158,12 +321,27 @@ class DeterministicEngine(Engine):
                 setup_saved_rng_states()
             do_single_epoch_iterations(dataloader)
 
+    If the `DataLoader` has persistent workers (e.g. with `persistent_workers=True` in
+    :meth:`~ignite.engine.Engine.run`), it is replaced once and the same copy is used in the next runs, such that its
+    workers are not respawned. As with non-persistent workers, workers are seeded from the random state of the main
+    process at every dataflow restart.
+
     Internally, `torch.backends.cudnn.deterministic = True` and `torch.backends.cudnn.benchmark = False` are also
     applied.
 
     For more details about dataflow synchronization, please see
     `"Concepts/Dataflow synchronization" <https://pytorch.org/ignite/concepts.html#dataflow-synchronization>`_.
 
+    Otherwise, resuming a run from an iteration fetches data from the beginning until the required iteration, unless
+    the data implements the resumable dataflow protocol: the data (e.g. a dataset, also when wrapped in a
+    `DataLoader` with `num_workers=0`) or the iterator returned by `iter(data)` defines `state_dict()`, which returns
+    the position of the next sample, and `load_state_dict(state_dict)`, which seeks to a position. For data,
+    `load_state_dict` sets the position from which the next iterator over the data starts. In this case, the position
+    is saved as `"dataflow_state"` in :meth:`~ignite.engine.deterministic.DeterministicEngine.state_dict` and a
+    resumed run seeks directly to it. See :class:`~ignite.engine.deterministic.ShardedFileDataset` for a reference
+    implementation. The position is not saved when batches are prefetched, as the data iterator is then ahead of the
+    engine.
+
     .. Note ::
 
         This class can produce exactly the same dataflow when resuming the run from an epoch (or more precisely from
@@ -171,17 +349,44 @@ class DeterministicEngine(Engine):
 
     """
 
-    def __init__(self, process_function: Callable):
-        super(DeterministicEngine, self).__init__(process_function)
+    def __init__(self, process_function: Callable, compile_event_handlers: bool = False):
+        super(DeterministicEngine, self).__init__(process_function, compile_event_handlers=compile_event_handlers)
         self.state_dict_user_keys.append("rng_states")
         self.add_event_handler(Events.STARTED, self._init_run)
         self.add_event_handler(Events.DATALOADER_STOP_ITERATION | Events.TERMINATE_SINGLE_EPOCH, self._setup_seed)
+        self._data_iter = None
+        # reproducible copies of input dataloaders with persistent workers
+        self._reproducible_dataloaders = weakref.WeakKeyDictionary()
 
     def state_dict(self) -> OrderedDict:
         state_dict = super(DeterministicEngine, self).state_dict()
         state_dict["rng_states"] = _get_rng_states()
+        dataflow_state = self._get_dataflow_state()
+        if dataflow_state is not None:
+            state_dict["dataflow_state"] = dataflow_state
         return state_dict
 
+    def load_state_dict(self, state_dict: Mapping) -> None:
+        super(DeterministicEngine, self).load_state_dict(state_dict)
+        self.state.dataflow_state = state_dict.get("dataflow_state", None)
+
+    def _get_dataflow_state(self) -> Optional[Any]:
+        if self.state is None:
+            return None
+        # position loaded, but not yet used
+        dataflow_state = getattr(self.state, "dataflow_state", None)
+        if dataflow_state is not None:
+            return dataflow_state
+        if self._prefetch > 0:
+            return None
+        resumable = self._data_iter if _is_resumable(self._data_iter) else _get_resumable_data(self.state.dataloader)
+        return resumable.state_dict() if resumable is not None else None
+
+    def _set_dataloader_iter(self, data_iter: Optional[Iterator]) -> None:
+        # keep the iterator before it is possibly wrapped for prefetching
+        self._data_iter = data_iter
+        super(DeterministicEngine, self)._set_dataloader_iter(data_iter)
+
     def _init_run(self) -> None:
         seed = torch.randint(0, int(1e9), (1,)).item()
         self.state.seed = seed
@@ -215,12 +420,11 @@ class DeterministicEngine(Engine):
 
                 batch_sampler = self.state.dataloader.batch_sampler
                 if not (batch_sampler is None or isinstance(batch_sampler, ReproducibleBatchSampler)):
-                    self.state.dataloader = update_dataloader(
-                        self.state.dataloader, ReproducibleBatchSampler(batch_sampler)
-                    )
+                    self.state.dataloader = self._get_reproducible_dataloader(self.state.dataloader)
 
         iteration = self.state.iteration
-        self._dataloader_iter = self._from_iteration(iteration)
+        resume_dataflow = getattr(self.state, "dataflow_state", None) is not None
+        self._set_dataloader_iter(self._from_iteration(iteration))
 
         # Below we define initial counter value for _run_once_on_dataset to measure a single epoch
         if self.state.epoch_length is not None:
@@ -228,13 +432,37 @@ class DeterministicEngine(Engine):
         self._init_iter.append(iteration)
 
         # restore rng state if in the middle
-        in_the_middle = self.state.iteration % self._dataloader_len > 0 if self._dataloader_len is not None else False
+        if self._dataloader_len is not None:
+            in_the_middle = self.state.iteration % self._dataloader_len > 0
+        else:
+            in_the_middle = resume_dataflow and self.state.iteration > 0
         if (getattr(self.state, "rng_states", None) is not None) and in_the_middle:
             _set_rng_states(self.state.rng_states)
             self.state.rng_states = None
 
+    def _get_reproducible_dataloader(self, dataloader: torch.utils.data.DataLoader) -> torch.utils.data.DataLoader:
+        if not (dataloader.num_workers > 0 and getattr(dataloader, "persistent_workers", False)):
+            return update_dataloader(dataloader, ReproducibleBatchSampler(dataloader.batch_sampler))
+        # a single copy is kept per dataloader, such that its workers survive across runs
+        output = self._reproducible_dataloaders.get(dataloader, None)
+        if output is None:
+            # the iterator of a persistent dataloader draws the base seed of workers once, when it is created. A
+            # dedicated generator keeps this draw out of the global random state, which is set up for every epoch,
+            # such that a resumed epoch shuffles data as in a continuous run
+            output = _copy_dataloader(
+                dataloader,
+                dataset=_WorkerSeededDataset(dataloader.dataset),
+                batch_sampler=ReproducibleBatchSampler(dataloader.batch_sampler),
+                generator=torch.Generator(),
+            )
+            self._reproducible_dataloaders[dataloader] = output
+        return output
+
     def _from_iteration(self, iteration: int) -> Iterator:
         data = self.state.dataloader
+        # saved position of the dataflow is used once, when the run is resumed
+        dataflow_state = getattr(self.state, "dataflow_state", None)
+        self.state.dataflow_state = None
         if isinstance(data, torch.utils.data.DataLoader):
             try:
                 # following is unsafe for IterableDatasets
@@ -249,9 +477,19 @@ class DeterministicEngine(Engine):
                 # Probably we can do nothing with DataLoader built upon IterableDatasets
                 pass
 
+        if dataflow_state is not None:
+            data_iter = self._seek(data, dataflow_state)
+            if data_iter is not None:
+                self._setup_seed()
+                return data_iter
+            warnings.warn(
+                "Provided data does not implement the resumable dataflow protocol, saved dataflow state is ignored"
+            )
+
         self.logger.info("Resuming from iteration for provided data will fetch data until required iteration ...")
-        if hasattr(data, "__len__"):
-            iteration %= len(data)
+        # length is computed by _setup_engine, a DataLoader built upon an IterableDataset may have no length
+        if self._dataloader_len is not None:
+            iteration %= self._dataloader_len
         # Synchronize dataflow from the begining
         self._setup_seed(iteration=0)
         data_iter = iter(data)
@@ -265,6 +503,19 @@ class DeterministicEngine(Engine):
 
         return data_iter
 
+    def _seek(self, data: Iterable, dataflow_state: Any) -> Optional[Iterator]:
+        resumable = _get_resumable_data(data)
+        if resumable is not None:
+            resumable.load_state_dict(dataflow_state)
+            data_iter = iter(data)
+        else:
+            data_iter = iter(data)
+            if not _is_resumable(data_iter):
+                return None
+            data_iter.load_state_dict(dataflow_state)
+        self.logger.info("Resuming from iteration for provided data by loading the state of the dataflow")
+        return data_iter
+
     def _setup_seed(self, _=None, iter_counter=None, iteration=None):
         if iter_counter is None:
             le = self._dataloader_len if self._dataloader_len is not None else 1
@@ -273,3 +524,9 @@ class DeterministicEngine(Engine):
         if iteration is None:
             iteration = self.state.iteration
         manual_seed(self.state.seed + iteration // le)
+
+        dataset = getattr(self.state.dataloader, "dataset", None)
+        if isinstance(dataset, _WorkerSeededDataset):
+            # persistent workers are not seeded by a new iterator over the dataloader
+            generator = getattr(self.state.dataloader, "generator", None)
+            dataset.set_seed(torch.randint(0, int(1e9), (1,), generator=generator).item())
@@ -5,12 +5,14 @@ import warnings
 import weakref
 from collections import OrderedDict, defaultdict
 from collections.abc import Mapping
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import torch
 
 from ignite._utils import _to_hours_mins_secs
 from ignite.base import Serializable
 from ignite.engine.events import CallableEventWithFilter, Events, EventsList, RemovableEventHandle, State
-from ignite.engine.utils import _check_signature
+from ignite.engine.utils import _check_signature, _copy_dataloader, _PrefetchIterator
 
 __all__ = ["Engine"]
 
@@ -21,6 +23,12 @@ class Engine(Serializable):
     Args:
         process_function (callable): A function receiving a handle to the engine and the current batch
             in each iteration, and returns data to be stored in the engine's state.
+        compile_event_handlers (bool, optional): if True, handlers of each event are precompiled into a flat table of
+            call stubs which is rebuilt only when handlers are added or removed. Filters of filtered events are
+            evaluated once per event and filter, instead of once per handler. This reduces the dispatch overhead of
+            events fired at every iteration. Handlers added while an event is being fired are called starting from
+            the next firing of the event, except for :attr:`~ignite.engine.Events.STARTED` which is not compiled, such
+            that its handlers can set up the others for the run, e.g. profilers (default: False).
 
     Attributes:
         state (State): object that is used to pass internal and user-defined state between event handlers.
@@ -118,7 +126,7 @@ class Engine(Serializable):
     _state_dict_all_req_keys = ("epoch_length", "max_epochs")
     _state_dict_one_of_opt_keys = ("iteration", "epoch")
 
-    def __init__(self, process_function: Callable):
+    def __init__(self, process_function: Callable, compile_event_handlers: bool = False):
         self._event_handlers = defaultdict(list)
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
         self._process_function = process_function
@@ -128,9 +136,19 @@ class Engine(Serializable):
         self.state = None
         self._state_dict_user_keys = []
         self._allowed_events = []
+        self._allowed_events_set = set()
+        self._compile_event_handlers = compile_event_handlers
+        self._compiled_event_handlers = {}
 
         self._dataloader_iter = None
         self._init_iter = []
+        self._prefetch = 0
+        self._prefetch_device = None
+        # copies of input dataloaders with persistent workers
+        self._persistent_dataloaders = weakref.WeakKeyDictionary()
+        # state shared by metrics attached to the engine, see :class:`~ignite.metrics.MetricGroup`
+        self._metric_input_cache = None
+        self._running_metrics = []
 
         self.register_events(*Events)
 
@@ -193,8 +211,10 @@ class Engine(Serializable):
 
         for e in event_names:
             self._allowed_events.append(e)
+            self._allowed_events_set.add(e)
             if event_to_attr and e in event_to_attr:
                 State.event_to_attr[e] = event_to_attr[e]
+        self._compiled_event_handlers.clear()
 
     def _handler_wrapper(self, handler: Callable, event_name: Any, event_filter: Callable) -> Callable:
         # signature of the following wrapper will be inspected during registering to check if engine is necessary
@@ -207,6 +227,8 @@ class Engine(Serializable):
 
         # setup input handler as parent to make has_event_handler work
         wrapper._parent = weakref.ref(handler)
+        # keep the filter to let compiled dispatch evaluate it once for all handlers sharing it
+        wrapper._event_filter = event_filter
         return wrapper
 
     def add_event_handler(self, event_name: Any, handler: Callable, *args, **kwargs):
@@ -264,7 +286,7 @@ class Engine(Serializable):
             event_filter = event_name.filter
             handler = self._handler_wrapper(handler, event_name, event_filter)
 
-        if event_name not in self._allowed_events:
+        if event_name not in self._allowed_events_set:
             self.logger.error("attempt to add event handler to an invalid event %s.", event_name)
             raise ValueError("Event {} is not a valid event for this Engine.".format(event_name))
 
@@ -275,6 +297,7 @@ class Engine(Serializable):
         except ValueError:
             _check_signature(handler, "handler", *(event_args + args), **kwargs)
             self._event_handlers[event_name].append((handler, args, kwargs))
+        self._compiled_event_handlers.pop(event_name, None)
         self.logger.debug("added handler for event %s.", event_name)
 
         return RemovableEventHandle(event_name, handler, self)
@@ -312,10 +335,27 @@ class Engine(Serializable):
         return False
 
     @staticmethod
-    def _compare_handlers(user_handler: Callable, registered_handler: Callable) -> bool:
+    def _unwrap_handler(registered_handler: Callable) -> Callable:
+        # handlers registered on filtered events or timed by profilers are wrappers pointing to the input handler
         if hasattr(registered_handler, "_parent"):
             registered_handler = registered_handler._parent()
-        return registered_handler == user_handler
+        return registered_handler
+
+    @staticmethod
+    def _compare_handlers(user_handler: Callable, registered_handler: Callable) -> bool:
+        return Engine._unwrap_handler(registered_handler) == user_handler
+
+    def _get_event_handlers(self, event_name: Any) -> List[Callable]:
+        """Returns the handlers registered on `event_name` in calling order, as they were input to the engine."""
+        return [self._unwrap_handler(h) for h, _, _ in self._event_handlers.get(event_name, ())]
+
+    def _add_first_event_handler(self, event_name: Any, handler: Callable, *args, **kwargs) -> None:
+        """Adds `handler` before all handlers registered on `event_name`. The handler is called with the engine as
+        first argument followed by `args` and `kwargs`. Used internally by handlers which should run before user
+        handlers, e.g. a reduction of metrics before they are computed.
+        """
+        self._event_handlers[event_name].insert(0, (handler, (self,) + args, kwargs))
+        self._compiled_event_handlers.pop(event_name, None)
 
     def remove_event_handler(self, handler: Callable, event_name: Any):
         """Remove event handler `handler` from registered handlers of the engine
@@ -337,6 +377,7 @@ class Engine(Serializable):
         if len(new_event_handlers) == len(self._event_handlers[event_name]):
             raise ValueError("Input handler '{}' is not found among registered event handlers".format(handler))
         self._event_handlers[event_name] = new_event_handlers
+        self._compiled_event_handlers.pop(event_name, None)
 
     def on(self, event_name, *args, **kwargs):
         """Decorator shortcut for add_event_handler.
@@ -385,7 +426,12 @@ class Engine(Serializable):
             **event_kwargs: optional keyword args to be passed to all handlers.
 
         """
-        if event_name in self._allowed_events:
+        # STARTED is fired once per run and its first handlers may modify the next ones, e.g. profilers timing them
+        if self._compile_event_handlers and event_name is not Events.STARTED:
+            self._fire_compiled_event(event_name, event_args, event_kwargs)
+            return
+
+        if event_name in self._allowed_events_set:
             self.logger.debug("firing handlers for event %s ", event_name)
             self.last_event_name = event_name
             for func, args, kwargs in self._event_handlers[event_name]:
@@ -393,6 +439,60 @@ class Engine(Serializable):
                 first, others = ((args[0],), args[1:]) if (args and args[0] == self) else ((), args)
                 func(*first, *(event_args + others), **kwargs)
 
+    def _compile_event(self, event_name: Any) -> Tuple[Tuple[Callable, ...], Tuple[tuple, ...]]:
+        """Builds the dispatch table of `event_name`: a tuple of distinct event filters and a tuple of call stubs
+        `(filter_index, stub, handler, first, others, kwargs)`. `stub` is a ready to call handler bound to its
+        registration arguments and `filter_index` is -1 for unfiltered handlers.
+        """
+        filters = []
+        stubs = []
+        for func, args, kwargs in self._event_handlers.get(event_name, ()):
+            filter_index = -1
+            # look into instance attributes only to skip handlers like mocks creating attributes on access
+            event_filter = getattr(func, "__dict__", {}).get("_event_filter", None)
+            if event_filter is not None:
+                # handlers registered with the same filtered event share the filter
+                for i, f in enumerate(filters):
+                    if f is event_filter:
+                        filter_index = i
+                        break
+                else:
+                    filters.append(event_filter)
+                    filter_index = len(filters) - 1
+                func = func.__wrapped__
+            first, others = ((args[0],), args[1:]) if (args and args[0] is self) else ((), args)
+            stub = functools.partial(func, *(first + others), **kwargs)
+            stubs.append((filter_index, stub, func, first, others, kwargs))
+
+        table = (tuple(filters), tuple(stubs))
+        self._compiled_event_handlers[event_name] = table
+        return table
+
+    def _fire_compiled_event(self, event_name: Any, event_args: tuple, event_kwargs: dict) -> None:
+        if event_name not in self._allowed_events_set:
+            return
+
+        self.logger.debug("firing handlers for event %s ", event_name)
+        self.last_event_name = event_name
+        table = self._compiled_event_handlers.get(event_name)
+        if table is None:
+            table = self._compile_event(event_name)
+        filters, stubs = table
+
+        passed = ()
+        if filters:
+            value = self.state.get_event_attrib_value(event_name)
+            passed = tuple(f(self, value) for f in filters)
+
+        if event_args or event_kwargs:
+            for filter_index, _, func, first, others, kwargs in stubs:
+                if filter_index < 0 or passed[filter_index]:
+                    func(*first, *event_args, *others, **{**kwargs, **event_kwargs})
+        else:
+            for filter_index, stub, _, _, _, _ in stubs:
+                if filter_index < 0 or passed[filter_index]:
+                    stub()
+
     def fire_event(self, event_name: Any) -> None:
         """Execute all the handlers associated with given event.
 
@@ -555,7 +655,14 @@ class Engine(Serializable):
 
         """
         self.state.dataloader = data
-        self._dataloader_iter = iter(self.state.dataloader)
+        self._set_dataloader_iter(iter(self.state.dataloader))
+
+    def _set_dataloader_iter(self, data_iter: Optional[Iterator]) -> None:
+        if isinstance(self._dataloader_iter, _PrefetchIterator):
+            self._dataloader_iter.close()
+        if data_iter is not None and self._prefetch > 0:
+            data_iter = _PrefetchIterator(data_iter, self._prefetch, device=self._prefetch_device)
+        self._dataloader_iter = data_iter
 
     def run(
         self,
@@ -563,6 +670,9 @@ class Engine(Serializable):
         max_epochs: Optional[int] = None,
         epoch_length: Optional[int] = None,
         seed: Optional[int] = None,
+        prefetch: int = 0,
+        prefetch_device: Optional[Union[str, torch.device]] = None,
+        persistent_workers: bool = False,
     ) -> State:
         """Runs the `process_function` over the passed data.
 
@@ -587,6 +697,18 @@ class Engine(Serializable):
                 This argument should not change if run is resuming from a state.
             seed (int, optional): Deprecated argument. Please, use `torch.manual_seed` or
                 :meth:`~ignite.utils.manual_seed`.
+            prefetch (int, optional): number of batches to fetch ahead of the current iteration on a background
+                thread, such that data loading and collation overlap with `process_function`. Events
+                `GET_BATCH_STARTED` and `GET_BATCH_COMPLETED` are still fired around getting the next batch.
+                If 0, batches are fetched synchronously (default: 0).
+            prefetch_device (str or torch.device, optional): if `prefetch` is positive, prefetched batches are also
+                moved to this device with :meth:`~ignite.utils.convert_tensor`. On CUDA devices, copies are done on a
+                dedicated stream. Batches should be tensors or sequences or mappings of tensors.
+            persistent_workers (bool, optional): if True and `data` is a `torch.utils.data.DataLoader` with workers,
+                the engine iterates over a copy of `data` with `persistent_workers=True`. The copy is created once per
+                `data`, such that worker processes are kept alive across epochs and across calls of `run` with the
+                same `data` (e.g. an evaluator run at every epoch of a trainer), instead of being respawned at every
+                iteration over `data`. Requires `torch>=1.7` (default: False).
 
         Returns:
             State: output state.
@@ -603,6 +725,31 @@ class Engine(Serializable):
                 def switch_batch(engine):
                     engine.state.batch = preprocess_batch(engine.state.batch)
 
+        Note:
+            With `prefetch`, the input data is iterated on a background thread. If data iteration consumes random
+            numbers in the main process (e.g. a `DataLoader` without workers), the order of random numbers
+            generation between data and `process_function` is not reproducible.
+
+            .. code-block:: python
+
+                trainer = create_supervised_trainer(model, optimizer, loss_fn, device="cuda")
+                # collate and copy next 2 batches to GPU while the model is trained on the current batch
+                trainer.run(data_loader, max_epochs=10, prefetch=2, prefetch_device="cuda")
+
+        Note:
+            With `persistent_workers`, worker processes are seeded once, when they are started. Please, use
+            :class:`~ignite.engine.deterministic.DeterministicEngine` if the random state of workers should be
+            reproducible at every epoch.
+
+            .. code-block:: python
+
+                evaluator = create_supervised_evaluator(model, metrics=metrics)
+
+                @trainer.on(Events.EPOCH_COMPLETED)
+                def validate():
+                    # workers of val_loader are started at the first validation only
+                    evaluator.run(val_loader, persistent_workers=True)
+
         """
         if seed is not None:
             warnings.warn(
@@ -610,6 +757,9 @@ class Engine(Serializable):
                 "Please, use torch.manual_seed or ignite.utils.manual_seed"
             )
 
+        if prefetch < 0:
+            raise ValueError("Argument prefetch should be non-negative, but given {}".format(prefetch))
+
         if self.state is not None:
             # Check and apply overridden parameters
             if max_epochs is not None:
@@ -646,9 +796,28 @@ class Engine(Serializable):
                 )
             )
 
+        self._prefetch = prefetch
+        self._prefetch_device = prefetch_device
+        if persistent_workers:
+            data = self._get_persistent_dataloader(data)
         self.state.dataloader = data
         return self._internal_run()
 
+    def _get_persistent_dataloader(self, data: Iterable) -> Iterable:
+        if not isinstance(data, torch.utils.data.DataLoader) or data.num_workers < 1:
+            return data
+        if not hasattr(data, "persistent_workers"):
+            raise RuntimeError(
+                "Argument persistent_workers requires torch>=1.7, but given {}".format(torch.__version__)
+            )
+        if data.persistent_workers:
+            return data
+        dataloader = self._persistent_dataloaders.get(data, None)
+        if dataloader is None:
+            dataloader = _copy_dataloader(data, persistent_workers=True)
+            self._persistent_dataloaders[data] = dataloader
+        return dataloader
+
     @staticmethod
     def _init_timers(state: State):
         state.times[Events.EPOCH_COMPLETED.name] = 0.0
@@ -656,7 +825,7 @@ class Engine(Serializable):
 
     def _setup_engine(self) -> None:
         iteration = self.state.iteration
-        self._dataloader_iter = iter(self.state.dataloader)
+        self._set_dataloader_iter(iter(self.state.dataloader))
 
         # Below we define initial counter value for _run_once_on_dataset to measure a single epoch
         if self.state.epoch_length is not None:
@@ -692,11 +861,11 @@ class Engine(Serializable):
             self.logger.info("Engine run complete. Time taken %02d:%02d:%02d" % (hours, mins, secs))
 
         except BaseException as e:
-            self._dataloader_iter = None
+            self._set_dataloader_iter(None)
             self.logger.error("Engine run is terminating due to exception: %s.", str(e))
             self._handle_exception(e)
 
-        self._dataloader_iter = None
+        self._set_dataloader_iter(None)
         return self.state
 
     def _run_once_on_dataset(self) -> float:
@@ -1,5 +1,12 @@
 import inspect
-from typing import Callable
+import queue
+import threading
+import warnings
+from typing import Any, Callable, Iterator, Optional, Union
+
+import torch
+
+from ignite.utils import apply_to_tensor, convert_tensor
 
 
 def _check_signature(fn: Callable, fn_description: str, *args, **kwargs) -> None:
@@ -15,3 +22,116 @@ def _check_signature(fn: Callable, fn_description: str, *args, **kwargs) -> None
             "takes parameters {} but will be called with {}"
             "({}).".format(fn, fn_description, fn_params, passed_params, exception_msg)
         )
+
+
+def _copy_dataloader(dataloader: torch.utils.data.DataLoader, **kwargs: Any) -> torch.utils.data.DataLoader:
+    # new dataloader with the same arguments as `dataloader`, except the ones given in kwargs
+    params_keys = [k for k in dataloader.__dict__.keys() if not k.startswith("_")]
+    for k in ["batch_size", "sampler", "drop_last", "batch_sampler", "dataset_kind"]:
+        if k in params_keys:
+            params_keys.remove(k)
+    params = {k: getattr(dataloader, k) for k in params_keys}
+    if "batch_sampler" not in kwargs:
+        if dataloader._dataset_kind == torch.utils.data.dataloader._DatasetKind.Iterable:
+            params.update(batch_size=dataloader.batch_size, drop_last=dataloader.drop_last)
+        elif dataloader.batch_sampler is None:
+            # automatic batching is disabled
+            params.update(batch_size=None, sampler=dataloader.sampler)
+        else:
+            params["batch_sampler"] = dataloader.batch_sampler
+    params.update(kwargs)
+    return type(dataloader)(**params)
+
+
+class _PrefetchIterator:
+    """Iterator pulling the next `num_batches` batches of `iterator` on a background thread and optionally moving
+    them to `device`. On CUDA devices, host to device copies are done on a dedicated stream.
+
+    Exceptions raised by `iterator` are re-raised in the consuming thread.
+    """
+
+    def __init__(self, iterator: Iterator, num_batches: int, device: Optional[Union[str, torch.device]] = None):
+        if num_batches < 1:
+            raise ValueError("Argument num_batches should be positive, but given {}".format(num_batches))
+
+        self._iterator = iterator
+        self._device = torch.device(device) if device is not None else None
+        self._stream = None
+        if self._device is not None and self._device.type == "cuda":
+            self._stream = torch.cuda.Stream(device=self._device)
+
+        self._queue = queue.Queue(maxsize=num_batches)
+        self._stop_event = threading.Event()
+        self._exhausted = False
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _transfer(self, batch: Any) -> Any:
+        if self._stream is None:
+            return convert_tensor(batch, device=self._device)
+        with torch.cuda.stream(self._stream):
+            batch = convert_tensor(batch, device=self._device, non_blocking=True)
+        self._stream.synchronize()
+        return batch
+
+    def _worker(self) -> None:
+        try:
+            for batch in self._iterator:
+                if self._stop_event.is_set():
+                    return
+                if self._device is not None:
+                    batch = self._transfer(batch)
+                if not self._put((True, batch)):
+                    return
+        except BaseException as e:
+            self._put((False, e))
+            return
+        self._put((False, StopIteration()))
+
+    @staticmethod
+    def _record_stream(tensor: torch.Tensor) -> torch.Tensor:
+        # memory allocated on the prefetch stream should not be reused while consumed on the current stream
+        if tensor.is_cuda:
+            tensor.record_stream(torch.cuda.current_stream(tensor.device))
+        return tensor
+
+    def __iter__(self) -> "_PrefetchIterator":
+        return self
+
+    def __next__(self) -> Any:
+        if self._exhausted:
+            raise StopIteration()
+        is_batch, item = self._queue.get()
+        if not is_batch:
+            self._exhausted = True
+            raise item
+        if self._stream is not None:
+            apply_to_tensor(item, self._record_stream)
+        return item
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stops the background thread and drops prefetched batches. The thread can only stop once the underlying
+        iterator returns a batch: if it is still running after `timeout` seconds, a warning is issued and the thread,
+        a daemon thread, is left to finish on its own.
+        """
+        self._stop_event.set()
+        self._exhausted = True
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join(timeout=timeout)
+        if self._thread.is_alive():
+            warnings.warn(
+                "Prefetching thread did not stop within {} seconds, data iterator may be blocked".format(timeout)
+            )
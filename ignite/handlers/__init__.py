@@ -2,7 +2,15 @@ from typing import Any, Callable, Union
 
 from ignite.engine import Engine
 from ignite.engine.events import CallableEventWithFilter, EventEnum
-from ignite.handlers.checkpoint import Checkpoint, DiskSaver, ModelCheckpoint
+from ignite.handlers.checkpoint import (
+    AsyncSaver,
+    Checkpoint,
+    DiskSaver,
+    IncrementalDiskSaver,
+    ModelCheckpoint,
+    ShardedDiskSaver,
+    TieredSaver,
+)
 from ignite.handlers.early_stopping import EarlyStopping
 from ignite.handlers.terminate_on_nan import TerminateOnNan
 from ignite.handlers.timing import Timer
@@ -11,6 +19,10 @@ __all__ = [
     "ModelCheckpoint",
     "Checkpoint",
     "DiskSaver",
+    "IncrementalDiskSaver",
+    "ShardedDiskSaver",
+    "AsyncSaver",
+    "TieredSaver",
     "Timer",
     "EarlyStopping",
     "TerminateOnNan",
@@ -1,17 +1,211 @@
 import collections.abc as collections
+import copy
+import hashlib
+import io
+import json
+import logging
 import numbers
 import os
+import struct
 import tempfile
+import threading
+import time
 import warnings
+import zipfile
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-from typing import Callable, Mapping, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping, Optional, Union
 
 import torch
+import torch.distributed as dist
 
 from ignite.engine import Engine, Events
 
-__all__ = ["Checkpoint", "DiskSaver", "ModelCheckpoint", "BaseSaveHandler"]
+__all__ = [
+    "Checkpoint",
+    "DiskSaver",
+    "IncrementalDiskSaver",
+    "ShardedDiskSaver",
+    "ModelCheckpoint",
+    "BaseSaveHandler",
+    "AsyncSaver",
+    "TieredSaver",
+]
+
+
+def _apply_to_type(obj: Any, input_type: Union[type, tuple], func: Callable) -> Any:
+    # copy of a nested checkpoint structure where objects of input_type are replaced by func(obj)
+    if isinstance(obj, input_type):
+        return func(obj)
+    elif isinstance(obj, (str, bytes, numbers.Number)) or obj is None:
+        return obj
+    elif isinstance(obj, collections.MutableMapping):
+        # shallow copy keeps the type and attributes like `_metadata` of modules' state dicts
+        output = copy.copy(obj)
+        for k, v in obj.items():
+            output[k] = _apply_to_type(v, input_type, func)
+        return output
+    elif isinstance(obj, list):
+        return [_apply_to_type(v, input_type, func) for v in obj]
+    elif isinstance(obj, tuple):
+        values = [_apply_to_type(v, input_type, func) for v in obj]
+        return type(obj)(*values) if hasattr(obj, "_fields") else type(obj)(values)
+    return copy.deepcopy(obj)
+
+
+_MmapRef = namedtuple("_MmapRef", ["offset", "dtype", "shape"])
+_MMAP_MAGIC = b"IGNMMAP1"
+_MMAP_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _MMAP_ALIGNMENT - 1) // _MMAP_ALIGNMENT * _MMAP_ALIGNMENT
+
+
+def _as_numpy(tensor: torch.Tensor) -> Any:
+    if tensor.dtype == torch.bfloat16:
+        # numpy has no bfloat16, data is reinterpreted as int16
+        tensor = tensor.view(torch.int16)
+    return tensor.numpy()
+
+
+def _save_mmap(checkpoint: Any, f: Any) -> None:
+    # Layout: magic, header length, header saved by torch.save where tensors are replaced by references, then
+    # data of tensors aligned on _MMAP_ALIGNMENT bytes, such that tensors can be memory-mapped
+    if isinstance(f, str):
+        with open(f, "wb") as fp:
+            return _save_mmap(checkpoint, fp)
+
+    tensors = []
+    refs = {}
+    offset = [0]
+
+    def _to_ref(t: torch.Tensor) -> _MmapRef:
+        # tensors sharing the same data (e.g. tied weights) are written once
+        if id(t) not in refs:
+            refs[id(t)] = _MmapRef(offset[0], str(t.dtype).replace("torch.", ""), tuple(t.shape))
+            tensors.append((t, refs[id(t)]))
+            offset[0] = _align(offset[0] + t.numel() * t.element_size())
+        return refs[id(t)]
+
+    header = io.BytesIO()
+    torch.save(_apply_to_type(checkpoint, torch.Tensor, _to_ref), header)
+    header = header.getvalue()
+    f.write(_MMAP_MAGIC + struct.pack("<Q", len(header)) + header)
+    position = len(_MMAP_MAGIC) + 8 + len(header)
+    data_offset = _align(position)
+    for t, ref in tensors:
+        start = data_offset + ref.offset
+        f.write(b"\x00" * (start - position))
+        f.write(_as_numpy(t.detach().to("cpu").contiguous()))
+        position = start + t.numel() * t.element_size()
+
+
+def _load_mmap(path: str) -> Any:
+    # Returns the checkpoint saved by _save_mmap with tensors memory-mapped from the file, or None if the file has
+    # another format. Data of a tensor is read from the file only when the tensor is used.
+    with open(path, "rb") as f:
+        if f.read(len(_MMAP_MAGIC)) != _MMAP_MAGIC:
+            return None
+        (header_length,) = struct.unpack("<Q", f.read(8))
+        header = f.read(header_length)
+
+    # numpy is only required by files saved with mmap=True
+    import numpy as np
+
+    manifest = torch.load(io.BytesIO(header))
+    data_offset = _align(len(_MMAP_MAGIC) + 8 + header_length)
+    buffer = None
+
+    def _from_ref(ref: _MmapRef) -> torch.Tensor:
+        nonlocal buffer
+        dtype = getattr(torch, ref.dtype)
+        empty = torch.empty(0, dtype=dtype)
+        numel = 1
+        for d in ref.shape:
+            numel *= d
+        if numel == 0:
+            return empty.reshape(ref.shape)
+        if buffer is None:
+            # copy-on-write mapping, loaded tensors are writable without modifying the file
+            buffer = np.memmap(path, dtype=np.uint8, mode="c")
+        start = data_offset + ref.offset
+        array = buffer[start : start + numel * empty.element_size()].view(_as_numpy(empty).dtype)
+        tensor = torch.from_numpy(array)
+        if dtype == torch.bfloat16:
+            tensor = tensor.view(torch.bfloat16)
+        return tensor.reshape(ref.shape)
+
+    return _apply_to_type(manifest, _MmapRef, _from_ref)
+
+
+def _is_complete_checkpoint(path: str) -> bool:
+    # Checks that a checkpoint file is not truncated without reading the data of its tensors: the header of a file
+    # saved by _save_mmap gives the end of the data, a zip archive saved by torch.save ends by its central directory.
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        magic = f.read(len(_MMAP_MAGIC))
+        if magic == _MMAP_MAGIC:
+            header_length = f.read(8)
+            if len(header_length) < 8:
+                return False
+            (header_length,) = struct.unpack("<Q", header_length)
+            header = f.read(header_length)
+            if len(header) < header_length:
+                return False
+            data_offset = _align(len(_MMAP_MAGIC) + 8 + header_length)
+            end = [len(_MMAP_MAGIC) + 8 + header_length]
+
+            def _update_end(ref: _MmapRef) -> _MmapRef:
+                nbytes = torch.empty(0, dtype=getattr(torch, ref.dtype)).element_size()
+                for d in ref.shape:
+                    nbytes *= d
+                if nbytes > 0:
+                    end[0] = max(end[0], data_offset + ref.offset + nbytes)
+                return ref
+
+            try:
+                _apply_to_type(torch.load(io.BytesIO(header)), _MmapRef, _update_end)
+            except Exception:
+                return False
+            return size >= end[0]
+    if zipfile.is_zipfile(path):
+        return True
+    # legacy format of torch.save starts with a pickled magic number and can not be checked without loading it
+    return magic.startswith(b"\x80")
+
+
+def _fsync_dir(dirname: str) -> None:
+    # makes a rename in the directory durable, directories can not be opened on every platform (e.g. Windows)
+    try:
+        fd = os.open(dirname, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _filter_state_dict(state_dict: Mapping, prefix: str) -> Mapping:
+    # entries of state_dict with keys starting by prefix, which is removed from the keys
+    output = type(state_dict)() if isinstance(state_dict, collections.MutableMapping) else {}
+    for k, v in state_dict.items():
+        if k.startswith(prefix):
+            output[k[len(prefix) :]] = v
+    metadata = getattr(state_dict, "_metadata", None)
+    if metadata is not None:
+        module_prefix = prefix[:-1] if prefix.endswith(".") else prefix
+        output._metadata = type(metadata)()
+        for k, v in metadata.items():
+            if k == module_prefix:
+                output._metadata[""] = v
+            elif k.startswith(prefix):
+                output._metadata[k[len(prefix) :]] = v
+    return output
 
 
 class BaseSaveHandler(metaclass=ABCMeta):
@@ -260,7 +454,7 @@ class Checkpoint:
                 raise TypeError("Object {} should have `{}` method".format(type(obj), attr))
 
     @staticmethod
-    def load_objects(to_load: Mapping, checkpoint: Mapping, **kwargs) -> None:
+    def load_objects(to_load: Mapping, checkpoint: Union[str, Mapping], **kwargs) -> None:
         """Helper method to apply `load_state_dict` on the objects from `to_load` using states from `checkpoint`.
 
         Exemples:
@@ -283,37 +477,62 @@ class Checkpoint:
             checkpoint = torch.load(checkpoint_fp)
             Checkpoint.load_objects(to_load=to_load, checkpoint=checkpoint)
 
+            # load the weights of the backbone of a saved model
+            Checkpoint.load_objects(to_load={"weights": model.backbone}, checkpoint=checkpoint, prefix="backbone.")
+
         Args:
             to_load (Mapping): a dictionary with objects, e.g. `{"model": model, "optimizer": optimizer, ...}`
-            checkpoint (Mapping): a dictionary with state_dicts to load, e.g. `{"model": model_state_dict,
-                "optimizer": opt_state_dict}`. If `to_load` contains a single key, then checkpoint can contain directly
-                corresponding state_dict.
+            checkpoint (Mapping or str): a dictionary with state_dicts to load, e.g. `{"model": model_state_dict,
+                "optimizer": opt_state_dict}`, or the path to a checkpoint file. If `to_load` contains a single key,
+                then checkpoint can contain directly corresponding state_dict. If the file was saved by
+                :class:`~ignite.handlers.DiskSaver` with `mmap=True`, tensors are memory-mapped and read from the file
+                only when they are copied into the parameters and buffers of modules, one at a time.
             **kwargs: Keyword arguments accepted for `nn.Module.load_state_dict()`. Passing `strict=False` enables
-                the user to load part of the pretrained model (useful for example, in Transfer Learning)
+                the user to load part of the pretrained model (useful for example, in Transfer Learning). Passing
+                `prefix` loads into modules only the entries whose keys start with `prefix`, without it.
         """
         Checkpoint._check_objects(to_load, "load_state_dict")
+        is_mmap = False
+        if isinstance(checkpoint, str):
+            path = checkpoint
+            checkpoint = _load_mmap(path)
+            is_mmap = checkpoint is not None
+            if not is_mmap:
+                checkpoint = torch.load(path)
         if not isinstance(checkpoint, collections.Mapping):
-            raise TypeError("Argument checkpoint should be a dictionary, but given {}".format(type(checkpoint)))
+            raise TypeError(
+                "Argument checkpoint should be a dictionary or a path, but given {}".format(type(checkpoint))
+            )
 
-        if len(kwargs) > 1 or any(k for k in kwargs.keys() if k not in ["strict"]):
-            warnings.warn("kwargs contains keys other than strict and these will be ignored")
+        if any(k for k in kwargs.keys() if k not in ["strict", "prefix"]):
+            warnings.warn("kwargs contains keys other than strict and prefix and these will be ignored")
 
         is_state_dict_strict = kwargs.get("strict", True)
+        prefix = kwargs.get("prefix", None)
+
+        def _load_object(obj: Any, state_dict: Mapping) -> None:
+            if isinstance(obj, torch.nn.Module):
+                if prefix is not None:
+                    state_dict = _filter_state_dict(state_dict, prefix)
+                obj.load_state_dict(state_dict, strict=is_state_dict_strict)
+            else:
+                if is_mmap:
+                    # other objects may keep loaded tensors, they should not be backed by the file
+                    state_dict = _apply_to_type(state_dict, torch.Tensor, lambda t: t.clone())
+                obj.load_state_dict(state_dict)
+
         if len(to_load) == 1:
             # single object and checkpoint is directly a state_dict
             key, obj = list(to_load.items())[0]
             if key not in checkpoint:
-                obj.load_state_dict(checkpoint, strict=is_state_dict_strict)
+                _load_object(obj, checkpoint)
                 return
 
         # multiple objects to load
         for k, obj in to_load.items():
             if k not in checkpoint:
                 raise ValueError("Object labeled by '{}' from `to_load` is not found in the checkpoint".format(k))
-            if isinstance(obj, torch.nn.Module):
-                obj.load_state_dict(checkpoint[k], strict=is_state_dict_strict)
-            else:
-                obj.load_state_dict(checkpoint[k])
+            _load_object(obj, checkpoint[k])
 
 
 class DiskSaver(BaseSaveHandler):
@@ -326,13 +545,37 @@ class DiskSaver(BaseSaveHandler):
             (for example if exception occures during saving).
         create_dir (bool, optional): if True, will create directory 'dirname' if it doesnt exist.
         require_empty (bool, optional): If True, will raise exception if there are any files in the directory 'dirname'.
+        mmap (bool, optional): if True, checkpoint is saved in a layout where tensors data can be memory-mapped when
+            the checkpoint file is loaded with :meth:`~ignite.handlers.Checkpoint.load_objects`. Such files can not be
+            loaded with `torch.load`. Requires numpy to be installed (default: False).
+
+    Examples:
+
+    .. code-block:: python
+
+        handler = Checkpoint(to_save, DiskSaver('/tmp/models', mmap=True))
+        trainer.add_event_handler(Events.EPOCH_COMPLETED, handler)
+
+        # tensors are read from the file one at a time, when they are copied into the objects to load
+        Checkpoint.load_objects(to_load=to_save, checkpoint=os.path.join('/tmp/models', handler.last_checkpoint))
     """
 
     def __init__(
-        self, dirname: str, atomic: bool = True, create_dir: bool = True, require_empty: bool = True,
+        self,
+        dirname: str,
+        atomic: bool = True,
+        create_dir: bool = True,
+        require_empty: bool = True,
+        mmap: bool = False,
     ):
         self.dirname = os.path.expanduser(dirname)
         self._atomic = atomic
+        self._mmap = mmap
+        if mmap:
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                raise RuntimeError("Argument mmap=True requires numpy to be installed.")
         if create_dir:
             if not os.path.exists(dirname):
                 os.makedirs(dirname)
@@ -351,14 +594,19 @@ class DiskSaver(BaseSaveHandler):
                 )
 
     def __call__(self, checkpoint: Mapping, filename: str) -> None:
-        path = os.path.join(self.dirname, filename)
+        save_fn = _save_mmap if self._mmap else torch.save
+        self._save(checkpoint, os.path.join(self.dirname, filename), save_fn=save_fn)
 
+    def _save(self, obj: Any, path: str, save_fn: Callable = torch.save) -> None:
         if not self._atomic:
-            torch.save(checkpoint, path)
+            save_fn(obj, path)
         else:
-            tmp = tempfile.NamedTemporaryFile(delete=False, dir=self.dirname)
+            tmp = tempfile.NamedTemporaryFile(delete=False, dir=os.path.dirname(path))
             try:
-                torch.save(checkpoint, tmp.file)
+                save_fn(obj, tmp.file)
+                # data is on disk before the file is renamed, such that a crash can not leave a partial checkpoint
+                tmp.file.flush()
+                os.fsync(tmp.file.fileno())
             except BaseException:
                 tmp.close()
                 os.remove(tmp.name)
@@ -366,12 +614,663 @@ class DiskSaver(BaseSaveHandler):
             else:
                 tmp.close()
                 os.rename(tmp.name, path)
+                _fsync_dir(os.path.dirname(path))
 
     def remove(self, filename: str) -> None:
         path = os.path.join(self.dirname, filename)
         os.remove(path)
 
 
+_BlobRef = namedtuple("_BlobRef", ["digest"])
+
+
+def _tensor_digest(tensor: torch.Tensor) -> str:
+    tensor = tensor.detach().to("cpu").contiguous()
+    h = hashlib.sha256("{}{}".format(tensor.dtype, tuple(tensor.shape)).encode())
+    if tensor.dtype == torch.bfloat16:
+        # numpy has no bfloat16, conversion to float32 is exact
+        tensor = tensor.float()
+    h.update(tensor.numpy())
+    return h.hexdigest()
+
+
+class IncrementalDiskSaver(DiskSaver):
+    """Handler that saves input checkpoint on a disk incrementally. Tensors of the checkpoint are stored once per
+    content in the directory `dirname/blobs`, named by the hash of their content, and the checkpoint file is a small
+    manifest referencing them.
+
+    At each save, only new or modified tensors are written, such that frozen weights, embeddings or buffers
+    unchanged between checkpoints are stored once. When a checkpoint is removed, e.g. when
+    :class:`~ignite.handlers.Checkpoint` prunes older checkpoints, blobs not referenced anymore by other checkpoints
+    are deleted. References of checkpoints to blobs are kept in `dirname/blobs/refs.json`, such that blobs of
+    checkpoints saved by previous runs are preserved.
+
+    Args:
+        dirname (str): Directory path where the checkpoint will be saved
+        atomic (bool, optional): if True, manifests and blobs are serialized to a temporary file, and then
+            moved to final destination, so that files are guaranteed to not be damaged
+            (for example if exception occures during saving).
+        create_dir (bool, optional): if True, will create directory 'dirname' if it doesnt exist.
+        require_empty (bool, optional): If True, will raise exception if there are any files in the directory 'dirname'.
+        min_blob_size (int, optional): tensors with a size in bytes lower than this value are stored in the manifest
+            (default: 1024).
+
+    Note:
+        Saved checkpoint files are manifests and should be loaded with :meth:`load`.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.handlers import Checkpoint, IncrementalDiskSaver
+
+        saver = IncrementalDiskSaver('/tmp/models', create_dir=True)
+        to_save = {'model': model, 'optimizer': optimizer, 'trainer': trainer}
+        handler = Checkpoint(to_save, saver, n_saved=None)
+        trainer.add_event_handler(Events.ITERATION_COMPLETED(every=100), handler)
+
+        checkpoint = saver.load(handler.last_checkpoint)
+        Checkpoint.load_objects(to_load=to_save, checkpoint=checkpoint)
+
+    """
+
+    def __init__(
+        self,
+        dirname: str,
+        atomic: bool = True,
+        create_dir: bool = True,
+        require_empty: bool = True,
+        min_blob_size: int = 1024,
+    ):
+        super(IncrementalDiskSaver, self).__init__(
+            dirname, atomic=atomic, create_dir=create_dir, require_empty=require_empty
+        )
+        if min_blob_size < 0:
+            raise ValueError("Argument min_blob_size should be non-negative, but given {}".format(min_blob_size))
+
+        self._min_blob_size = min_blob_size
+        self._blobs_dirname = os.path.join(self.dirname, "blobs")
+        if not os.path.exists(self._blobs_dirname):
+            os.makedirs(self._blobs_dirname)
+        # digests of blobs referenced by each checkpoint file
+        self._refs = {}
+        self._refs_path = os.path.join(self._blobs_dirname, "refs.json")
+        if os.path.exists(self._refs_path):
+            with open(self._refs_path, "r") as f:
+                self._refs = json.load(f)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self._blobs_dirname, digest + ".pt")
+
+    def _write_refs(self) -> None:
+        tmp = tempfile.NamedTemporaryFile("w", delete=False, dir=self._blobs_dirname)
+        with tmp:
+            json.dump(self._refs, tmp)
+        os.replace(tmp.name, self._refs_path)
+
+    def _collect(self, digests: list) -> None:
+        referenced = set()
+        for refs in self._refs.values():
+            referenced.update(refs)
+        for digest in digests:
+            path = self._blob_path(digest)
+            if digest not in referenced and os.path.exists(path):
+                os.remove(path)
+
+    def __call__(self, checkpoint: Mapping, filename: str) -> None:
+        digests = {}
+
+        def _to_blob(t: torch.Tensor) -> Any:
+            if t.is_sparse or t.numel() * t.element_size() < self._min_blob_size:
+                return t.detach().to("cpu", copy=True)
+            # tensors sharing the same data (e.g. tied weights) are hashed once
+            if id(t) not in digests:
+                digest = _tensor_digest(t)
+                path = self._blob_path(digest)
+                if not os.path.exists(path):
+                    self._save(t.detach().to("cpu", copy=True), path)
+                digests[id(t)] = digest
+            return _BlobRef(digests[id(t)])
+
+        manifest = _apply_to_type(checkpoint, torch.Tensor, _to_blob)
+        self._save(manifest, os.path.join(self.dirname, filename))
+
+        prev_refs = self._refs.get(filename, [])
+        self._refs[filename] = sorted(set(digests.values()))
+        self._write_refs()
+        self._collect(prev_refs)
+
+    def remove(self, filename: str) -> None:
+        super(IncrementalDiskSaver, self).remove(filename)
+        refs = self._refs.pop(filename, [])
+        self._write_refs()
+        self._collect(refs)
+
+    def load(self, filename: str, map_location: Optional[Any] = None) -> Any:
+        """Loads a checkpoint saved in the directory.
+
+        Args:
+            filename (str): filename of the checkpoint, e.g. :attr:`~ignite.handlers.Checkpoint.last_checkpoint`.
+            map_location (optional): argument passed to `torch.load` for the manifest and the blobs.
+
+        Returns:
+            checkpoint with the tensors loaded from the blobs.
+        """
+        manifest = torch.load(os.path.join(self.dirname, filename), map_location=map_location)
+        tensors = {}
+
+        def _from_blob(ref: _BlobRef) -> torch.Tensor:
+            if ref.digest in tensors:
+                # tensors with the same content do not share memory, as in the saved checkpoint
+                return tensors[ref.digest].clone()
+            tensors[ref.digest] = torch.load(self._blob_path(ref.digest), map_location=map_location)
+            return tensors[ref.digest]
+
+        return _apply_to_type(manifest, _BlobRef, _from_blob)
+
+
+_ShardRef = namedtuple("_ShardRef", ["chunks"])
+
+
+def _split_sizes(length: int, n: int) -> list:
+    q, r = divmod(length, n)
+    return [q + 1] * r + [q] * (n - r)
+
+
+class ShardedDiskSaver(DiskSaver):
+    """Handler that saves input checkpoint on a disk in parallel from all processes of a distributed configuration.
+
+    Tensors of the checkpoint are partitioned into disjoint shards, balanced by size, and each process writes its
+    shard. Tensors larger than the expected size of a shard (e.g. large weights, embeddings or their optimizer
+    states) are split into chunks along their first dimension and written by several processes. Once all shards are
+    written, the process of rank 0 writes the checkpoint file, a manifest referencing tensors in the shards. The
+    manifest is not written if any shard could not be saved.
+
+    The checkpoint is loaded with :meth:`load`, with any number of processes, including from a non-distributed
+    configuration.
+
+    Args:
+        dirname (str): Directory path where the checkpoint will be saved. It should be shared between the processes.
+        atomic (bool, optional): if True, shards and manifest are serialized to a temporary file, and then
+            moved to final destination, so that files are guaranteed to not be damaged
+            (for example if exception occures during saving).
+        create_dir (bool, optional): if True, will create directory 'dirname' if it doesnt exist.
+        require_empty (bool, optional): If True, will raise exception if there are any files in the directory 'dirname'.
+
+    Note:
+        :class:`~ignite.handlers.Checkpoint` with this handler should be called by all processes, as saving is a
+        collective operation, and checkpointed objects should have the same structure and tensor shapes on all
+        processes, e.g. a model wrapped by `DistributedDataParallel` and its optimizer. Non-tensor values of the
+        checkpoint are taken from the process of rank 0.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.handlers import Checkpoint, ShardedDiskSaver
+
+        # on all processes
+        saver = ShardedDiskSaver('/shared/models', require_empty=False)
+        to_save = {'model': model, 'optimizer': optimizer, 'trainer': trainer}
+        handler = Checkpoint(to_save, saver, n_saved=2)
+        trainer.add_event_handler(Events.ITERATION_COMPLETED(every=1000), handler)
+
+        checkpoint = saver.load(handler.last_checkpoint, map_location="cpu")
+        Checkpoint.load_objects(to_load=to_save, checkpoint=checkpoint)
+
+    """
+
+    @staticmethod
+    def _get_rank_world_size() -> tuple:
+        if dist.is_available() and dist.is_initialized():
+            return dist.get_rank(), dist.get_world_size()
+        return 0, 1
+
+    @staticmethod
+    def _shard_filename(filename: str, rank: int, world_size: int) -> str:
+        name, ext = os.path.splitext(filename)
+        return "{}_shard{}-of-{}{}".format(name, rank, world_size, ext)
+
+    def _split(self, checkpoint: Mapping, filename: str, rank: int, world_size: int) -> tuple:
+        # returns the manifest and the shard of rank, computed identically on all processes
+        tensors = {}
+
+        def _collect(t: torch.Tensor) -> torch.Tensor:
+            tensors.setdefault(id(t), t)
+            return t
+
+        _apply_to_type(checkpoint, torch.Tensor, _collect)
+        tensors = list(tensors.values())
+        sizes = [t.numel() * t.element_size() for t in tensors]
+        max_size = sum(sizes) / world_size
+
+        refs = {}
+        shard = {}
+        loads = [0] * world_size
+        shard_filenames = [self._shard_filename(filename, r, world_size) for r in range(world_size)]
+        # largest tensors first for a better balance of shards
+        for i in sorted(range(len(tensors)), key=lambda i: -sizes[i]):
+            t = tensors[i]
+            if world_size > 1 and t.dim() > 0 and t.shape[0] > 1 and sizes[i] > max_size:
+                chunks = torch.split(t, _split_sizes(t.shape[0], min(world_size, t.shape[0])))
+                owners = range(len(chunks))
+            else:
+                chunks = [t]
+                owners = [loads.index(min(loads))]
+            keys = []
+            for j, (owner, chunk) in enumerate(zip(owners, chunks)):
+                key = "{}.{}".format(i, j)
+                loads[owner] += chunk.numel() * chunk.element_size()
+                if owner == rank:
+                    shard[key] = chunk.detach().to("cpu", copy=True)
+                keys.append((shard_filenames[owner], key))
+            refs[id(t)] = _ShardRef(tuple(keys))
+
+        manifest = _apply_to_type(checkpoint, torch.Tensor, lambda t: refs[id(t)])
+        return manifest, shard
+
+    def __call__(self, checkpoint: Mapping, filename: str) -> None:
+        rank, world_size = self._get_rank_world_size()
+        manifest, shard = self._split(checkpoint, filename, rank, world_size)
+
+        error = None
+        try:
+            self._save(shard, os.path.join(self.dirname, self._shard_filename(filename, rank, world_size)))
+        except Exception as e:
+            error = e
+
+        num_errors = int(error is not None)
+        if world_size > 1:
+            device = "cuda" if dist.get_backend() == "nccl" else "cpu"
+            num_errors = torch.tensor([num_errors], device=device)
+            dist.all_reduce(num_errors)
+            num_errors = int(num_errors.item())
+        if error is not None:
+            raise error
+        if num_errors > 0:
+            raise RuntimeError(
+                "Checkpoint {} is not saved, a shard could not be saved by another process".format(filename)
+            )
+
+        if rank == 0:
+            self._save(manifest, os.path.join(self.dirname, filename))
+
+    def remove(self, filename: str) -> None:
+        rank, world_size = self._get_rank_world_size()
+        if rank == 0:
+            super(ShardedDiskSaver, self).remove(filename)
+        os.remove(os.path.join(self.dirname, self._shard_filename(filename, rank, world_size)))
+
+    def load(self, filename: str, map_location: Optional[Any] = None) -> Any:
+        """Loads a checkpoint saved in the directory, whatever the number of processes which saved it.
+
+        Args:
+            filename (str): filename of the checkpoint, e.g. :attr:`~ignite.handlers.Checkpoint.last_checkpoint`.
+            map_location (optional): argument passed to `torch.load` for the manifest and the shards.
+
+        Returns:
+            checkpoint with the tensors loaded from the shards.
+        """
+        manifest = torch.load(os.path.join(self.dirname, filename), map_location=map_location)
+        shards = {}
+        tensors = {}
+
+        def _from_shards(ref: _ShardRef) -> torch.Tensor:
+            if ref.chunks in tensors:
+                # tied tensors do not share memory once loaded
+                return tensors[ref.chunks].clone()
+            chunks = []
+            for shard_filename, key in ref.chunks:
+                if shard_filename not in shards:
+                    path = os.path.join(self.dirname, shard_filename)
+                    shards[shard_filename] = torch.load(path, map_location=map_location)
+                chunks.append(shards[shard_filename][key])
+            tensors[ref.chunks] = chunks[0] if len(chunks) == 1 else torch.cat(chunks)
+            return tensors[ref.chunks]
+
+        return _apply_to_type(manifest, _ShardRef, _from_shards)
+
+
+class AsyncSaver(BaseSaveHandler):
+    """Handler that saves input checkpoint on a background thread using another save handler, e.g.
+    :class:`~ignite.handlers.DiskSaver`.
+
+    On each call, tensors of the checkpoint are copied to CPU memory and the serialization is done by `save_handler`
+    on a background thread. Saves and removals are executed in the order of calls, such that `n_saved` pruning order
+    of :class:`~ignite.handlers.Checkpoint` is kept. If `save_handler` is :class:`~ignite.handlers.DiskSaver` with
+    `atomic=True`, checkpoint files are still moved to the final destination only once completely written.
+
+    Args:
+        save_handler (callable or `BaseSaveHandler`): save handler to run on the background thread.
+        max_pending (int, optional): maximum number of saves in flight. When this number is reached, a new save
+            blocks until the oldest one is finished (default: 1).
+
+    Note:
+        Errors raised on the background thread are raised on the next call or by :meth:`wait`. The background
+        thread is stopped by :meth:`close`, which is called on `Events.COMPLETED` if the saver is attached to an
+        engine. It is started again on the next save.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.handlers import AsyncSaver, Checkpoint, DiskSaver
+
+        saver = AsyncSaver(DiskSaver('/tmp/models', create_dir=True), max_pending=2)
+        # wait for pending saves when trainer is completed or when an exception is raised
+        saver.attach(trainer)
+
+        to_save = {'model': model, 'optimizer': optimizer, 'trainer': trainer}
+        handler = Checkpoint(to_save, saver, n_saved=2)
+        trainer.add_event_handler(Events.ITERATION_COMPLETED(every=1000), handler)
+
+    """
+
+    def __init__(self, save_handler: Union[Callable, BaseSaveHandler], max_pending: int = 1):
+        if not (callable(save_handler) or isinstance(save_handler, BaseSaveHandler)):
+            raise TypeError("Argument `save_handler` should be callable or inherit from BaseSaveHandler")
+
+        if max_pending < 1:
+            raise ValueError("Argument max_pending should be positive, but given {}".format(max_pending))
+
+        self.save_handler = save_handler
+        self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self._executor = None
+        self._semaphore = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+
+    @staticmethod
+    def _snapshot(obj: Any, memo: dict) -> Any:
+        def _copy(t: torch.Tensor) -> torch.Tensor:
+            # tensors sharing the same data (e.g. tied weights) are copied once
+            if id(t) not in memo:
+                memo[id(t)] = t.detach().to("cpu", copy=True)
+            return memo[id(t)]
+
+        return _apply_to_type(obj, torch.Tensor, _copy)
+
+    def _submit(self, fn: Callable, *args: Any) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor.submit(fn, *args)
+
+    def _check_errors(self, wait: bool = False) -> None:
+        futures, self._futures = self._futures, []
+        error = None
+        for future in futures:
+            if not (wait or future.done()):
+                self._futures.append(future)
+                continue
+            e = future.exception()
+            if e is not None and error is None:
+                error = e
+        if error is not None:
+            raise error
+
+    def __call__(self, checkpoint: Mapping, filename: str) -> None:
+        self._check_errors()
+        checkpoint = self._snapshot(checkpoint, {})
+        self._semaphore.acquire()
+        future = self._submit(self.save_handler, checkpoint, filename)
+        future.add_done_callback(lambda _: self._semaphore.release())
+        self._futures.append(future)
+
+    def remove(self, filename: str) -> None:
+        if isinstance(self.save_handler, BaseSaveHandler):
+            self._futures.append(self._submit(self.save_handler.remove, filename))
+
+    def wait(self) -> None:
+        """Blocks until all pending saves and removals are done. Raises the first error raised on the background
+        thread if any.
+        """
+        self._check_errors(wait=True)
+
+    def close(self) -> None:
+        """Waits for pending saves and removals as :meth:`wait`, then stops the background thread. A later save
+        starts a new background thread.
+        """
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _wait_on_exception(self, engine: Engine, e: Exception) -> None:
+        try:
+            self.close()
+        except Exception as err:
+            self.logger.error("Pending checkpoint could not be saved: %s", str(err))
+        # Registered handler on EXCEPTION_RAISED prevents the exception to be raised by the engine.
+        # Thus, the exception is re-raised if there is no other handler than those of savers, by the last saver such
+        # that all savers are closed.
+        handlers = engine._get_event_handlers(Events.EXCEPTION_RAISED)
+        savers = [getattr(h, "__self__", None) for h in handlers if _is_wait_on_exception(h)]
+        if len(savers) == len(handlers) and savers[-1] is self:
+            raise e
+
+    def attach(self, engine: Engine) -> None:
+        """Attaches the saver to an engine to wait for pending saves and stop the background thread on
+        `Events.COMPLETED` and before an exception raised during the run is propagated.
+
+        Args:
+            engine (Engine): engine to attach the saver to, e.g. the trainer.
+        """
+        if not isinstance(engine, Engine):
+            raise TypeError("Argument engine should be ignite.engine.Engine, but given {}".format(type(engine)))
+
+        engine.add_event_handler(Events.COMPLETED, lambda _: self.close())
+        engine.add_event_handler(Events.EXCEPTION_RAISED, self._wait_on_exception)
+
+
+def _is_wait_on_exception(handler: Callable) -> bool:
+    return getattr(handler, "__func__", None) is AsyncSaver._wait_on_exception
+
+
+class TieredSaver(AsyncSaver):
+    """Handler that saves input checkpoint to a fast tier, e.g. :class:`~ignite.handlers.DiskSaver` on a local
+    tmpfs, and migrates some of the saves on a background thread to a durable tier, e.g.
+    :class:`~ignite.handlers.DiskSaver` on a network filesystem.
+
+    Every save is done synchronously by `fast_saver`, which keeps the last `n_fast` saves. Every `persist_every`-th
+    save and, if `score_function` is provided, every save with the best score so far are also saved by
+    `save_handler` on a background thread, as with :class:`~ignite.handlers.AsyncSaver`. The durable tier keeps the
+    last `n_saved` periodic migrations and, apart from them, the save with the best score. Recovery points can thus be
+    very frequent, without writing each of them to the durable tier.
+
+    Args:
+        fast_saver (callable or `BaseSaveHandler`): save handler of the fast tier.
+        save_handler (callable or `BaseSaveHandler`): save handler of the durable tier, run on the background thread.
+        persist_every (int, optional): every `persist_every`-th save is migrated to the durable tier (default: 1).
+        n_fast (int, optional): number of saves kept in the fast tier. Requires `fast_saver` to inherit from
+            `BaseSaveHandler` (default: 2).
+        n_saved (int, optional): number of periodic migrations kept in the durable tier, in addition to the save
+            with the best score. If None, all migrated saves are kept. Requires `save_handler` to inherit from
+            `BaseSaveHandler` (default: 1).
+        score_function (callable, optional): function taking the engine given to :meth:`attach` and returning a
+            score. Saves improving the best score are migrated to the durable tier.
+        max_pending (int, optional): maximum number of migrations in flight (default: 1).
+
+    Note:
+        Retention is handled by each tier, :class:`~ignite.handlers.Checkpoint` using this handler should be
+        created with `n_saved=None`. Checkpoints removed by :class:`~ignite.handlers.Checkpoint` are removed from
+        both tiers.
+
+    Examples:
+
+    .. code-block:: python
+
+        from ignite.handlers import Checkpoint, DiskSaver, TieredSaver
+
+        saver = TieredSaver(
+            DiskSaver('/dev/shm/models', require_empty=False),
+            DiskSaver('/mnt/nfs/models', require_empty=False),
+            persist_every=10,
+        )
+        saver.attach(trainer)
+
+        to_save = {'model': model, 'optimizer': optimizer, 'trainer': trainer}
+        handler = Checkpoint(to_save, saver, n_saved=None)
+        trainer.add_event_handler(Events.ITERATION_COMPLETED(every=200), handler)
+
+        # on restart
+        path = saver.find_latest()
+        if path is not None:
+            Checkpoint.load_objects(to_load=to_save, checkpoint=path)
+
+    """
+
+    def __init__(
+        self,
+        fast_saver: Union[Callable, BaseSaveHandler],
+        save_handler: Union[Callable, BaseSaveHandler],
+        persist_every: int = 1,
+        n_fast: Optional[int] = 2,
+        n_saved: Optional[int] = 1,
+        score_function: Optional[Callable] = None,
+        max_pending: int = 1,
+    ):
+        if not (callable(fast_saver) or isinstance(fast_saver, BaseSaveHandler)):
+            raise TypeError("Argument `fast_saver` should be callable or inherit from BaseSaveHandler")
+
+        super(TieredSaver, self).__init__(save_handler, max_pending=max_pending)
+
+        if persist_every < 1:
+            raise ValueError("Argument persist_every should be positive, but given {}".format(persist_every))
+        for name, value, handler in [("n_fast", n_fast, fast_saver), ("n_saved", n_saved, save_handler)]:
+            if value is not None:
+                if value < 1:
+                    raise ValueError("Argument {} should be positive or None, but given {}".format(name, value))
+                if not isinstance(handler, BaseSaveHandler):
+                    raise TypeError("Argument {} requires a save handler inheriting from BaseSaveHandler".format(name))
+        if score_function is not None and not callable(score_function):
+            raise TypeError("Argument score_function should be a function, but given {}".format(type(score_function)))
+
+        self.fast_saver = fast_saver
+        self._persist_every = persist_every
+        self._n_fast = n_fast
+        self._n_saved = n_saved
+        self._score_function = score_function
+        self._engine = None
+        self._best_score = None
+        self._num_saves = 0
+        self._fast_saved = []
+        self._durable_saved = []
+        self._durable_best = None
+
+    def _is_best(self) -> bool:
+        if self._score_function is None:
+            return False
+        if self._engine is None:
+            raise RuntimeError("TieredSaver with score_function should be attached to an engine")
+        score = self._score_function(self._engine)
+        if not isinstance(score, numbers.Number):
+            raise ValueError("Output of score_function should be a number")
+        if self._best_score is None or score > self._best_score:
+            self._best_score = score
+            return True
+        return False
+
+    def _remove_durable(self, filename: str) -> None:
+        # a save is removed from the durable tier once it is neither a kept periodic migration nor the best one
+        if filename not in self._durable_saved and filename != self._durable_best:
+            super(TieredSaver, self).remove(filename)
+
+    def _persist(self, checkpoint: Mapping, filename: str, timestamp: float) -> None:
+        self.save_handler(checkpoint, filename)
+        dirname = getattr(self.save_handler, "dirname", None)
+        if dirname is not None:
+            # migrated file is as fresh as the save to the fast tier
+            os.utime(os.path.join(dirname, filename), (timestamp, timestamp))
+
+    def __call__(self, checkpoint: Mapping, filename: str) -> None:
+        self._check_errors()
+        timestamp = time.time()
+        self.fast_saver(checkpoint, filename)
+        if filename not in self._fast_saved:
+            self._fast_saved.append(filename)
+        if self._n_fast is not None and len(self._fast_saved) > self._n_fast:
+            self.fast_saver.remove(self._fast_saved.pop(0))
+
+        self._num_saves += 1
+        periodic = self._num_saves % self._persist_every == 0
+        best = self._is_best()
+        if not (periodic or best):
+            return
+
+        checkpoint = self._snapshot(checkpoint, {})
+        self._semaphore.acquire()
+        future = self._submit(self._persist, checkpoint, filename, timestamp)
+        future.add_done_callback(lambda _: self._semaphore.release())
+        self._futures.append(future)
+        if best:
+            previous, self._durable_best = self._durable_best, filename
+            if self._n_saved is not None and previous is not None:
+                self._remove_durable(previous)
+        if periodic and filename not in self._durable_saved:
+            self._durable_saved.append(filename)
+            if self._n_saved is not None and len(self._durable_saved) > self._n_saved:
+                self._remove_durable(self._durable_saved.pop(0))
+
+    def remove(self, filename: str) -> None:
+        if filename in self._fast_saved:
+            self._fast_saved.remove(filename)
+            if isinstance(self.fast_saver, BaseSaveHandler):
+                self.fast_saver.remove(filename)
+        if filename in self._durable_saved or filename == self._durable_best:
+            if filename in self._durable_saved:
+                self._durable_saved.remove(filename)
+            if filename == self._durable_best:
+                self._durable_best = None
+            super(TieredSaver, self).remove(filename)
+
+    def attach(self, engine: Engine) -> None:
+        """Attaches the saver to an engine to wait for pending migrations and stop the background thread on
+        `Events.COMPLETED` and before an exception raised during the run is propagated. The engine is also passed to
+        `score_function`.
+
+        Args:
+            engine (Engine): engine to attach the saver to, e.g. the trainer.
+        """
+        super(TieredSaver, self).attach(engine)
+        self._engine = engine
+
+    def find_latest(self, filename_prefix: str = "") -> Optional[str]:
+        """Returns the path of the most recently saved checkpoint which is complete, across the directories of both
+        tiers, including checkpoints saved by previous runs. Save handlers without `dirname` attribute are ignored.
+
+        Only files named as by :class:`~ignite.handlers.Checkpoint`, i.e. `{filename_prefix}_*.pt`, are considered.
+        Completeness is checked from the structure of the file, without reading the data of tensors: files saved by
+        `torch.save` in the legacy (non-zip) format are not checked.
+
+        Args:
+            filename_prefix (str, optional): prefix of the filenames, as given to :class:`~ignite.handlers.Checkpoint`
+                (default: "").
+
+        Returns:
+            path to the checkpoint file or None if there is no valid checkpoint.
+        """
+        prefix = "{}_".format(filename_prefix) if len(filename_prefix) > 0 else ""
+        candidates = []
+        # on equal times, files of the fast tier are preferred
+        for tier, handler in enumerate([self.fast_saver, self.save_handler]):
+            dirname = getattr(handler, "dirname", None)
+            if dirname is None or not os.path.isdir(dirname):
+                continue
+            for fname in os.listdir(dirname):
+                path = os.path.join(dirname, fname)
+                if fname.startswith(prefix) and fname.endswith(".pt") and os.path.isfile(path):
+                    candidates.append((-os.path.getmtime(path), tier, path))
+
+        for _, _, path in sorted(candidates):
+            try:
+                if _is_complete_checkpoint(path):
+                    return path
+            except OSError:
+                continue
+        return None
+
+
 class ModelCheckpoint(Checkpoint):
     """ModelCheckpoint handler can be used to periodically save objects to disk only. If needed to store checkpoints to
     another storage type, please consider :class:`~ignite.handlers.checkpoint.Checkpoint`.
@@ -1,6 +1,14 @@
 from ignite.metrics.accumulation import Average, GeometricAverage, VariableAccumulation
 from ignite.metrics.accuracy import Accuracy
-from ignite.metrics.confusion_matrix import ConfusionMatrix, DiceCoefficient, IoU, mIoU
+from ignite.metrics.confusion_matrix import (
+    ConfusionMatrix,
+    DiceCoefficient,
+    IoU,
+    cmAccuracy,
+    cmPrecision,
+    cmRecall,
+    mIoU,
+)
 from ignite.metrics.epoch_metric import EpochMetric
 from ignite.metrics.fbeta import Fbeta
 from ignite.metrics.frequency import Frequency
@@ -9,6 +17,7 @@ from ignite.metrics.mean_absolute_error import MeanAbsoluteError
 from ignite.metrics.mean_pairwise_distance import MeanPairwiseDistance
 from ignite.metrics.mean_squared_error import MeanSquaredError
 from ignite.metrics.metric import Metric
+from ignite.metrics.metric_group import MetricGroup
 from ignite.metrics.metrics_lambda import MetricsLambda
 from ignite.metrics.precision import Precision
 from ignite.metrics.recall import Recall
@@ -18,6 +27,7 @@ from ignite.metrics.top_k_categorical_accuracy import TopKCategoricalAccuracy
 
 __all__ = [
     "Metric",
+    "MetricGroup",
     "Accuracy",
     "Loss",
     "MetricsLambda",
@@ -33,6 +43,9 @@ __all__ = [
     "GeometricAverage",
     "IoU",
     "mIoU",
+    "cmAccuracy",
+    "cmPrecision",
+    "cmRecall",
     "Precision",
     "Recall",
     "RootMeanSquaredError",
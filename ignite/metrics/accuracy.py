@@ -62,11 +62,11 @@ class _BaseClassification(Metric):
             num_classes = y_pred.shape[1]
             if num_classes == 1:
                 update_type = "binary"
-                self._check_binary_multilabel_cases((y_pred, y))
+                self._check_once(self._check_binary_multilabel_cases, (y_pred, y))
             else:
                 update_type = "multiclass"
         elif y.ndimension() == y_pred.ndimension():
-            self._check_binary_multilabel_cases((y_pred, y))
+            self._check_once(self._check_binary_multilabel_cases, (y_pred, y))
 
             if self._is_multilabel:
                 update_type = "multilabel"
@@ -145,7 +145,7 @@ class Accuracy(_BaseClassification):
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
         y_pred, y = output
-        self._check_shape((y_pred, y))
+        self._check_once(self._check_shape, (y_pred, y), self._is_multilabel)
         self._check_type((y_pred, y))
 
         if self._type == "binary":
@@ -1,10 +1,12 @@
 import numbers
-from typing import Any, Callable, Optional, Sequence, Union
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
 import torch
+import torch.distributed as dist
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
+from ignite.metrics.epoch_metric import _all_gather_variable_size
+from ignite.metrics.metric import Metric, reinit__is_reduced
 from ignite.metrics.metrics_lambda import MetricsLambda
 
 __all__ = ["ConfusionMatrix", "mIoU", "IoU", "DiceCoefficient", "cmAccuracy", "cmPrecision", "cmRecall"]
@@ -26,6 +28,10 @@ class ConfusionMatrix(Metric):
             samples. If `average="recall"` then confusion matrix values are normalized such that diagonal values
             represent class recalls. If `average="precision"` then confusion matrix values are normalized such that
             diagonal values represent class precisions.
+        sparse (bool, optional): if True, only non-zero entries of the confusion matrix are stored as pairs of
+            flat indices and counts, and `compute` returns a sparse COO tensor. Memory then scales with the number
+            of distinct (target, prediction) pairs instead of `num_classes ** 2`, which is useful for very large
+            class counts. Default is False.
         output_transform (callable, optional): a callable that is used to transform the
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
@@ -40,6 +46,13 @@ class ConfusionMatrix(Metric):
         contribute to the confusion matrix and others are neglected. For example, if `num_classes=20` and target index
         equal 255 is encountered, then it is filtered out.
 
+    Note:
+        With `sparse=True`, pairs counts are merged on every update with a sort of the stored and incoming flat
+        indices. In distributed configuration, only non-zero entries are gathered from all processes and merged.
+        :meth:`~ignite.metrics.IoU`, :meth:`~ignite.metrics.mIoU`, :meth:`~ignite.metrics.DiceCoefficient`,
+        :meth:`~ignite.metrics.cmAccuracy`, :meth:`~ignite.metrics.cmPrecision` and
+        :meth:`~ignite.metrics.cmRecall` accept sparse confusion matrices and never densify them.
+
     """
 
     def __init__(
@@ -48,6 +61,7 @@ class ConfusionMatrix(Metric):
         average: Optional[str] = None,
         output_transform: Callable = lambda x: x,
         device: Optional[Union[str, torch.device]] = None,
+        sparse: bool = False,
     ):
         if average is not None and average not in ("samples", "recall", "precision"):
             raise ValueError("Argument average can None or one of ['samples', 'recall', 'precision']")
@@ -55,12 +69,22 @@ class ConfusionMatrix(Metric):
         self.num_classes = num_classes
         self._num_examples = 0
         self.average = average
+        self.sparse = sparse
         self.confusion_matrix = None
+        self._indices = None
+        self._counts = None
         super(ConfusionMatrix, self).__init__(output_transform=output_transform, device=device)
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self.confusion_matrix = torch.zeros(self.num_classes, self.num_classes, dtype=torch.int64, device=self._device)
+        if self.sparse:
+            # flat indices `num_classes * target + prediction` of non-zero entries, sorted, and their counts
+            self._indices = torch.zeros(0, dtype=torch.int64, device=self._device)
+            self._counts = torch.zeros(0, dtype=torch.int64, device=self._device)
+        else:
+            self.confusion_matrix = torch.zeros(
+                self.num_classes, self.num_classes, dtype=torch.int64, device=self._device
+            )
         self._num_examples = 0
 
     def _check_shape(self, output: Sequence[torch.Tensor]) -> None:
@@ -94,8 +118,8 @@ class ConfusionMatrix(Metric):
 
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
-        self._check_shape(output)
         y_pred, y = output
+        self._check_once(self._check_shape, (y_pred, y), self.num_classes)
 
         self._num_examples += y_pred.shape[0]
 
@@ -103,18 +127,65 @@ class ConfusionMatrix(Metric):
         y_pred = torch.argmax(y_pred, dim=1).flatten()
         y = y.flatten()
 
-        target_mask = (y >= 0) & (y < self.num_classes)
-        y = y[target_mask]
-        y_pred = y_pred[target_mask]
+        if self.sparse:
+            target_mask = (y >= 0) & (y < self.num_classes)
+            indices = (self.num_classes * y + y_pred)[target_mask].to(self._indices)
+            counts = torch.ones_like(indices)
+            self._indices, self._counts = _merge_sparse_counts(
+                torch.cat([self._indices, indices]), torch.cat([self._counts, counts])
+            )
+            return
 
-        indices = self.num_classes * y + y_pred
-        m = torch.bincount(indices, minlength=self.num_classes ** 2).reshape(self.num_classes, self.num_classes)
-        self.confusion_matrix += m.to(self.confusion_matrix)
+        # out of range targets are counted in an extra bin which is dropped,
+        # masking would require a device to host synchronization
+        target_mask = (y >= 0) & (y < self.num_classes)
+        indices = torch.where(target_mask, self.num_classes * y + y_pred, torch.full_like(y, self.num_classes ** 2))
+        m = torch.bincount(indices, minlength=self.num_classes ** 2 + 1)[:-1]
+        self.confusion_matrix += m.reshape(self.num_classes, self.num_classes).to(self.confusion_matrix)
+
+    def _reducible_attrs(self) -> Tuple[str, ...]:
+        if self.sparse:
+            # non-zero entries can not be summed element-wise across processes, they are gathered in compute
+            return ()
+        return ("confusion_matrix", "_num_examples")
+
+    def _sync_all_gather_sparse(self) -> None:
+        if not (dist.is_available() and dist.is_initialized() and dist.get_world_size() > 1):
+            return
+        indices = _all_gather_variable_size(self._indices, self._device)
+        counts = _all_gather_variable_size(self._counts, self._device)
+        indices, counts = _merge_sparse_counts(indices, counts)
+        self._indices = indices.to(self._device)
+        self._counts = counts.to(self._device)
+
+    def _compute_sparse(self) -> torch.Tensor:
+        rows = self._indices // self.num_classes
+        cols = self._indices % self.num_classes
+        values = self._counts
+        if self.average:
+            values = values.float()
+            if self.average == "samples":
+                values = values / self._num_examples
+            elif self.average == "recall":
+                values = values / (_scatter_sum(values, rows, self.num_classes)[rows] + 1e-15)
+            elif self.average == "precision":
+                values = values / (_scatter_sum(values, cols, self.num_classes)[cols] + 1e-15)
+        size = (self.num_classes, self.num_classes)
+        return torch.sparse_coo_tensor(torch.stack([rows, cols]), values, size).coalesce()
 
-    @sync_all_reduce("confusion_matrix", "_num_examples")
     def compute(self) -> torch.Tensor:
+        if not self._is_reduced:
+            if self.sparse:
+                self._sync_all_gather_sparse()
+            else:
+                self.confusion_matrix = self._sync_all_reduce(self.confusion_matrix)
+            self._num_examples = self._sync_all_reduce(self._num_examples)
+            self._is_reduced = True
+
         if self._num_examples == 0:
             raise NotComputableError("Confusion matrix must have at least one example before it can be computed.")
+        if self.sparse:
+            return self._compute_sparse()
         if self.average:
             self.confusion_matrix = self.confusion_matrix.float()
             if self.average == "samples":
@@ -126,6 +197,34 @@ class ConfusionMatrix(Metric):
         return self.confusion_matrix
 
 
+def _merge_sparse_counts(indices: torch.Tensor, counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+    # sums counts of duplicated indices, returned indices are unique and sorted
+    indices, inverse = torch.unique(indices, sorted=True, return_inverse=True)
+    return indices, torch.zeros_like(indices).index_add_(0, inverse, counts)
+
+
+def _scatter_sum(values: torch.Tensor, index: torch.Tensor, size: int) -> torch.Tensor:
+    return torch.zeros(size, dtype=values.dtype, device=values.device).index_add_(0, index, values)
+
+
+def _cm_diag(cm: torch.Tensor) -> torch.Tensor:
+    # Increase floating point precision and pass to CPU
+    if cm.is_sparse:
+        rows, cols = cm.indices().cpu()
+        values = cm.values().cpu().double()
+        on_diagonal = rows == cols
+        return _scatter_sum(values[on_diagonal], rows[on_diagonal], cm.shape[0])
+    return cm.type(torch.DoubleTensor).diag()
+
+
+def _cm_sum(cm: torch.Tensor, dim: int) -> torch.Tensor:
+    # Increase floating point precision and pass to CPU
+    if cm.is_sparse:
+        # summing over columns (dim=1) gives a value per row and conversely
+        return _scatter_sum(cm.values().cpu().double(), cm.indices()[1 - dim].cpu(), cm.shape[1 - dim])
+    return cm.type(torch.DoubleTensor).sum(dim=dim)
+
+
 def IoU(cm: ConfusionMatrix, ignore_index: Optional[int] = None) -> MetricsLambda:
     """Calculates Intersection over Union using :class:`~ignite.metrics.ConfusionMatrix` metric.
 
@@ -156,9 +255,8 @@ def IoU(cm: ConfusionMatrix, ignore_index: Optional[int] = None) -> MetricsLambd
         if not (isinstance(ignore_index, numbers.Integral) and 0 <= ignore_index < cm.num_classes):
             raise ValueError("ignore_index should be non-negative integer, but given {}".format(ignore_index))
 
-    # Increase floating point precision and pass to CPU
-    cm = cm.type(torch.DoubleTensor)
-    iou = cm.diag() / (cm.sum(dim=1) + cm.sum(dim=0) - cm.diag() + 1e-15)
+    diag = MetricsLambda(_cm_diag, cm)
+    iou = diag / (MetricsLambda(_cm_sum, cm, 1) + MetricsLambda(_cm_sum, cm, 0) - diag + 1e-15)
     if ignore_index is not None:
 
         def ignore_index_fn(iou_vector):
@@ -211,9 +309,10 @@ def cmAccuracy(cm: ConfusionMatrix) -> MetricsLambda:
     Returns:
         MetricsLambda
     """
-    # Increase floating point precision and pass to CPU
-    cm = cm.type(torch.DoubleTensor)
-    return cm.diag().sum() / (cm.sum() + 1e-15)
+    if not isinstance(cm, ConfusionMatrix):
+        raise TypeError("Argument cm should be instance of ConfusionMatrix, but given {}".format(type(cm)))
+
+    return MetricsLambda(_cm_diag, cm).sum() / (MetricsLambda(_cm_sum, cm, 1).sum() + 1e-15)
 
 
 def cmPrecision(cm: ConfusionMatrix, average: bool = True) -> MetricsLambda:
@@ -225,10 +324,10 @@ def cmPrecision(cm: ConfusionMatrix, average: bool = True) -> MetricsLambda:
     Returns:
         MetricsLambda
     """
+    if not isinstance(cm, ConfusionMatrix):
+        raise TypeError("Argument cm should be instance of ConfusionMatrix, but given {}".format(type(cm)))
 
-    # Increase floating point precision and pass to CPU
-    cm = cm.type(torch.DoubleTensor)
-    precision = cm.diag() / (cm.sum(dim=0) + 1e-15)
+    precision = MetricsLambda(_cm_diag, cm) / (MetricsLambda(_cm_sum, cm, 0) + 1e-15)
     if average:
         return precision.mean()
     return precision
@@ -243,10 +342,10 @@ def cmRecall(cm: ConfusionMatrix, average: bool = True) -> MetricsLambda:
     Returns:
         MetricsLambda
     """
+    if not isinstance(cm, ConfusionMatrix):
+        raise TypeError("Argument cm should be instance of ConfusionMatrix, but given {}".format(type(cm)))
 
-    # Increase floating point precision and pass to CPU
-    cm = cm.type(torch.DoubleTensor)
-    recall = cm.diag() / (cm.sum(dim=1) + 1e-15)
+    recall = MetricsLambda(_cm_diag, cm) / (MetricsLambda(_cm_sum, cm, 1) + 1e-15)
     if average:
         return recall.mean()
     return recall
@@ -267,9 +366,7 @@ def DiceCoefficient(cm: ConfusionMatrix, ignore_index: Optional[int] = None) ->
         if not (isinstance(ignore_index, numbers.Integral) and 0 <= ignore_index < cm.num_classes):
             raise ValueError("ignore_index should be non-negative integer, but given {}".format(ignore_index))
 
-    # Increase floating point precision and pass to CPU
-    cm = cm.type(torch.DoubleTensor)
-    dice = 2.0 * cm.diag() / (cm.sum(dim=1) + cm.sum(dim=0) + 1e-15)
+    dice = 2.0 * MetricsLambda(_cm_diag, cm) / (MetricsLambda(_cm_sum, cm, 1) + MetricsLambda(_cm_sum, cm, 0) + 1e-15)
 
     if ignore_index is not None:
 
@@ -1,27 +1,126 @@
+import os
+import tempfile
 import warnings
-from typing import Callable, Sequence
+from typing import Callable, List, Optional, Sequence, Union
 
 import torch
+import torch.distributed as dist
 
-from ignite.metrics.metric import Metric
+from ignite.exceptions import NotComputableError
+from ignite.metrics.metric import Metric, reinit__is_reduced
 
 __all__ = ["EpochMetric"]
 
 
+class _GrowingBuffer:
+    # CPU storage of a sequence of tensors concatenated along the first dimension.
+    # Data is copied once into a preallocated buffer whose capacity grows geometrically. The buffer can be pinned
+    # or backed by a memory-mapped file in `mmap_dir`. `data` returns a view on the filled part of the buffer.
+
+    def __init__(self, pin_memory: bool = False, mmap_dir: Optional[str] = None, min_capacity: int = 1024):
+        self._pin_memory = pin_memory
+        self._mmap_dir = mmap_dir
+        self._min_capacity = min_capacity
+        self._buffer = None
+        self._size = 0
+        self._pending_copies = False
+
+    @property
+    def dtype(self) -> Optional[torch.dtype]:
+        return self._buffer.dtype if self._buffer is not None else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _allocate(self, capacity: int, shape: torch.Size, dtype: torch.dtype) -> torch.Tensor:
+        shape = (capacity,) + tuple(shape)
+        if self._mmap_dir is None:
+            return torch.empty(shape, dtype=dtype, pin_memory=self._pin_memory)
+
+        numel = 1
+        for d in shape:
+            numel *= d
+        fd, filename = tempfile.mkstemp(suffix=".bin", dir=self._mmap_dir)
+        os.close(fd)
+        try:
+            buffer = torch.from_file(filename, shared=True, size=max(numel, 1), dtype=dtype)
+        finally:
+            # mapped memory remains valid once the file is unlinked
+            os.remove(filename)
+        return buffer[:numel].view(shape)
+
+    def append(self, tensor: torch.Tensor) -> None:
+        n = tensor.shape[0]
+        if self._buffer is None:
+            self._buffer = self._allocate(max(n, self._min_capacity), tensor.shape[1:], tensor.dtype)
+        elif self._buffer.shape[1:] != tensor.shape[1:]:
+            raise ValueError(
+                "Incoherent shapes between input and stored data: {} vs {}".format(
+                    tuple(tensor.shape[1:]), tuple(self._buffer.shape[1:])
+                )
+            )
+        elif self._size + n > self._buffer.shape[0]:
+            capacity = max(2 * self._buffer.shape[0], self._size + n)
+            buffer = self._allocate(capacity, self._buffer.shape[1:], self._buffer.dtype)
+            buffer[: self._size].copy_(self._buffer[: self._size])
+            self._buffer = buffer
+
+        # device to pinned host copies can be asynchronous
+        non_blocking = self._pin_memory and tensor.is_cuda
+        self._buffer[self._size : self._size + n].copy_(tensor.detach(), non_blocking=non_blocking)
+        self._pending_copies |= non_blocking
+        self._size += n
+
+    def data(self) -> torch.Tensor:
+        if self._pending_copies:
+            torch.cuda.synchronize()
+            self._pending_copies = False
+        return self._buffer[: self._size]
+
+
+def _all_gather_sizes(size: int, device: Optional[Union[str, torch.device]]) -> List[int]:
+    # gathers an integer from all processes, e.g. to check that all processes have data before gathering it
+    local_size = torch.tensor([size], dtype=torch.int64, device=device)
+    sizes = [torch.zeros_like(local_size) for _ in range(dist.get_world_size())]
+    dist.all_gather(sizes, local_size)
+    return [int(s.item()) for s in sizes]
+
+
+def _all_gather_variable_size(
+    tensor: torch.Tensor, device: Optional[Union[str, torch.device]], sizes: Optional[List[int]] = None
+) -> torch.Tensor:
+    # gathers tensors of different lengths (first dimension) from all processes and concatenates them on CPU,
+    # lengths of all processes can be given if they are already gathered
+    world_size = dist.get_world_size()
+    if sizes is None:
+        sizes = _all_gather_sizes(tensor.shape[0], device)
+    max_size = max(sizes)
+    if max_size == 0:
+        # nothing to gather, some backends do not support empty tensors
+        return tensor.cpu()
+
+    padded = torch.zeros((max_size,) + tuple(tensor.shape[1:]), dtype=tensor.dtype, device=device)
+    padded[: tensor.shape[0]].copy_(tensor)
+    output = [torch.empty_like(padded) for _ in range(world_size)]
+    dist.all_gather(output, padded)
+    return torch.cat([t[:size] for t, size in zip(output, sizes)], dim=0).cpu()
+
+
 class EpochMetric(Metric):
     """Class for metrics that should be computed on the entire output history of a model.
     Model's output and targets are restricted to be of shape `(batch_size, n_classes)`. Output
     datatype should be `float32`. Target datatype should be `long`.
 
-    .. warning::
-
-        Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+    Predictions and targets are copied once into preallocated CPU buffers growing geometrically, optionally pinned
+    or backed by memory-mapped files for large epochs. `compute_fn` receives views on these buffers, without
+    concatenation. In distributed configuration, predictions and targets of all processes are gathered before
+    calling `compute_fn`. Each process should have received at least one example.
 
     .. warning::
 
-        Current implementation does not work with distributed computations. Results are not gather across all devices
-        and computed results are valid for a single device only.
+        Current implementation stores all input data (output and target) in as tensors before computing a metric.
+        This can potentially lead to a memory error if the input data is larger than available RAM. In this case,
+        use `mmap_dir` to store data on disk.
 
     - `update` must receive output of the form `(y_pred, y)` or `{'y_pred': y_pred, 'y': y}`.
 
@@ -34,20 +133,46 @@ class EpochMetric(Metric):
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
+        device (str of torch.device, optional): device used to gather data in distributed configuration, e.g.
+            "cuda:local_rank" with nccl backend. By default, "cpu" is used unless the backend is nccl. Data is always
+            stored on CPU.
+        pin_memory (bool, optional): if True and CUDA is available, data is stored in page-locked memory and copied
+            asynchronously from CUDA devices. Default, False.
+        mmap_dir (str, optional): if provided, data is stored in memory-mapped temporary files in this directory
+            instead of RAM. Default, None.
 
     """
 
-    def __init__(self, compute_fn: Callable, output_transform: Callable = lambda x: x):
+    def __init__(
+        self,
+        compute_fn: Callable,
+        output_transform: Callable = lambda x: x,
+        device: Optional[Union[str, torch.device]] = None,
+        pin_memory: bool = False,
+        mmap_dir: Optional[str] = None,
+    ):
 
         if not callable(compute_fn):
             raise TypeError("Argument compute_fn should be callable.")
 
-        super(EpochMetric, self).__init__(output_transform=output_transform, device="cpu")
+        if pin_memory and mmap_dir is not None:
+            raise ValueError("Arguments pin_memory and mmap_dir are mutually exclusive.")
+
+        if mmap_dir is not None and not os.path.isdir(mmap_dir):
+            raise ValueError("Argument mmap_dir should be an existing directory, but given {}".format(mmap_dir))
+
+        if device is None and dist.is_available() and dist.is_initialized() and dist.get_backend() != "nccl":
+            device = "cpu"
+
+        self._pin_memory = pin_memory and torch.cuda.is_available()
+        self._mmap_dir = mmap_dir
+        super(EpochMetric, self).__init__(output_transform=output_transform, device=device)
         self.compute_fn = compute_fn
 
+    @reinit__is_reduced
     def reset(self) -> None:
-        self._predictions = []
-        self._targets = []
+        self._predictions = _GrowingBuffer(pin_memory=self._pin_memory, mmap_dir=self._mmap_dir)
+        self._targets = _GrowingBuffer(pin_memory=self._pin_memory, mmap_dir=self._mmap_dir)
 
     def _check_shape(self, output):
         y_pred, y = output
@@ -65,19 +190,20 @@ class EpochMetric(Metric):
         y_pred, y = output
         if len(self._predictions) < 1:
             return
-        dtype_preds = self._predictions[-1].type()
-        if dtype_preds != y_pred.type():
+        dtype_preds = self._predictions.dtype
+        if dtype_preds != y_pred.dtype:
             raise ValueError(
                 "Incoherent types between input y_pred and stored predictions: "
-                "{} vs {}".format(dtype_preds, y_pred.type())
+                "{} vs {}".format(dtype_preds, y_pred.dtype)
             )
 
-        dtype_targets = self._targets[-1].type()
-        if dtype_targets != y.type():
+        dtype_targets = self._targets.dtype
+        if dtype_targets != y.dtype:
             raise ValueError(
-                "Incoherent types between input y and stored targets: " "{} vs {}".format(dtype_targets, y.type())
+                "Incoherent types between input y and stored targets: " "{} vs {}".format(dtype_targets, y.dtype)
             )
 
+    @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
         self._check_shape(output)
         y_pred, y = output
@@ -87,23 +213,34 @@ class EpochMetric(Metric):
         if y.ndimension() == 2 and y.shape[1] == 1:
             y = y.squeeze(dim=-1)
 
-        y_pred = y_pred.cpu().clone()
-        y = y.cpu().clone()
-
         self._check_type((y_pred, y))
         self._predictions.append(y_pred)
         self._targets.append(y)
 
         # Check once the signature and execution of compute_fn
-        if len(self._predictions) == 1:
+        if len(self._predictions) == y_pred.shape[0]:
             try:
-                self.compute_fn(self._predictions[0], self._targets[0])
+                self.compute_fn(self._predictions.data(), self._targets.data())
             except Exception as e:
                 warnings.warn("Probably, there can be a problem with `compute_fn`:\n {}.".format(e), EpochMetricWarning)
 
     def compute(self) -> None:
-        _prediction_tensor = torch.cat(self._predictions, dim=0)
-        _target_tensor = torch.cat(self._targets, dim=0)
+        if not (dist.is_available() and dist.is_initialized() and dist.get_world_size() > 1):
+            if len(self._predictions) < 1:
+                raise NotComputableError("EpochMetric must have at least one example before it can be computed.")
+            return self.compute_fn(self._predictions.data(), self._targets.data())
+
+        # all processes join the collective before any of them raises, a process without examples would otherwise
+        # leave the others blocked in the gather
+        sizes = _all_gather_sizes(len(self._predictions), self._device)
+        if min(sizes) < 1:
+            raise NotComputableError(
+                "EpochMetric must have at least one example on each process before it can be computed."
+            )
+
+        _prediction_tensor = _all_gather_variable_size(self._predictions.data(), self._device, sizes)
+        _target_tensor = _all_gather_variable_size(self._targets.data(), self._device, sizes)
+
         return self.compute_fn(_prediction_tensor, _target_tensor)
 
 
@@ -23,8 +23,12 @@ def Fbeta(
         beta (float): weight of precision in harmonic mean
         average (bool, optional): if True, F-beta score is computed as the unweighted average (across all classes
             in multiclass case), otherwise, returns a tensor with F-beta score for each class in multiclass case.
-        precision (Precision, optional): precision object metric with `average=False` to compute F-beta score
-        recall (Precision, optional): recall object metric with `average=False` to compute F-beta score
+        precision (Precision or MetricsLambda, optional): precision object metric with `average=False` to compute
+            F-beta score, or per-class precision computed from a confusion matrix with
+            :meth:`~ignite.metrics.cmPrecision` and `average=False`.
+        recall (Recall or MetricsLambda, optional): recall object metric with `average=False` to compute F-beta
+            score, or per-class recall computed from a confusion matrix with :meth:`~ignite.metrics.cmRecall` and
+            `average=False`.
         output_transform (callable, optional): a callable that is used to transform the
             :class:`~ignite.engine.Engine`'s `process_function`'s output into the
             form expected by the metric. It is used only if precision or recall are not provided.
@@ -35,6 +39,16 @@ def Fbeta(
 
     Returns:
         MetricsLambda, F-beta metric
+
+    Examples:
+
+    .. code-block:: python
+
+        # all metrics are derived from a single confusion matrix updated once per iteration
+        cm = ConfusionMatrix(num_classes=num_classes)
+        precision = cmPrecision(cm, average=False)
+        recall = cmRecall(cm, average=False)
+        F1 = Fbeta(beta=1.0, precision=precision, recall=recall)
     """
     if not (beta > 0):
         raise ValueError("Beta should be a positive integer, but given {}".format(beta))
@@ -51,7 +65,7 @@ def Fbeta(
             average=False,
             device=device,
         )
-    elif precision._average:
+    elif isinstance(precision, Precision) and precision._average:
         raise ValueError("Input precision metric should have average=False")
 
     if recall is None:
@@ -60,7 +74,7 @@ def Fbeta(
             average=False,
             device=device,
         )
-    elif recall._average:
+    elif isinstance(recall, Recall) and recall._average:
         raise ValueError("Input recall metric should have average=False")
 
     fbeta = (1.0 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall + 1e-15)
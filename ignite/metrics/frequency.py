@@ -4,6 +4,7 @@ import torch.distributed as dist
 from ignite.engine import Events
 from ignite.handlers.timing import Timer
 from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
+from ignite.metrics.metric_group import _add_running_metric, _reduce_running_metrics
 
 
 class Frequency(Metric):
@@ -33,6 +34,10 @@ class Frequency(Metric):
             ProgressBar(persist=True).attach(trainer, metric_names=['wps'])
             # Progress bar will look like
             # Epoch [2/10]: [50/100]  50%|█████      , wps=400 [00:17<00:35]
+
+    In distributed configuration, the number of processed objects and the elapsed time are reduced across processes
+    only when the metric is computed, e.g. every 50th iteration above, together with pending values of
+    :class:`~ignite.metrics.RunningAverage` metrics of the same engine.
     """
 
     def __init__(self, output_transform=lambda x: x, device=None):
@@ -40,6 +45,7 @@ class Frequency(Metric):
         self._acc = None
         self._n = None
         self._elapsed = None
+        self._completing = False
         super(Frequency, self).__init__(output_transform=output_transform, device=device)
 
     @reinit__is_reduced
@@ -66,10 +72,20 @@ class Frequency(Metric):
         # Returns the average processed objects per second across all workers
         return self._n / self._elapsed.item() * time_divisor
 
+    def _prepare_running_reduction(self, engine):
+        # values are reduced only when they are read by `completed`, together with pending running averages
+        return self._completing and not self._is_reduced
+
     def completed(self, engine, name):
+        self._completing = True
+        try:
+            _reduce_running_metrics(engine)
+        finally:
+            self._completing = False
         engine.state.metrics[name] = int(self.compute())
 
     def attach(self, engine, name, event_name=Events.ITERATION_COMPLETED):
         engine.add_event_handler(Events.EPOCH_STARTED, self.started)
-        engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        engine._add_first_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        _add_running_metric(engine, self)
         engine.add_event_handler(event_name, self.completed, name)
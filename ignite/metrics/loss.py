@@ -48,7 +48,7 @@ class Loss(Metric):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._sum = 0
+        self._sum = self._scalar_state(0.0)
         self._num_examples = 0
 
     @reinit__is_reduced
@@ -64,11 +64,11 @@ class Loss(Metric):
             raise ValueError("loss_fn did not return the average loss.")
 
         N = self._batch_size(y)
-        self._sum += average_loss.item() * N
+        self._sum += self._as_state(average_loss, self._sum) * N
         self._num_examples += N
 
     @sync_all_reduce("_sum", "_num_examples")
     def compute(self) -> None:
         if self._num_examples == 0:
             raise NotComputableError("Loss must have at least one example before it can be computed.")
-        return self._sum / self._num_examples
+        return float(self._sum) / self._num_examples
@@ -17,18 +17,18 @@ class MeanSquaredError(Metric):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._sum_of_squared_errors = 0.0
+        self._sum_of_squared_errors = self._scalar_state(0.0)
         self._num_examples = 0
 
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
         y_pred, y = output
         squared_errors = torch.pow(y_pred - y.view_as(y_pred), 2)
-        self._sum_of_squared_errors += torch.sum(squared_errors).item()
+        self._sum_of_squared_errors += self._as_state(torch.sum(squared_errors), self._sum_of_squared_errors)
         self._num_examples += y.shape[0]
 
     @sync_all_reduce("_sum_of_squared_errors", "_num_examples")
     def compute(self) -> Union[float, torch.Tensor]:
         if self._num_examples == 0:
             raise NotComputableError("MeanSquaredError must have at least one example before it can be computed.")
-        return self._sum_of_squared_errors / self._num_examples
+        return float(self._sum_of_squared_errors) / self._num_examples
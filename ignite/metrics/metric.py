@@ -3,7 +3,7 @@ import warnings
 from abc import ABCMeta, abstractmethod
 from collections.abc import Mapping
 from functools import wraps
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Hashable, Optional, Sequence, Tuple, Union
 
 import torch
 import torch.distributed as dist
@@ -28,6 +28,13 @@ class Metric(metaclass=ABCMeta):
             if already set `torch.cuda.set_device(local_rank)`. By default, if a distributed process group is
             initialized and available, device is set to `cuda`.
 
+    Note:
+        Metrics summing scalars over batches (e.g. :class:`~ignite.metrics.Loss`,
+        :class:`~ignite.metrics.MeanSquaredError` or :class:`~ignite.metrics.TopKCategoricalAccuracy`) keep their
+        state as Python numbers if `device` is the CPU (default). If `device` is another device, e.g. the device of
+        the model's outputs, their state is kept as tensors on `device` and transferred to the host once in
+        `compute`, such that `update` runs without device to host synchronization.
+
     """
 
     _required_output_keys = ("y_pred", "y")
@@ -50,8 +57,23 @@ class Metric(metaclass=ABCMeta):
             device = torch.device(device)
         self._device = device
         self._is_reduced = False
+        self._input_cache = None
         self.reset()
 
+    def _scalar_state(self, value: Union[int, float], dtype: torch.dtype = torch.float64) -> Any:
+        # initial value of a scalar summed over batches: a Python number on CPU, where it is cheaper to update, and a
+        # tensor on other devices, such that updates do not synchronize the device with the host
+        if self._device is None or torch.device(self._device).type == "cpu":
+            return value
+        return torch.tensor(value, dtype=dtype, device=self._device)
+
+    @staticmethod
+    def _as_state(value: torch.Tensor, state: Any) -> Any:
+        # batch value of a scalar state created by `_scalar_state`, in the type of the state
+        if isinstance(state, torch.Tensor):
+            return value.detach().to(state)
+        return value.item()
+
     @abstractmethod
     def reset(self) -> None:
         """
@@ -115,12 +137,17 @@ class Metric(metaclass=ABCMeta):
             return tensor.item()
         return tensor
 
+    def _reducible_attrs(self) -> Tuple[str, ...]:
+        """Names of the attributes reduced across processes before :meth:`compute`. By default, attributes are
+        defined by :meth:`~ignite.metrics.metric.sync_all_reduce` decorating :meth:`compute`.
+        """
+        return getattr(type(self).compute, "_sync_all_reduce_attrs", ())
+
     def started(self, engine: Engine) -> None:
         self.reset()
 
-    @torch.no_grad()
-    def iteration_completed(self, engine: Engine) -> None:
-        output = self._output_transform(engine.state.output)
+    def _prepare_output(self, output: Any) -> Any:
+        output = self._output_transform(output)
         if isinstance(output, Mapping):
             if self._required_output_keys is None:
                 raise TypeError(
@@ -134,7 +161,31 @@ class Metric(metaclass=ABCMeta):
                     "it should contain {} keys, but given {}".format(self._required_output_keys, list(output.keys()))
                 )
             output = tuple(output[k] for k in self._required_output_keys)
-        self.update(output)
+        return output
+
+    def _check_once(self, check: Callable, output: Sequence[torch.Tensor], *key: Hashable) -> None:
+        """Runs the stateless validation `check(output)`. If inputs are shared between metrics with
+        :class:`~ignite.metrics.MetricGroup`, the validation is run once per iteration for the same inputs, the same
+        check and the same `key`, where `key` holds the attributes of the metric the check depends on.
+        """
+        if self._input_cache is None:
+            check(output)
+        else:
+            self._input_cache.check(check, output, key)
+
+    @torch.no_grad()
+    def iteration_completed(self, engine: Engine) -> None:
+        cache = _get_input_cache(engine)
+        if cache is None:
+            self.update(self._prepare_output(engine.state.output))
+            return
+
+        output = cache.prepare(self, engine.state.output)
+        self._input_cache = cache
+        try:
+            self.update(output)
+        finally:
+            self._input_cache = None
 
     def completed(self, engine: Engine, name: str) -> None:
         result = self.compute()
@@ -199,6 +250,9 @@ class Metric(metaclass=ABCMeta):
             engine.remove_event_handler(self.completed, Events.EPOCH_COMPLETED)
         if engine.has_event_handler(self.started, Events.EPOCH_STARTED):
             engine.remove_event_handler(self.started, Events.EPOCH_STARTED)
+        running_metrics = getattr(engine, "_running_metrics", None)
+        if isinstance(running_metrics, list):
+            engine._running_metrics = [m for m in running_metrics if m is not self]
         if engine.has_event_handler(self.iteration_completed, Events.ITERATION_COMPLETED):
             engine.remove_event_handler(self.iteration_completed, Events.ITERATION_COMPLETED)
 
@@ -324,6 +378,8 @@ def sync_all_reduce(*attrs) -> Callable:
 
             return func(self, *args, **kwargs)
 
+        # keep attributes to let metric groups reduce them all at once
+        another_wrapper._sync_all_reduce_attrs = attrs
         return another_wrapper
 
     wrapper._decorated = True
@@ -338,3 +394,36 @@ def reinit__is_reduced(func: Callable) -> Callable:
 
     wrapper._decorated = True
     return wrapper
+
+
+class _InputCache:
+    # Prepared outputs and validated inputs of the current iteration of an engine, shared by the attached metrics.
+    # It is cleared on ITERATION_STARTED.
+
+    def __init__(self):
+        self.outputs = {}
+        self.checks = {}
+
+    def clear(self, engine: Engine) -> None:
+        self.outputs.clear()
+        self.checks.clear()
+
+    def prepare(self, metric: Metric, output: Any) -> Any:
+        transform = metric._output_transform
+        key = (getattr(transform, "cache_key", transform), metric._required_output_keys)
+        if key not in self.outputs:
+            self.outputs[key] = metric._prepare_output(output)
+        return self.outputs[key]
+
+    def check(self, check: Callable, output: Sequence[torch.Tensor], key: Tuple[Hashable, ...]) -> None:
+        check_key = (getattr(check, "__func__", check), key, tuple(id(t) for t in output))
+        if check_key not in self.checks:
+            check(output)
+            # keep inputs alive until the cache is cleared, so that their ids are not reused
+            self.checks[check_key] = output
+
+
+def _get_input_cache(engine: Engine) -> Optional[_InputCache]:
+    # the cache is set on the engine by `MetricGroup.attach`, such that it is found without scanning handlers
+    cache = getattr(engine, "_metric_input_cache", None)
+    return cache if isinstance(cache, _InputCache) else None
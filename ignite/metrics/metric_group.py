@@ -0,0 +1,208 @@
+import numbers
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Union
+
+import torch
+import torch.distributed as dist
+
+from ignite.engine import Engine, Events
+from ignite.metrics.metric import Metric, _get_input_cache, _InputCache
+from ignite.metrics.metrics_lambda import MetricsLambda
+
+__all__ = ["MetricGroup"]
+
+
+class MetricGroup:
+    """
+    Reduces the internal state of all metrics attached to an engine in a single collective per dtype.
+
+    By default, each metric reduces its accumulated attributes across processes on its own, with a barrier and an
+    all-reduce per attribute. An evaluator with several metrics therefore issues many small collectives at the end of
+    each epoch. Once attached, this handler runs first on `EPOCH_COMPLETED`, packs every pending reducible attribute
+    of the attached metrics (including dependencies of :class:`~ignite.metrics.MetricsLambda`) into one flat buffer
+    per dtype and device, reduces it with one `all_reduce` and unpacks the results. Metrics are then marked as
+    reduced and do not synchronize again in :meth:`~ignite.metrics.Metric.compute`.
+
+    Metrics without reducible attributes (e.g. :class:`~ignite.metrics.EpochMetric`) or holding attributes that can
+    not be summed (e.g. a metric instead of a value) are left untouched and keep their own reduction. Outside of a
+    distributed configuration, the handler does nothing.
+
+    With `share_inputs=True`, the group also shares the inputs of the attached metrics during each iteration.
+    Metrics with the same `output_transform` (the same object, or functions declaring the same hashable `cache_key`
+    attribute) and the same required output keys transform the engine's output once, and the stateless checks of
+    their inputs (shapes, binary values) are run once per iteration. Transforms are then expected to be
+    deterministic and to not modify the engine's output in place.
+
+    Args:
+        device (str or torch.device, optional): device where packed buffers are reduced. By default, the device
+            of each metric is used, which should be the device required by the distributed backend.
+        share_inputs (bool, optional): if True, metrics attached to the engine share transformed outputs and input
+            checks within an iteration. Default, False.
+
+    Example:
+
+    .. code-block:: python
+
+        evaluator = create_supervised_evaluator(model, metrics={
+            "accuracy": Accuracy(device=device),
+            "precision": Precision(device=device),
+            "nll": Loss(criterion, device=device),
+        })
+        MetricGroup().attach(evaluator)
+
+    Metrics sharing a transform:
+
+    .. code-block:: python
+
+        def thresholded_output_transform(output):
+            y_pred, y = output
+            return torch.round(torch.sigmoid(y_pred)), y
+
+        # or a `cache_key` attribute on functions computing the same inputs
+        thresholded_output_transform.cache_key = "thresholded"
+
+        metrics = {
+            "accuracy": Accuracy(thresholded_output_transform),
+            "precision": Precision(thresholded_output_transform, average=False),
+            "recall": Recall(thresholded_output_transform, average=False),
+        }
+        evaluator = create_supervised_evaluator(model, metrics=metrics)
+        MetricGroup(share_inputs=True).attach(evaluator)
+
+    """
+
+    def __init__(self, device: Optional[Union[str, torch.device]] = None, share_inputs: bool = False):
+        self._device = torch.device(device) if device is not None else None
+        self._share_inputs = share_inputs
+
+    def attach(self, engine: Engine) -> None:
+        """Attaches the reduction to the engine. It is triggered before any other handler on `EPOCH_COMPLETED`.
+
+        Args:
+            engine (Engine): engine with attached metrics. Metrics can be attached before or after the group.
+        """
+        if not isinstance(engine, Engine):
+            raise TypeError("Argument engine should be ignite.engine.Engine, but given {}".format(type(engine)))
+        # metrics compute their values on EPOCH_COMPLETED, so reduction should be inserted before
+        engine._add_first_event_handler(Events.EPOCH_COMPLETED, self._reduce)
+        if self._share_inputs and _get_input_cache(engine) is None:
+            engine._metric_input_cache = _InputCache()
+            engine.add_event_handler(Events.ITERATION_STARTED, engine._metric_input_cache.clear)
+
+    def detach(self, engine: Engine) -> None:
+        """Detaches the reduction from the engine.
+
+        Args:
+            engine (Engine): engine to which the group was attached.
+        """
+        if engine.has_event_handler(self._reduce, Events.EPOCH_COMPLETED):
+            engine.remove_event_handler(self._reduce, Events.EPOCH_COMPLETED)
+        cache = _get_input_cache(engine)
+        if self._share_inputs and cache is not None:
+            if engine.has_event_handler(cache.clear, Events.ITERATION_STARTED):
+                engine.remove_event_handler(cache.clear, Events.ITERATION_STARTED)
+            engine._metric_input_cache = None
+
+    def _reduce(self, engine: Engine) -> None:
+        _all_reduce_metrics(_get_attached_metrics(engine), device=self._device)
+
+
+def _add_running_metric(engine: Engine, metric: Metric) -> None:
+    # running metrics are kept on the engine, such that they are found without scanning handlers at every iteration
+    metrics = getattr(engine, "_running_metrics", None)
+    if not isinstance(metrics, list):
+        metrics = engine._running_metrics = []
+    if not any(m is metric for m in metrics):
+        metrics.append(metric)
+
+
+def _reduce_running_metrics(engine: Engine) -> None:
+    """Reduces at once all pending values of running metrics attached to the engine on `ITERATION_COMPLETED` (e.g.
+    :class:`~ignite.metrics.RunningAverage` or :class:`~ignite.metrics.Frequency`). Running metrics are registered
+    with `_add_running_metric` and define `_prepare_running_reduction(engine)` which returns True if their value
+    should be synchronized at the current iteration.
+    """
+    if not (dist.is_available() and dist.is_initialized()):
+        # Nothing to reduce
+        return
+
+    metrics = getattr(engine, "_running_metrics", None)
+    if not isinstance(metrics, list):
+        return
+    _all_reduce_metrics([m for m in metrics if m._prepare_running_reduction(engine)])
+
+
+def _collect_metrics(metric: Metric, output: List[Metric]) -> None:
+    if any(m is metric for m in output):
+        return
+    output.append(metric)
+    if isinstance(metric, MetricsLambda):
+        for dep in list(metric.args) + list(metric.kwargs.values()):
+            if isinstance(dep, Metric):
+                _collect_metrics(dep, output)
+
+
+def _get_attached_metrics(engine: Engine) -> List[Metric]:
+    metrics = []
+    for func in engine._get_event_handlers(Events.EPOCH_COMPLETED):
+        owner = getattr(func, "__self__", None)
+        if isinstance(owner, Metric) and func == owner.completed:
+            _collect_metrics(owner, metrics)
+    return metrics
+
+
+def _all_reduce_metrics(metrics: Iterable[Metric], device: Optional[torch.device] = None) -> None:
+    if not (dist.is_available() and dist.is_initialized()):
+        # Nothing to reduce
+        return
+
+    # (metric, attribute, is_number) packed per (device, dtype)
+    buffers = OrderedDict()
+    reduced_metrics = []
+    for metric in metrics:
+        if metric._is_reduced:
+            continue
+        attrs = metric._reducible_attrs()
+        entries = []
+        for attr in attrs:
+            # NB: getattr is not safe on missing attributes as Metric.__getattr__ builds a MetricsLambda
+            value = metric.__dict__.get(attr, None)
+            if value is None:
+                continue
+            if isinstance(value, torch.Tensor):
+                tensor = value
+            elif isinstance(value, numbers.Integral) and not isinstance(value, bool):
+                tensor = torch.tensor(value, dtype=torch.int64)
+            elif isinstance(value, numbers.Real):
+                tensor = torch.tensor(value, dtype=torch.float64)
+            else:
+                # leave the metric to its own reduction
+                entries = None
+                break
+            entries.append((attr, tensor, not isinstance(value, torch.Tensor)))
+
+        if not entries:
+            continue
+
+        reduced_metrics.append(metric)
+        buffer_device = device if device is not None else metric._device
+        for attr, tensor, is_number in entries:
+            key = (buffer_device, tensor.dtype)
+            buffers.setdefault(key, []).append((metric, attr, tensor, is_number))
+
+    for (buffer_device, _), items in buffers.items():
+        flat = torch.cat([tensor.detach().reshape(-1).to(buffer_device) for _, _, tensor, _ in items])
+        dist.all_reduce(flat)
+        offset = 0
+        for metric, attr, tensor, is_number in items:
+            numel = tensor.numel()
+            value = flat[offset : offset + numel].view(tensor.shape)
+            offset += numel
+            if is_number:
+                value = value.item()
+            else:
+                value = value.to(metric._device)
+            setattr(metric, attr, value)
+
+    for metric in reduced_metrics:
+        metric._is_reduced = True
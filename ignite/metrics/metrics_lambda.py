@@ -1,5 +1,6 @@
 import itertools
-from typing import Any, Callable
+import numbers
+from typing import Any, Callable, Dict, Hashable
 
 from ignite.engine import Engine, Events
 from ignite.metrics.metric import Metric, reinit__is_reduced
@@ -38,6 +39,14 @@ class MetricsLambda(Metric):
         F3 = MetricsLambda(Fbeta, recall, precision, 3)
         F4 = MetricsLambda(Fbeta, recall, precision, 4)
 
+    Metrics composed with :class:`~ignite.metrics.MetricsLambda` form an expression graph. When computed, each
+    dependency metric is computed only once, and so is each sub-expression, even if it is used several times. Two
+    sub-expressions built separately are shared if they apply the same function to the same metrics and constants.
+    Metrics lambdas attached to the same engine share computed values during `EPOCH_COMPLETED`, so that
+    e.g. :meth:`~ignite.metrics.IoU` and :meth:`~ignite.metrics.DiceCoefficient` computed from one
+    :class:`~ignite.metrics.ConfusionMatrix` compute (and reduce across processes) the confusion matrix once.
+    Functions should therefore not modify their arguments in-place.
+
     When check if the metric is attached, if one of its dependency
     metrics is detached, the metric is considered detached too.
 
@@ -67,6 +76,9 @@ class MetricsLambda(Metric):
         self.args = args
         self.kwargs = kwargs
         self.engine = None
+        self._node_key = _node_key(self)
+        self._engine_cache = None
+        self._pass_cache = None
         super(MetricsLambda, self).__init__(device="cpu")
 
     @reinit__is_reduced
@@ -83,9 +95,26 @@ class MetricsLambda(Metric):
         pass
 
     def compute(self) -> Any:
-        materialized = [i.compute() if isinstance(i, Metric) else i for i in self.args]
-        materialized_kwargs = {k: (v.compute() if isinstance(v, Metric) else v) for k, v in self.kwargs.items()}
-        return self.function(*materialized, **materialized_kwargs)
+        cache = self._pass_cache if self._pass_cache is not None else {}
+        return self._evaluate(cache)
+
+    def _evaluate(self, cache: Dict[Hashable, Any]) -> Any:
+        if self._node_key in cache:
+            return cache[self._node_key]
+        materialized = [_evaluate_node(i, cache) for i in self.args]
+        materialized_kwargs = {k: _evaluate_node(v, cache) for k, v in self.kwargs.items()}
+        value = self.function(*materialized, **materialized_kwargs)
+        cache[self._node_key] = value
+        return value
+
+    def completed(self, engine: Engine, name: str) -> None:
+        # values computed during this EPOCH_COMPLETED are shared with other metrics lambdas of the engine
+        if self._engine_cache is not None and self.engine is engine:
+            self._pass_cache = self._engine_cache.values
+        try:
+            super(MetricsLambda, self).completed(engine, name)
+        finally:
+            self._pass_cache = None
 
     def _internal_attach(self, engine: Engine) -> None:
         self.engine = engine
@@ -103,6 +132,7 @@ class MetricsLambda(Metric):
     def attach(self, engine: Engine, name: str) -> None:
         # recursively attach all its dependencies (partially)
         self._internal_attach(engine)
+        self._engine_cache = _get_compute_cache(engine)
         # attach only handler on EPOCH_COMPLETED
         engine.add_event_handler(Events.EPOCH_COMPLETED, self.completed, name)
 
@@ -131,3 +161,51 @@ class MetricsLambda(Metric):
                 if not engine.has_event_handler(metric.iteration_completed, Events.ITERATION_COMPLETED):
                     is_detached = True
         return not is_detached
+
+
+class _ComputeCache:
+    # Values of metrics and sub-expressions computed during one EPOCH_COMPLETED of an engine.
+    # It is cleared by the first handler of the event.
+
+    def __init__(self):
+        self.values = {}
+
+    def clear(self, engine: Engine) -> None:
+        self.values.clear()
+
+
+def _get_compute_cache(engine: Engine) -> _ComputeCache:
+    for func in engine._get_event_handlers(Events.EPOCH_COMPLETED):
+        if isinstance(getattr(func, "__self__", None), _ComputeCache):
+            return func.__self__
+    cache = _ComputeCache()
+    engine._add_first_event_handler(Events.EPOCH_COMPLETED, cache.clear)
+    return cache
+
+
+def _node_key(node: Any) -> Hashable:
+    # structural key: lambdas applying the same function to the same arguments are computed once
+    if isinstance(node, MetricsLambda):
+        try:
+            args = tuple(_node_key(i) for i in node.args)
+            kwargs = tuple(sorted(((k, _node_key(v)) for k, v in node.kwargs.items()), key=lambda kv: kv[0]))
+            key = ("lambda", node.function, args, kwargs)
+            hash(key)
+            return key
+        except TypeError:
+            # unhashable function
+            return ("id", id(node))
+    if isinstance(node, (numbers.Number, str)):
+        return ("const", type(node), node)
+    return ("id", id(node))
+
+
+def _evaluate_node(node: Any, cache: Dict[Hashable, Any]) -> Any:
+    if isinstance(node, MetricsLambda):
+        return node._evaluate(cache)
+    if isinstance(node, Metric):
+        key = ("id", id(node))
+        if key not in cache:
+            cache[key] = node.compute()
+        return cache[key]
+    return node
@@ -1,12 +1,10 @@
-import warnings
-from typing import Callable, Optional, Sequence, Union
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.metrics.accuracy import _BaseClassification
 from ignite.metrics.metric import reinit__is_reduced
-from ignite.utils import to_onehot
 
 __all__ = ["Precision"]
 
@@ -19,15 +17,6 @@ class _BasePrecisionRecall(_BaseClassification):
         is_multilabel: bool = False,
         device: Optional[Union[str, torch.device]] = None,
     ):
-        if torch.distributed.is_available() and torch.distributed.is_initialized():
-            if (not average) and is_multilabel:
-                warnings.warn(
-                    "Precision/Recall metrics do not work in distributed setting when average=False "
-                    "and is_multilabel=True. Results are not reduced across the GPUs. Computed result "
-                    "corresponds to the local rank's (single GPU) result.",
-                    RuntimeWarning,
-                )
-
         self._average = average
         self._true_positives = None
         self._positives = None
@@ -38,22 +27,29 @@ class _BasePrecisionRecall(_BaseClassification):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        dtype = torch.float64
-        self._true_positives = torch.tensor([], dtype=dtype) if (self._is_multilabel and not self._average) else 0
-        self._positives = torch.tensor([], dtype=dtype) if (self._is_multilabel and not self._average) else 0
+        self._true_positives = 0
+        self._positives = 0
         super(_BasePrecisionRecall, self).reset()
 
+    @staticmethod
+    def _count_true_positives(indices: torch.Tensor, y: torch.Tensor, num_classes: int) -> torch.Tensor:
+        # wrong predictions are counted in an extra bin which is dropped
+        correct = torch.where(indices == y, y, torch.full_like(y, num_classes))
+        return torch.bincount(correct, minlength=num_classes + 1)[:num_classes].to(torch.float64)
+
+    def _reducible_attrs(self) -> Tuple[str, ...]:
+        return ("_true_positives", "_positives")
+
     def compute(self) -> torch.Tensor:
         if not (isinstance(self._positives, torch.Tensor) or self._positives > 0):
             raise NotComputableError(
                 "{} must have at least one example before" " it can be computed.".format(self.__class__.__name__)
             )
 
-        if not (self._type == "multilabel" and not self._average):
-            if not self._is_reduced:
-                self._true_positives = self._sync_all_reduce(self._true_positives)
-                self._positives = self._sync_all_reduce(self._positives)
-                self._is_reduced = True
+        if not self._is_reduced:
+            self._true_positives = self._sync_all_reduce(self._true_positives)
+            self._positives = self._sync_all_reduce(self._positives)
+            self._is_reduced = True
 
         result = self._true_positives / (self._positives + self.eps)
 
@@ -93,17 +89,9 @@ class Precision(_BasePrecisionRecall):
         F1 = precision * recall * 2 / (precision + recall + 1e-20)
         F1 = MetricsLambda(lambda t: torch.mean(t).item(), F1)
 
-    .. warning::
-
-        In multilabel cases, if average is False, current implementation stores all input data (output and target) in
-        as tensors before computing a metric. This can potentially lead to a memory error if the input data is larger
-        than available RAM.
-
-    .. warning::
-
-        In multilabel cases, if average is False, current implementation does not work with distributed computations.
-        Results are not reduced across the GPUs. Computed result corresponds to the local rank's (single GPU) result.
-
+    In multilabel cases, if average is False, the metric is computed for each class from per-class counts of true
+    positives and predicted positives. Only these two tensors of size `num_categories` are stored and they are
+    reduced across processes in distributed computations.
 
     Args:
         output_transform (callable, optional): a callable that is used to transform the
@@ -112,8 +100,9 @@ class Precision(_BasePrecisionRecall):
             you want to compute the metric with respect to one of the outputs.
         average (bool, optional): if True, precision is computed as the unweighted average (across all classes
             in multiclass case), otherwise, returns a tensor with the precision (for each class in multiclass case).
-        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True, average
-            parameter should be True and the average is computed across samples, instead of classes.
+        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True and
+            average is True, the average is computed across samples, instead of classes. If True and average is False,
+            returns a tensor with the precision for each class.
         device (str of torch.device, optional): device specification in case of distributed computation usage.
             In most of the cases, it can be defined as "cuda:local_rank" or "cuda"
             if already set `torch.cuda.set_device(local_rank)`. By default, if a distributed process group is
@@ -135,7 +124,7 @@ class Precision(_BasePrecisionRecall):
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
         y_pred, y = output
-        self._check_shape(output)
+        self._check_once(self._check_shape, (y_pred, y), self._is_multilabel)
         self._check_type((y_pred, y))
 
         if self._type == "binary":
@@ -148,14 +137,27 @@ class Precision(_BasePrecisionRecall):
                     "y_pred contains less classes than y. Number of predicted classes is {}"
                     " and element in y has invalid class = {}.".format(num_classes, y.max().item() + 1)
                 )
-            y = to_onehot(y.view(-1), num_classes=num_classes)
+            # per-class counts are computed without one-hot encoding, in O(N + C) memory on input device
+            y = y.view(-1)
             indices = torch.argmax(y_pred, dim=1).view(-1)
-            y_pred = to_onehot(indices, num_classes=num_classes)
+            true_positives = self._count_true_positives(indices, y, num_classes)
+            all_positives = torch.bincount(indices, minlength=num_classes).to(torch.float64)
+            self._true_positives += true_positives
+            self._positives += all_positives
+            return
         elif self._type == "multilabel":
             # if y, y_pred shape is (N, C, ...) -> (C, N x ...)
             num_classes = y_pred.size(1)
             y_pred = torch.transpose(y_pred, 1, 0).reshape(num_classes, -1)
             y = torch.transpose(y, 1, 0).reshape(num_classes, -1)
+            if not self._average:
+                # per-class counts keep a fixed O(C) state which is summed across processes
+                y = y.to(y_pred)
+                true_positives = (y * y_pred).sum(dim=1).to(torch.float64)
+                all_positives = y_pred.sum(dim=1).to(torch.float64)
+                self._true_positives += true_positives
+                self._positives += all_positives
+                return
 
         y = y.to(y_pred)
         correct = y * y_pred
@@ -170,12 +172,8 @@ class Precision(_BasePrecisionRecall):
         true_positives = true_positives.type(torch.DoubleTensor)
 
         if self._type == "multilabel":
-            if not self._average:
-                self._true_positives = torch.cat([self._true_positives, true_positives], dim=0)
-                self._positives = torch.cat([self._positives, all_positives], dim=0)
-            else:
-                self._true_positives += torch.sum(true_positives / (all_positives + self.eps))
-                self._positives += len(all_positives)
+            self._true_positives += torch.sum(true_positives / (all_positives + self.eps))
+            self._positives += len(all_positives)
         else:
             self._true_positives += true_positives
             self._positives += all_positives
@@ -4,7 +4,6 @@ import torch
 
 from ignite.metrics.metric import reinit__is_reduced
 from ignite.metrics.precision import _BasePrecisionRecall
-from ignite.utils import to_onehot
 
 __all__ = ["Recall"]
 
@@ -39,17 +38,9 @@ class Recall(_BasePrecisionRecall):
         F1 = precision * recall * 2 / (precision + recall + 1e-20)
         F1 = MetricsLambda(lambda t: torch.mean(t).item(), F1)
 
-    .. warning::
-
-        In multilabel cases, if average is False, current implementation stores all input data (output and target) in
-        as tensors before computing a metric. This can potentially lead to a memory error if the input data is larger
-        than available RAM.
-
-    .. warning::
-
-        In multilabel cases, if average is False, current implementation does not work with distributed computations.
-        Results are not reduced across the GPUs. Computed result corresponds to the local rank's (single GPU) result.
-
+    In multilabel cases, if average is False, the metric is computed for each class from per-class counts of true
+    positives and actual positives. Only these two tensors of size `num_categories` are stored and they are
+    reduced across processes in distributed computations.
 
     Args:
         output_transform (callable, optional): a callable that is used to transform the
@@ -58,8 +49,9 @@ class Recall(_BasePrecisionRecall):
             you want to compute the metric with respect to one of the outputs.
         average (bool, optional): if True, precision is computed as the unweighted average (across all classes
             in multiclass case), otherwise, returns a tensor with the precision (for each class in multiclass case).
-        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True, average
-            parameter should be True and the average is computed across samples, instead of classes.
+        is_multilabel (bool, optional) flag to use in multilabel case. By default, value is False. If True and
+            average is True, the average is computed across samples, instead of classes. If True and average is False,
+            returns a tensor with the recall for each class.
         device (str of torch.device, optional): device specification in case of distributed computation usage.
             In most of the cases, it can be defined as "cuda:local_rank" or "cuda"
             if already set `torch.cuda.set_device(local_rank)`. By default, if a distributed process group is
@@ -81,7 +73,7 @@ class Recall(_BasePrecisionRecall):
     @reinit__is_reduced
     def update(self, output: Sequence[torch.Tensor]) -> None:
         y_pred, y = output
-        self._check_shape(output)
+        self._check_once(self._check_shape, (y_pred, y), self._is_multilabel)
         self._check_type((y_pred, y))
 
         if self._type == "binary":
@@ -94,14 +86,27 @@ class Recall(_BasePrecisionRecall):
                     "y_pred contains less classes than y. Number of predicted classes is {}"
                     " and element in y has invalid class = {}.".format(num_classes, y.max().item() + 1)
                 )
-            y = to_onehot(y.view(-1), num_classes=num_classes)
+            # per-class counts are computed without one-hot encoding, in O(N + C) memory on input device
+            y = y.view(-1)
             indices = torch.argmax(y_pred, dim=1).view(-1)
-            y_pred = to_onehot(indices, num_classes=num_classes)
+            true_positives = self._count_true_positives(indices, y, num_classes)
+            actual_positives = torch.bincount(y, minlength=num_classes).to(torch.float64)
+            self._true_positives += true_positives
+            self._positives += actual_positives
+            return
         elif self._type == "multilabel":
             # if y, y_pred shape is (N, C, ...) -> (C, N x ...)
             num_classes = y_pred.size(1)
             y_pred = torch.transpose(y_pred, 1, 0).reshape(num_classes, -1)
             y = torch.transpose(y, 1, 0).reshape(num_classes, -1)
+            if not self._average:
+                # per-class counts keep a fixed O(C) state which is summed across processes
+                y = y.type_as(y_pred)
+                true_positives = (y * y_pred).sum(dim=1).to(torch.float64)
+                actual_positives = y.sum(dim=1).to(torch.float64)
+                self._true_positives += true_positives
+                self._positives += actual_positives
+                return
 
         y = y.type_as(y_pred)
         correct = y * y_pred
@@ -117,12 +122,8 @@ class Recall(_BasePrecisionRecall):
         true_positives = true_positives.type(torch.DoubleTensor)
 
         if self._type == "multilabel":
-            if not self._average:
-                self._true_positives = torch.cat([self._true_positives, true_positives], dim=0)
-                self._positives = torch.cat([self._positives, actual_positives], dim=0)
-            else:
-                self._true_positives += torch.sum(true_positives / (actual_positives + self.eps))
-                self._positives += len(actual_positives)
+            self._true_positives += torch.sum(true_positives / (actual_positives + self.eps))
+            self._positives += len(actual_positives)
         else:
             self._true_positives += true_positives
             self._positives += actual_positives
@@ -1,9 +1,11 @@
-from typing import Callable, Optional, Sequence, Union
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 import torch
+import torch.distributed as dist
 
 from ignite.engine import Engine, Events
-from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
+from ignite.metrics.metric import Metric, reinit__is_reduced
+from ignite.metrics.metric_group import _add_running_metric, _reduce_running_metrics
 
 __all__ = ["RunningAverage"]
 
@@ -24,6 +26,12 @@ class RunningAverage(Metric):
             In most of the cases, it can be defined as "cuda:local_rank" or "cuda"
             if already set `torch.cuda.set_device(local_rank)`. By default, if a distributed process group is
             initialized and available, device is set to `cuda`.
+        sync_every (int, optional): when running average is computed on the output of process function in
+            distributed configuration, the running average is kept locally on each process and summed across
+            processes only every `sync_every` iterations. In between, the last synchronized value is returned. This
+            should be set to the period of the consumers of the value (e.g. a progress bar or a logger). Running
+            averages and :class:`~ignite.metrics.Frequency` metrics of the same engine synchronized at the same
+            iteration are reduced together. Default is 1. It should be 1 if `src` is a Metric.
 
     Examples:
 
@@ -52,17 +60,22 @@ class RunningAverage(Metric):
         output_transform: Optional[Callable] = None,
         epoch_bound: bool = True,
         device: Optional[Union[str, torch.device]] = None,
+        sync_every: int = 1,
     ):
         if not (isinstance(src, Metric) or src is None):
             raise TypeError("Argument src should be a Metric or None.")
         if not (0.0 < alpha <= 1.0):
             raise ValueError("Argument alpha should be a float between 0.0 and 1.0.")
+        if not (isinstance(sync_every, int) and sync_every > 0):
+            raise ValueError("Argument sync_every should be a positive integer, but given {}".format(sync_every))
 
         if isinstance(src, Metric):
             if output_transform is not None:
                 raise ValueError("Argument output_transform should be None if src is a Metric.")
             if device is not None:
                 raise ValueError("Argument device should be None if src is a Metric.")
+            if sync_every != 1:
+                raise ValueError("Argument sync_every should be 1 if src is a Metric.")
             self.src = src
             self._get_src_value = self._get_metric_value
             self.iteration_completed = self._metric_iteration_completed
@@ -72,16 +85,19 @@ class RunningAverage(Metric):
                     "Argument output_transform should not be None if src corresponds "
                     "to the output of process function."
                 )
-            self._get_src_value = self._get_output_value
+            self.src = None
             self.update = self._output_update
+            self.compute = self._output_compute
 
         self.alpha = alpha
         self.epoch_bound = epoch_bound
+        self.sync_every = sync_every
         super(RunningAverage, self).__init__(output_transform=output_transform, device=device)
 
     @reinit__is_reduced
     def reset(self) -> None:
         self._value = None
+        self._synced_value = None
 
     @reinit__is_reduced
     def update(self, output: Sequence) -> None:
@@ -100,17 +116,47 @@ class RunningAverage(Metric):
         if self.epoch_bound:
             # restart average every epoch
             engine.add_event_handler(Events.EPOCH_STARTED, self.started)
-        # compute metric
-        engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        if isinstance(self.src, Metric):
+            # compute metric
+            engine.add_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+        else:
+            # outputs of all running metrics are accumulated before any of them is read and synchronized
+            engine._add_first_event_handler(Events.ITERATION_COMPLETED, self.iteration_completed)
+            _add_running_metric(engine, self)
         # apply running average
         engine.add_event_handler(Events.ITERATION_COMPLETED, self.completed, name)
 
+    def completed(self, engine: Engine, name: str) -> None:
+        _reduce_running_metrics(engine)
+        super(RunningAverage, self).completed(engine, name)
+
     def _get_metric_value(self) -> Union[torch.Tensor, float]:
         return self.src.compute()
 
-    @sync_all_reduce("src")
-    def _get_output_value(self) -> Union[torch.Tensor, float]:
-        return self.src
+    def _reducible_attrs(self) -> Tuple[str, ...]:
+        if isinstance(self.src, Metric):
+            return ()
+        return ("_synced_value",)
+
+    def _prepare_running_reduction(self, engine: Engine) -> bool:
+        # the first value and every `sync_every`-th iteration are synchronized, identically on all processes
+        if isinstance(self.src, Metric) or self._is_reduced or self._value is None:
+            return False
+        if self._synced_value is not None and engine.state.iteration % self.sync_every != 0:
+            return False
+        self._synced_value = self._value
+        return True
+
+    def _output_compute(self) -> Union[torch.Tensor, float]:
+        if not (dist.is_available() and dist.is_initialized()):
+            return self._value
+
+        if self._synced_value is None:
+            # running average is read before being synchronized, e.g. outside of an engine
+            value = self._value.clone() if isinstance(self._value, torch.Tensor) else self._value
+            self._synced_value = self._sync_all_reduce(value)
+            self._is_reduced = True
+        return self._synced_value
 
     def _metric_iteration_completed(self, engine: Engine) -> None:
         self.src.started(engine)
@@ -119,5 +165,9 @@ class RunningAverage(Metric):
     @reinit__is_reduced
     def _output_update(self, output: Union[torch.Tensor, float]) -> None:
         if isinstance(output, torch.Tensor):
-            output = output.detach().clone()
-        self.src = output
+            output = output.detach()
+        # running average of local values, summed across processes only when read
+        if self._value is None:
+            self._value = output.clone() if isinstance(output, torch.Tensor) else output
+        else:
+            self._value = self._value * self.alpha + (1.0 - self.alpha) * output
@@ -1,9 +1,17 @@
+import json
 import os
+import random
 import time
 
+import pytest
 from pytest import approx
 
-from ignite.contrib.handlers.time_profilers import BasicTimeProfiler
+from ignite.contrib.handlers.time_profilers import (
+    BasicTimeProfiler,
+    StreamingTimeProfiler,
+    TraceProfiler,
+    _StreamingStats,
+)
 from ignite.engine import Engine, Events
 
 
@@ -11,8 +19,8 @@ def _do_nothing_update_fn(engine, batch):
     pass
 
 
-def get_prepared_engine(true_event_handler_time):
-    dummy_trainer = Engine(_do_nothing_update_fn)
+def get_prepared_engine(true_event_handler_time, compile_event_handlers=False):
+    dummy_trainer = Engine(_do_nothing_update_fn, compile_event_handlers=compile_event_handlers)
 
     @dummy_trainer.on(Events.STARTED)
     def delay_start(engine):
@@ -391,3 +399,315 @@ def test_get_intermediate_results_during_run(capsys):
         assert " min/index: (0.0, " not in out, out
 
     dummy_trainer.run(range(true_num_iters), max_epochs=true_max_epochs)
+
+
+def test_streaming_stats():
+    random.seed(12)
+    data = [random.lognormvariate(-5, 1) for _ in range(10000)]
+    stats = _StreamingStats(relative_accuracy=0.01)
+    for x in data:
+        stats.update(x)
+
+    mean = sum(data) / len(data)
+    std = (sum([(x - mean) ** 2 for x in data]) / (len(data) - 1)) ** 0.5
+    assert stats.count == len(data)
+    assert stats.total == approx(sum(data))
+    assert stats.mean == approx(mean)
+    assert stats.std == approx(std)
+    assert stats.min == min(data)
+    assert stats.max == max(data)
+
+    data = sorted(data)
+    for q in [50, 90, 99]:
+        assert stats.percentile(q) == approx(data[int(q / 100 * (len(data) - 1))], rel=0.02)
+
+
+def test_streaming_wrong_inputs():
+    with pytest.raises(ValueError, match=r"Argument history_size should be a non-negative integer"):
+        StreamingTimeProfiler(history_size=-1)
+
+    with pytest.raises(ValueError, match=r"Argument relative_accuracy should be in"):
+        StreamingTimeProfiler(relative_accuracy=0.0)
+
+    with pytest.raises(TypeError, match=r"Argument engine should be ignite.engine.Engine"):
+        StreamingTimeProfiler().attach(None)
+
+
+def test_streaming_handlers_stats():
+    true_event_handler_time = 0.0125
+    true_max_epochs = 2
+    true_num_iters = 4
+
+    profiler = StreamingTimeProfiler()
+    dummy_trainer = get_prepared_engine(true_event_handler_time)
+
+    @dummy_trainer.on(Events.ITERATION_COMPLETED(every=2))
+    def delay_iter_complete_every(engine):
+        time.sleep(2 * true_event_handler_time)
+
+    @dummy_trainer.on(Events.EPOCH_COMPLETED)
+    def check_handlers(engine):
+        assert engine.has_event_handler(delay_iter_complete_every, Events.ITERATION_COMPLETED)
+        assert engine.has_event_handler(check_handlers, Events.EPOCH_COMPLETED)
+
+    handlers = {e: list(h) for e, h in dummy_trainer._event_handlers.items() if len(h) > 0}
+    profiler.attach(dummy_trainer)
+    dummy_trainer.run(range(true_num_iters), max_epochs=true_max_epochs)
+
+    # original handlers are restored
+    profiler.detach(dummy_trainer)
+    assert {e: h for e, h in dummy_trainer._event_handlers.items() if len(h) > 0} == handlers
+
+    results = profiler.get_results()
+    handlers_stats = results["handlers_stats"]
+    iter_completed = handlers_stats["ITERATION_COMPLETED"]
+    assert list(iter_completed.keys()) == [
+        "get_prepared_engine.<locals>.delay_iter_complete",
+        "test_streaming_handlers_stats.<locals>.delay_iter_complete_every",
+    ]
+    total_iters = true_max_epochs * true_num_iters
+    assert iter_completed["get_prepared_engine.<locals>.delay_iter_complete"]["count"] == total_iters
+    every_stats = iter_completed["test_streaming_handlers_stats.<locals>.delay_iter_complete_every"]
+    assert every_stats["count"] == total_iters // 2
+    assert every_stats["mean"] == approx(2 * true_event_handler_time, abs=1e-2)
+
+    event_results = results["event_handlers_stats"]
+    assert event_results["ITERATION_COMPLETED"]["count"] == total_iters
+    assert event_results["ITERATION_COMPLETED"]["total"] == approx(
+        (total_iters + total_iters) * true_event_handler_time, abs=1e-1
+    )
+    assert event_results["EPOCH_STARTED"]["count"] == true_max_epochs
+    assert event_results["STARTED"]["total"] == approx(true_event_handler_time, abs=1e-2)
+    assert event_results["COMPLETED"]["total"] == approx(true_event_handler_time, abs=1e-2)
+    assert results["processing_stats"]["count"] == total_iters
+    assert results["dataflow_stats"]["count"] == total_iters
+
+
+def test_streaming_compiled_event_handlers():
+    true_event_handler_time = 0.0125
+    true_max_epochs = 2
+    true_num_iters = 4
+
+    profiler = StreamingTimeProfiler()
+    dummy_trainer = get_prepared_engine(true_event_handler_time, compile_event_handlers=True)
+    profiler.attach(dummy_trainer)
+
+    for _ in range(2):
+        dummy_trainer.run(range(true_num_iters), max_epochs=true_max_epochs)
+
+        results = profiler.get_results()
+        started_stats = results["handlers_stats"]["STARTED"]
+        assert list(started_stats.keys()) == ["get_prepared_engine.<locals>.delay_start"]
+        assert started_stats["get_prepared_engine.<locals>.delay_start"]["count"] == 1
+        event_results = results["event_handlers_stats"]
+        assert event_results["STARTED"]["total"] == approx(true_event_handler_time, abs=1e-2)
+        assert event_results["ITERATION_COMPLETED"]["count"] == true_max_epochs * true_num_iters
+        assert event_results["COMPLETED"]["total"] == approx(true_event_handler_time, abs=1e-2)
+
+
+def test_streaming_data_without_length(dirname):
+    def data_iter(n):
+        for i in range(n):
+            time.sleep(0.01)
+            yield i
+
+    def update_fn(engine, batch):
+        time.sleep(0.02)
+
+    trainer = Engine(update_fn)
+    profiler = StreamingTimeProfiler(history_size=3)
+    profiler.attach(trainer)
+    trainer.run(data_iter(10))
+
+    results = profiler.get_results()
+    assert results["processing_stats"]["count"] == 10
+    assert results["processing_stats"]["mean"] == approx(0.02, abs=1e-2)
+    assert results["dataflow_stats"]["count"] == 10
+    assert results["dataflow_stats"]["mean"] == approx(0.01, abs=1e-2)
+    assert [h[1] for h in profiler.history] == [8, 9, 10]
+
+    fp = os.path.join(dirname, "test_log.csv")
+    profiler.write_results(fp)
+    with open(fp) as f:
+        assert len(f.readlines()) == 3 + 1
+
+
+def test_streaming_print_results(capsys):
+    profiler = StreamingTimeProfiler()
+    dummy_trainer = get_prepared_engine(true_event_handler_time=0.0125)
+    profiler.attach(dummy_trainer)
+
+    @dummy_trainer.on(Events.ITERATION_COMPLETED(every=3))
+    def log_results(_):
+        profiler.print_results(profiler.get_results())
+
+    dummy_trainer.run(range(5), max_epochs=1)
+    StreamingTimeProfiler.print_results(profiler.get_results())
+
+    captured = capsys.readouterr()
+    out = captured.out
+    assert "StreamingTimeProfiler._" not in out
+    assert "get_prepared_engine.<locals>.delay_iter_complete" in out
+    assert "nan" not in out
+
+
+def test_streaming_run_interrupted():
+    interrupted = [False]
+
+    def update_fn(engine, batch):
+        if not interrupted[0] and engine.state.iteration == 2:
+            interrupted[0] = True
+            raise RuntimeError("Interrupted")
+
+    trainer = Engine(update_fn)
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def handler(_):
+        pass
+
+    profiler = StreamingTimeProfiler()
+    profiler.attach(trainer)
+    with pytest.raises(RuntimeError, match=r"Interrupted"):
+        trainer.run(range(3), max_epochs=2)
+
+    trainer.state = None
+    trainer.run(range(3), max_epochs=2)
+    results = profiler.get_results()
+    assert results["handlers_stats"]["ITERATION_COMPLETED"]["test_streaming_run_interrupted.<locals>.handler"][
+        "count"
+    ] == 6
+    assert trainer._event_handlers[Events.ITERATION_COMPLETED] == [(handler, (trainer,), {})]
+
+
+def _get_spans(trace, name=None, cat=None):
+    return [
+        e
+        for e in trace["traceEvents"]
+        if (name is None or e["name"] == name) and (cat is None or e["cat"] == cat)
+    ]
+
+
+def test_trace_wrong_inputs():
+    with pytest.raises(ValueError, match=r"Argument every should be a positive integer"):
+        TraceProfiler(every=0)
+
+    with pytest.raises(ValueError, match=r"Argument max_spans should be a positive integer"):
+        TraceProfiler(max_spans=0)
+
+    with pytest.raises(TypeError, match=r"Argument engine should be ignite.engine.Engine"):
+        TraceProfiler().attach(None)
+
+
+def test_trace_profiler(dirname):
+    true_event_handler_time = 0.01
+    true_max_epochs = 2
+    true_num_iters = 3
+
+    profiler = TraceProfiler()
+    dummy_trainer = get_prepared_engine(true_event_handler_time)
+    handlers = {e: list(h) for e, h in dummy_trainer._event_handlers.items() if len(h) > 0}
+    profiler.attach(dummy_trainer, name="trainer")
+    dummy_trainer.run(range(true_num_iters), max_epochs=true_max_epochs)
+
+    trace = profiler.get_results()
+    total_iters = true_max_epochs * true_num_iters
+    assert all([e["ph"] == "X" and e["cat"] == "trainer" and e["dur"] >= 0 for e in trace["traceEvents"]])
+    assert len(_get_spans(trace, "process_function")) == total_iters
+    assert len(_get_spans(trace, "dataflow")) == total_iters
+    assert len(_get_spans(trace, "Events.ITERATION_COMPLETED")) == total_iters
+    assert len(_get_spans(trace, "Events.EPOCH_STARTED")) == true_max_epochs
+    assert len(_get_spans(trace, "Events.STARTED")) == 1
+    assert len(_get_spans(trace, "Events.COMPLETED")) == 1
+
+    handler_spans = _get_spans(trace, "get_prepared_engine.<locals>.delay_epoch_complete")
+    assert len(handler_spans) == true_max_epochs
+    assert handler_spans[0]["dur"] == approx(true_event_handler_time * 1e6, abs=1e4)
+
+    # handler spans are nested in the span of their event
+    event_spans = _get_spans(trace, "Events.EPOCH_COMPLETED")
+    for h, e in zip(handler_spans, event_spans):
+        assert e["ts"] <= h["ts"] and h["ts"] + h["dur"] <= e["ts"] + e["dur"]
+
+    # original handlers are restored
+    profiler.detach(dummy_trainer)
+    assert {e: h for e, h in dummy_trainer._event_handlers.items() if len(h) > 0} == handlers
+
+    fp = os.path.join(dirname, "trace.json")
+    profiler.write_results(fp)
+    with open(fp) as f:
+        assert len(json.load(f)["traceEvents"]) == len(trace["traceEvents"])
+
+
+def test_trace_profiler_compiled_event_handlers():
+    true_event_handler_time = 0.01
+
+    profiler = TraceProfiler()
+    dummy_trainer = get_prepared_engine(true_event_handler_time, compile_event_handlers=True)
+    profiler.attach(dummy_trainer, name="trainer")
+    dummy_trainer.run(range(3), max_epochs=2)
+
+    trace = profiler.get_results()
+    event_spans = _get_spans(trace, "Events.STARTED")
+    handler_spans = _get_spans(trace, "get_prepared_engine.<locals>.delay_start")
+    assert len(event_spans) == len(handler_spans) == 1
+    assert handler_spans[0]["dur"] == approx(true_event_handler_time * 1e6, abs=1e4)
+    assert event_spans[0]["ts"] <= handler_spans[0]["ts"]
+    assert handler_spans[0]["ts"] + handler_spans[0]["dur"] <= event_spans[0]["ts"] + event_spans[0]["dur"]
+    assert len(_get_spans(trace, "get_prepared_engine.<locals>.delay_epoch_complete")) == 2
+    assert len(_get_spans(trace, "Events.COMPLETED")) == 1
+
+
+def test_trace_profiler_nested_engines():
+    trainer = Engine(_do_nothing_update_fn)
+    evaluator = Engine(_do_nothing_update_fn)
+
+    @trainer.on(Events.EPOCH_COMPLETED)
+    def run_validation(_):
+        evaluator.run(range(2))
+
+    profiler = TraceProfiler()
+    profiler.attach(trainer, name="trainer")
+    profiler.attach(evaluator, name="evaluator")
+    trainer.run(range(3), max_epochs=2)
+
+    trace = profiler.get_results()
+    handler_spans = _get_spans(trace, "test_trace_profiler_nested_engines.<locals>.run_validation", cat="trainer")
+    evaluator_spans = _get_spans(trace, "Events.STARTED", cat="evaluator")
+    assert len(handler_spans) == len(evaluator_spans) == 2
+    assert len(_get_spans(trace, "process_function", cat="evaluator")) == 2 * 2
+    for h, e in zip(handler_spans, evaluator_spans):
+        assert h["tid"] == e["tid"]
+        assert h["ts"] <= e["ts"] and e["ts"] + e["dur"] <= h["ts"] + h["dur"]
+
+
+def test_trace_profiler_every():
+    trainer = Engine(_do_nothing_update_fn)
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def handler(_):
+        pass
+
+    profiler = TraceProfiler(every=2)
+    profiler.attach(trainer)
+    trainer.run(range(6), max_epochs=1)
+
+    trace = profiler.get_results()
+    assert len(_get_spans(trace, "process_function")) == 3
+    assert len(_get_spans(trace, "dataflow")) == 3
+    assert len(_get_spans(trace, "Events.GET_BATCH_STARTED")) == 3
+    assert len(_get_spans(trace, "Events.ITERATION_COMPLETED")) == 3
+    assert len(_get_spans(trace, "test_trace_profiler_every.<locals>.handler")) == 3
+    assert len(_get_spans(trace, "Events.EPOCH_COMPLETED")) == 1
+
+
+def test_trace_profiler_max_spans():
+    trainer = Engine(_do_nothing_update_fn)
+    profiler = TraceProfiler(max_spans=5)
+    profiler.attach(trainer)
+    trainer.run(range(10), max_epochs=1)
+
+    trace = profiler.get_results()
+    assert len(trace["traceEvents"]) == 5
+    assert trace["otherData"]["num_dropped"] > 0
+    # oldest spans are dropped
+    assert _get_spans(trace, "Events.COMPLETED")[0] == trace["traceEvents"][-1]
@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 import torch
 
-from ignite.contrib.metrics.regression._base import _BaseRegression, _BaseRegressionEpoch
+from ignite.contrib.metrics.regression._base import _BaseRegression, _BaseRegressionEpoch, _QuantileSketch
 
 
 def test_base_regression_shapes():
@@ -84,3 +84,44 @@ def test_base_regression_compute_fn():
     # Wrong compute function
     with pytest.raises(TypeError):
         _BaseRegressionEpoch(12345)
+
+
+@pytest.mark.parametrize("k, tol", [(100, 0.03), (200, 0.01), (1000, 0.003)])
+def test_quantile_sketch(k, tol):
+    torch.manual_seed(12)
+    x = torch.randn(50000)
+
+    sketch = _QuantileSketch(k)
+    for chunk in x.split(100):
+        sketch.update(chunk)
+
+    # memory is bounded
+    assert sketch.num_items() < 2 * k
+    for q in [0.1, 0.5, 0.9]:
+        rank = (x < sketch.quantile(q)).double().mean().item()
+        assert rank == pytest.approx(q, abs=tol)
+
+
+def test_quantile_sketch_exact_on_small_data():
+    x = torch.rand(51)
+    sketch = _QuantileSketch(100)
+    sketch.update(x)
+    assert sketch.quantile(0.5) == torch.median(x).item()
+
+
+def test_quantile_sketch_merge():
+    torch.manual_seed(12)
+    x = torch.randn(20000)
+
+    sketches = [_QuantileSketch(200) for _ in range(4)]
+    for sketch, part in zip(sketches, x.chunk(4)):
+        for chunk in part.split(100):
+            sketch.update(chunk)
+
+    merged = _QuantileSketch(200)
+    for sketch in sketches:
+        merged.merge(sketch._levels)
+
+    assert merged.num_items() < 400
+    rank = (x < merged.quantile(0.5)).double().mean().item()
+    assert rank == pytest.approx(0.5, abs=0.01)
@@ -1,9 +1,12 @@
+import os
+
 import numpy as np
 import pytest
 import torch
 
 from ignite.contrib.metrics.regression import MedianAbsoluteError
 from ignite.engine import Engine
+from ignite.exceptions import NotComputableError
 
 
 def test_wrong_input_shapes():
@@ -93,3 +96,106 @@ def test_integration_median_absolute_error_with_output_transform():
     median_absolute_error = engine.run(data, max_epochs=1).metrics["median_absolute_error"]
 
     assert np_median_absolute_error == pytest.approx(median_absolute_error)
+
+
+def test_median_absolute_error_wrong_sketch_size():
+    with pytest.raises(ValueError, match=r"Argument sketch_size should be an integer greater than 1"):
+        MedianAbsoluteError(sketch_size=1)
+
+    with pytest.raises(ValueError, match=r"Arguments sketch_size and mmap_dir are mutually exclusive"):
+        MedianAbsoluteError(sketch_size=100, mmap_dir=".")
+
+
+def test_median_absolute_error_sketch():
+    np.random.seed(1)
+    size = 20000
+    np_y_pred = np.random.rand(size, 1)
+    np_y = np.random.rand(size, 1)
+    np_errors = np.abs(np_y - np_y_pred)
+
+    m = MedianAbsoluteError(sketch_size=500)
+    y_pred = torch.from_numpy(np_y_pred)
+    y = torch.from_numpy(np_y)
+
+    batch_size = 100
+    for i in range(0, size, batch_size):
+        m.update((y_pred[i : i + batch_size], y[i : i + batch_size]))
+
+    # rank of the approximated median is close to 0.5
+    assert np.mean(np_errors < m.compute()) == pytest.approx(0.5, abs=0.005)
+
+
+def test_median_absolute_error_mmap(tmpdir):
+    size = 51
+    np_y_pred = np.random.rand(size,)
+    np_y = np.random.rand(size,)
+    np_median_absolute_error = np.median(np.abs(np_y - np_y_pred))
+
+    m = MedianAbsoluteError(mmap_dir=str(tmpdir))
+    m.update((torch.from_numpy(np_y_pred), torch.from_numpy(np_y)))
+
+    assert np_median_absolute_error == pytest.approx(m.compute())
+
+
+def _test_distrib_sketch(device):
+    import torch.distributed as dist
+
+    rank = dist.get_rank()
+    world_size = dist.get_world_size()
+
+    torch.manual_seed(12)
+    size = 5000
+    y_pred = torch.rand(size * world_size, 1)
+    y = torch.rand(size * world_size, 1)
+    errors = torch.abs(y - y_pred)
+
+    m = MedianAbsoluteError(sketch_size=500, device=device)
+    local = slice(rank * size, (rank + 1) * size)
+    for i in range(0, size, 100):
+        m.update((y_pred[local][i : i + 100].to(device), y[local][i : i + 100].to(device)))
+
+    assert (errors < m.compute()).double().mean().item() == pytest.approx(0.5, abs=0.01)
+
+    # exact mode gathers all data
+    m = MedianAbsoluteError(device=device)
+    m.update((y_pred[local].to(device), y[local].to(device)))
+    assert m.compute() == pytest.approx(torch.median(errors).item())
+
+    # processes without examples join the gather
+    m = MedianAbsoluteError(sketch_size=500, device=device)
+    if rank == 0:
+        m.update((y_pred.to(device), y.to(device)))
+    assert (errors < m.compute()).double().mean().item() == pytest.approx(0.5, abs=0.01)
+
+    m = MedianAbsoluteError(sketch_size=500, device=device)
+    with pytest.raises(NotComputableError, match=r"MedianAbsoluteError must have at least one example"):
+        m.compute()
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
+
+    device = "cuda:{}".format(local_rank)
+    _test_distrib_sketch(device)
+
+
+@pytest.mark.distributed
+def test_distrib_cpu(distributed_context_single_node_gloo):
+
+    device = "cpu"
+    _test_distrib_sketch(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
+    device = "cpu"
+    _test_distrib_sketch(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("GPU_MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
+    device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
+    _test_distrib_sketch(device)
@@ -1,8 +1,9 @@
 import numpy as np
+import pytest
 import torch
 from sklearn.metrics import average_precision_score
 
-from ignite.contrib.metrics import AveragePrecision
+from ignite.contrib.metrics import AveragePrecision, BinnedAveragePrecision
 from ignite.engine import Engine
 
 
@@ -109,3 +110,43 @@ def test_integration_ap_score_with_activated_output_transform():
     ap = engine.run(data, max_epochs=1).metrics["ap"]
 
     assert ap == np_ap
+
+
+@pytest.mark.parametrize("num_bins", [1, 10, 100])
+def test_binned_ap_score_on_quantized_predictions(num_bins):
+    torch.manual_seed(12)
+    size = 1000
+    # predictions at the center of the bins are exactly represented
+    y_pred = (torch.randint(0, num_bins, size=(size, 1)).double() + 0.5) / num_bins
+    y = torch.randint(0, 2, size=(size, 1))
+    np_ap = average_precision_score(y.numpy(), y_pred.numpy())
+
+    ap_metric = BinnedAveragePrecision(num_bins=num_bins)
+    for i in range(0, size, 100):
+        ap_metric.update((y_pred[i : i + 100], y[i : i + 100]))
+
+    assert ap_metric.compute() == pytest.approx(np_ap)
+
+
+def test_integration_binned_ap_score():
+    np.random.seed(1)
+    size = 10000
+    np_y_pred = np.random.rand(size)
+    np_y = (np.random.rand(size) < np_y_pred).astype(np.int64)
+    np_ap = average_precision_score(np_y, np_y_pred)
+
+    batch_size = 100
+
+    def update_fn(engine, batch):
+        idx = (engine.state.iteration - 1) * batch_size
+        return torch.from_numpy(np_y_pred[idx : idx + batch_size]), torch.from_numpy(np_y[idx : idx + batch_size])
+
+    engine = Engine(update_fn)
+
+    ap_metric = BinnedAveragePrecision(num_bins=1000)
+    ap_metric.attach(engine, "ap")
+
+    data = list(range(size // batch_size))
+    ap = engine.run(data, max_epochs=1).metrics["ap"]
+
+    assert ap == pytest.approx(np_ap, abs=1e-3)
@@ -1,8 +1,9 @@
 import numpy as np
+import pytest
 import torch
 from sklearn.metrics import precision_recall_curve
 
-from ignite.contrib.metrics.precision_recall_curve import PrecisionRecallCurve
+from ignite.contrib.metrics.precision_recall_curve import BinnedPrecisionRecallCurve, PrecisionRecallCurve
 from ignite.engine import Engine
 
 
@@ -89,3 +90,23 @@ def test_integration_precision_recall_curve_with_activated_output_transform():
     assert np.array_equal(recall, sk_recall)
     # assert thresholds almost equal, due to numpy->torch->numpy conversion
     np.testing.assert_array_almost_equal(thresholds, sk_thresholds)
+
+
+@pytest.mark.parametrize("num_bins", [1, 10, 100])
+def test_binned_precision_recall_curve_on_quantized_predictions(num_bins):
+    torch.manual_seed(12)
+    size = 1000
+    # predictions at the center of the bins are exactly represented
+    y_pred = (torch.randint(0, num_bins, size=(size,)).double() + 0.5) / num_bins
+    y = torch.randint(0, 2, size=(size,))
+    sk_precision, sk_recall, sk_thresholds = precision_recall_curve(y.numpy(), y_pred.numpy())
+
+    pr_curve_metric = BinnedPrecisionRecallCurve(num_bins=num_bins)
+    for i in range(0, size, 100):
+        pr_curve_metric.update((y_pred[i : i + 100], y[i : i + 100]))
+    precision, recall, thresholds = pr_curve_metric.compute()
+
+    np.testing.assert_array_almost_equal(precision.numpy(), sk_precision)
+    np.testing.assert_array_almost_equal(recall.numpy(), sk_recall)
+    # thresholds are the lower edges of the bins
+    np.testing.assert_array_almost_equal(thresholds.numpy(), sk_thresholds - 0.5 / num_bins)
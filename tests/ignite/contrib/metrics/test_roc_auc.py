@@ -1,9 +1,13 @@
+import os
+
 import numpy as np
+import pytest
 import torch
 from sklearn.metrics import roc_auc_score
 
-from ignite.contrib.metrics import ROC_AUC
+from ignite.contrib.metrics import ROC_AUC, BinnedROC_AUC
 from ignite.engine import Engine
+from ignite.exceptions import NotComputableError
 
 
 def test_roc_auc_score():
@@ -110,3 +114,110 @@ def test_integration_roc_auc_score_with_activated_output_transform():
     roc_auc = engine.run(data, max_epochs=1).metrics["roc_auc"]
 
     assert roc_auc == np_roc_auc
+
+
+def test_binned_roc_auc_wrong_input():
+    with pytest.raises(ValueError, match=r"Argument num_bins should be a positive integer"):
+        BinnedROC_AUC(num_bins=0)
+
+    roc_auc_metric = BinnedROC_AUC()
+    with pytest.raises(ValueError, match=r"Input data shapes should be the same"):
+        roc_auc_metric.update((torch.rand(4), torch.randint(0, 2, size=(5,))))
+
+    with pytest.raises(ValueError, match=r"Input y_pred should have shape \(N,\) or \(N, 1\)"):
+        roc_auc_metric.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2))))
+
+    with pytest.raises(NotComputableError, match=r"must have at least one example"):
+        roc_auc_metric.compute()
+
+    roc_auc_metric.update((torch.rand(4), torch.ones(4, dtype=torch.long)))
+    with pytest.raises(NotComputableError, match=r"requires both positive and negative samples"):
+        roc_auc_metric.compute()
+
+
+@pytest.mark.parametrize("num_bins", [1, 10, 100])
+def test_binned_roc_auc_score_on_quantized_predictions(num_bins):
+
+    torch.manual_seed(12)
+    size = 1000
+    # predictions at the center of the bins are exactly represented
+    y_pred = (torch.randint(0, num_bins, size=(size, 1)).double() + 0.5) / num_bins
+    y = torch.randint(0, 2, size=(size, 1))
+    np_roc_auc = roc_auc_score(y.numpy(), y_pred.numpy())
+
+    roc_auc_metric = BinnedROC_AUC(num_bins=num_bins)
+    for i in range(0, size, 100):
+        roc_auc_metric.update((y_pred[i : i + 100], y[i : i + 100]))
+
+    assert roc_auc_metric.compute() == pytest.approx(np_roc_auc)
+
+
+def test_integration_binned_roc_auc_score():
+
+    np.random.seed(1)
+    size = 10000
+    np_y_pred = np.random.rand(size)
+    np_y = (np.random.rand(size) < np_y_pred).astype(np.int64)
+    np_roc_auc = roc_auc_score(np_y, np_y_pred)
+
+    batch_size = 100
+
+    def update_fn(engine, batch):
+        idx = (engine.state.iteration - 1) * batch_size
+        return torch.from_numpy(np_y_pred[idx : idx + batch_size]), torch.from_numpy(np_y[idx : idx + batch_size])
+
+    engine = Engine(update_fn)
+
+    roc_auc_metric = BinnedROC_AUC(num_bins=1000)
+    roc_auc_metric.attach(engine, "roc_auc")
+
+    data = list(range(size // batch_size))
+    roc_auc = engine.run(data, max_epochs=1).metrics["roc_auc"]
+
+    assert roc_auc == pytest.approx(np_roc_auc, abs=1e-4)
+
+
+def _test_distrib_binned_roc_auc(device):
+    import torch.distributed as dist
+
+    rank = dist.get_rank()
+    world_size = dist.get_world_size()
+    torch.manual_seed(12)
+    size = 200
+    y_pred = torch.rand(size * world_size, device=device)
+    y = torch.randint(0, 2, size=(size * world_size,), device=device)
+    np_roc_auc = roc_auc_score(y.cpu().numpy(), y_pred.cpu().numpy())
+
+    roc_auc_metric = BinnedROC_AUC(num_bins=10000, device=device)
+    roc_auc_metric.update((y_pred[rank * size : (rank + 1) * size], y[rank * size : (rank + 1) * size]))
+
+    assert roc_auc_metric.compute() == pytest.approx(np_roc_auc, abs=1e-3)
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
+
+    device = "cuda:{}".format(local_rank)
+    _test_distrib_binned_roc_auc(device)
+
+
+@pytest.mark.distributed
+def test_distrib_cpu(distributed_context_single_node_gloo):
+
+    device = "cpu"
+    _test_distrib_binned_roc_auc(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
+    device = "cpu"
+    _test_distrib_binned_roc_auc(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("GPU_MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
+    device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
+    _test_distrib_binned_roc_auc(device)
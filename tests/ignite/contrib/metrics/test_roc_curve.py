@@ -1,8 +1,9 @@
 import numpy as np
+import pytest
 import torch
 from sklearn.metrics import roc_curve
 
-from ignite.contrib.metrics.roc_auc import RocCurve
+from ignite.contrib.metrics.roc_auc import BinnedRocCurve, RocCurve
 from ignite.engine import Engine
 
 
@@ -89,3 +90,23 @@ def test_integration_roc_curve_with_activated_output_transform():
     assert np.array_equal(tpr, sk_tpr)
     # assert thresholds almost equal, due to numpy->torch->numpy conversion
     np.testing.assert_array_almost_equal(thresholds, sk_thresholds)
+
+
+@pytest.mark.parametrize("num_bins", [1, 10, 100])
+def test_binned_roc_curve_on_quantized_predictions(num_bins):
+    torch.manual_seed(12)
+    size = 1000
+    # predictions at the center of the bins are exactly represented
+    y_pred = (torch.randint(0, num_bins, size=(size,)).double() + 0.5) / num_bins
+    y = torch.randint(0, 2, size=(size,))
+    sk_fpr, sk_tpr, sk_thresholds = roc_curve(y.numpy(), y_pred.numpy(), drop_intermediate=False)
+
+    roc_curve_metric = BinnedRocCurve(num_bins=num_bins)
+    for i in range(0, size, 100):
+        roc_curve_metric.update((y_pred[i : i + 100], y[i : i + 100]))
+    fpr, tpr, thresholds = roc_curve_metric.compute()
+
+    np.testing.assert_array_almost_equal(fpr.numpy(), sk_fpr)
+    np.testing.assert_array_almost_equal(tpr.numpy(), sk_tpr)
+    # thresholds are the lower edges of the bins
+    np.testing.assert_array_almost_equal(thresholds[1:].numpy(), sk_thresholds[1:] - 0.5 / num_bins)
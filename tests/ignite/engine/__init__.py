@@ -32,6 +32,15 @@ class EpochCounter:
         self.current_epoch_count += 1
 
 
+class WorkerInitCounter:
+    # counts worker processes started by a dataloader, per worker id
+    def __init__(self, num_workers):
+        self.counter = torch.zeros(num_workers, dtype=torch.int64).share_memory_()
+
+    def __call__(self, worker_id):
+        self.counter[worker_id] += 1
+
+
 def setup_sampler(sampler_type, num_iters, batch_size):
     if sampler_type is None:
         return None
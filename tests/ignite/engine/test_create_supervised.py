@@ -159,3 +159,81 @@ def test_create_supervised_evaluator_with_metrics():
 
     state = evaluator.run(data)
     assert state.metrics["mse"] == 12.5
+
+
+def test_create_supervised_trainer_gradient_accumulation():
+    torch.manual_seed(12)
+    x = torch.rand(16, 4)
+    y = torch.rand(16, 1)
+
+    def _get_data(batch_size):
+        return [(x[i : i + batch_size], y[i : i + batch_size]) for i in range(0, len(x), batch_size)]
+
+    def _train(gradient_accumulation_steps, batch_size, max_epochs, as_iterator=False):
+        torch.manual_seed(0)
+        model = Linear(4, 1)
+        optimizer = SGD(model.parameters(), 0.1)
+        trainer = create_supervised_trainer(
+            model, optimizer, mse_loss, gradient_accumulation_steps=gradient_accumulation_steps
+        )
+        data = _get_data(batch_size)
+        trainer.run(iter(data) if as_iterator else data, max_epochs=max_epochs)
+        return model
+
+    def _train_manual(gradient_accumulation_steps, batch_size, max_epochs, divide_by_steps=False):
+        torch.manual_seed(0)
+        model = Linear(4, 1)
+        optimizer = SGD(model.parameters(), 0.1)
+        data = _get_data(batch_size)
+        for _ in range(max_epochs):
+            for i in range(0, len(data), gradient_accumulation_steps):
+                cycle = data[i : i + gradient_accumulation_steps]
+                n = gradient_accumulation_steps if divide_by_steps else len(cycle)
+                optimizer.zero_grad()
+                for batch_x, batch_y in cycle:
+                    (mse_loss(model(batch_x), batch_y) / n).backward()
+                optimizer.step()
+        return model
+
+    # 4 accumulation steps with batch size 4 is equivalent to batch size 16
+    model1 = _train(gradient_accumulation_steps=4, batch_size=4, max_epochs=3)
+    model2 = _train(gradient_accumulation_steps=1, batch_size=16, max_epochs=3)
+    assert model1.weight.data == approx(model2.weight.data)
+    assert model1.bias.data == approx(model2.bias.data)
+
+    # epoch length of 4 iterations is not a multiple of 3 accumulation steps: last cycle of each epoch has 1 batch
+    model3 = _train(gradient_accumulation_steps=3, batch_size=4, max_epochs=3)
+    model4 = _train_manual(gradient_accumulation_steps=3, batch_size=4, max_epochs=3)
+    assert model3.weight.data == approx(model4.weight.data)
+    assert model3.bias.data == approx(model4.bias.data)
+
+    # epoch length is unknown during the first epoch over an iterator: last cycle is stepped on epoch completion
+    model5 = _train(gradient_accumulation_steps=3, batch_size=4, max_epochs=1, as_iterator=True)
+    model6 = _train_manual(gradient_accumulation_steps=3, batch_size=4, max_epochs=1, divide_by_steps=True)
+    assert model5.weight.data == approx(model6.weight.data)
+    assert model5.bias.data == approx(model6.bias.data)
+
+    with pytest.raises(ValueError, match=r"Argument gradient_accumulation_steps should be positive"):
+        create_supervised_trainer(model1, SGD(model1.parameters(), 0.1), mse_loss, gradient_accumulation_steps=0)
+
+
+def test_create_supervised_trainer_deferred_output():
+    model = Linear(1, 1)
+    model.weight.data.zero_()
+    model.bias.data.zero_()
+    optimizer = SGD(model.parameters(), 0.1)
+    trainer = create_supervised_trainer(model, optimizer, mse_loss, deferred_loss=True)
+
+    x = torch.tensor([[1.0], [2.0]])
+    y = torch.tensor([[3.0], [5.0]])
+    state = trainer.run([(x, y)])
+
+    assert isinstance(state.output, torch.Tensor)
+    assert not state.output.requires_grad
+    assert state.output.item() == approx(17.0)
+
+    # output_transform has priority
+    trainer = create_supervised_trainer(
+        model, optimizer, mse_loss, output_transform=lambda x, y, y_pred, loss: 1.0, deferred_loss=True
+    )
+    assert trainer.run([(x, y)]).output == 1.0
@@ -1,3 +1,4 @@
+import inspect
 import os
 import random
 from unittest.mock import patch
@@ -11,11 +12,12 @@ from ignite.engine import Events
 from ignite.engine.deterministic import (
     DeterministicEngine,
     ReproducibleBatchSampler,
+    ShardedFileDataset,
     keep_random_state,
     update_dataloader,
 )
 from ignite.utils import manual_seed
-from tests.ignite.engine import BatchChecker, setup_sampler
+from tests.ignite.engine import BatchChecker, WorkerInitCounter, setup_sampler
 
 
 def test_update_dataloader():
@@ -116,6 +118,48 @@ def test_reproducible_batch_sampler():
         assert all([(b1 == b2).all() for b1, b2 in zip(seen_batches[resume_epoch], resumed_seen_batches)])
 
 
+def _test_reproducible_batch_sampler_indices(batch_sampler):
+    torch.manual_seed(12)
+    true_batches = [list(b) for b in batch_sampler]
+
+    sampler = ReproducibleBatchSampler(batch_sampler)
+    torch.manual_seed(12)
+    batches = [b.tolist() for b in sampler]
+    assert batches == true_batches
+    assert len(sampler) == len(true_batches)
+
+    for start_iteration in [0, 3, len(true_batches) - 1, len(true_batches)]:
+        sampler = ReproducibleBatchSampler(batch_sampler, start_iteration=start_iteration)
+        torch.manual_seed(12)
+        batches = [b.tolist() for b in sampler]
+        assert batches == true_batches[start_iteration:]
+        # all batches are views of indices of the epoch
+        assert len(sampler.batch_indices) >= sum([len(b) for b in true_batches])
+
+
+def test_reproducible_batch_sampler_indices():
+    from torch.utils.data import BatchSampler, RandomSampler, SequentialSampler
+
+    class CustomBatchSampler(BatchSampler):
+        def __iter__(self):
+            for i, batch in enumerate(super(CustomBatchSampler, self).__iter__()):
+                yield batch[: i % self.batch_size + 1]
+
+    data = list(range(103))
+    for drop_last in [True, False]:
+        for sampler in [SequentialSampler(data), RandomSampler(data)]:
+            _test_reproducible_batch_sampler_indices(BatchSampler(sampler, batch_size=10, drop_last=drop_last))
+            _test_reproducible_batch_sampler_indices(CustomBatchSampler(sampler, batch_size=10, drop_last=drop_last))
+
+    # number of indices is a multiple of batch size
+    for drop_last in [True, False]:
+        _test_reproducible_batch_sampler_indices(BatchSampler(SequentialSampler(data[:100]), 10, drop_last))
+
+    with patch.dict("sys.modules", {"numpy": None}):
+        for sampler in [SequentialSampler(data), RandomSampler(data)]:
+            _test_reproducible_batch_sampler_indices(BatchSampler(sampler, batch_size=10, drop_last=False))
+
+
 def _test_keep_random_state(with_numpy):
 
     manual_seed(54)
@@ -850,3 +894,181 @@ def test_run_finite_iterator_no_epoch_length():
 
     assert engine.state.epoch == 5
     assert engine.state.iteration == unknown_size * 5
+
+
+def _write_shards(dirname, num_shards=3, num_lines=5):
+    files = []
+    for i in range(num_shards):
+        fp = os.path.join(dirname, "shard-{}.txt".format(i))
+        with open(fp, "w") as f:
+            for j in range(num_lines):
+                f.write("{}\n".format(i * num_lines + j))
+        files.append(fp)
+    return files
+
+
+def test_sharded_file_dataset(dirname):
+    with pytest.raises(ValueError, match=r"Argument files should contain at least one file"):
+        ShardedFileDataset([])
+
+    files = _write_shards(dirname)
+    dataset = ShardedFileDataset(files, transform=int)
+    assert list(dataset) == list(range(15))
+    assert dataset.state_dict() == {"shard": 3, "offset": 0}
+
+    data_iter = iter(dataset)
+    for _ in range(7):
+        next(data_iter)
+    state_dict = dataset.state_dict()
+    assert state_dict["shard"] == 1
+
+    dataset = ShardedFileDataset(files, transform=int)
+    dataset.load_state_dict(state_dict)
+    assert list(dataset) == list(range(7, 15))
+    # position is only used by the next iterator
+    assert list(dataset) == list(range(15))
+
+
+def test_resume_sharded_file_dataset_from_iter(dirname):
+    files = _write_shards(dirname)
+    num_reads = [0]
+
+    def read_sample(f):
+        line = f.readline()
+        if len(line) == 0:
+            return None
+        num_reads[0] += 1
+        return int(line)
+
+    epoch_length = 8
+    max_epochs = 2
+    resume_iteration = 11
+
+    seen_batchs = []
+    saved_state_dict = {}
+
+    def update_fn(_, batch):
+        seen_batchs.append(batch)
+
+    engine = DeterministicEngine(update_fn)
+
+    @engine.on(Events.ITERATION_COMPLETED(once=resume_iteration))
+    def save_state():
+        saved_state_dict.update(engine.state_dict())
+
+    dataset = ShardedFileDataset(files, read_sample=read_sample)
+    engine.run(torch.utils.data.DataLoader(dataset, batch_size=2), max_epochs=max_epochs, epoch_length=epoch_length)
+    assert saved_state_dict["dataflow_state"] == {"shard": 1, "offset": 2}
+
+    batch_checker = BatchChecker(seen_batchs, init_counter=resume_iteration)
+
+    def update_fn(_, batch):
+        assert batch_checker.check(batch)
+
+    engine = DeterministicEngine(update_fn)
+    engine.load_state_dict(saved_state_dict)
+    assert engine.state_dict()["dataflow_state"] == saved_state_dict["dataflow_state"]
+
+    num_reads[0] = 0
+    dataset = ShardedFileDataset(files, read_sample=read_sample)
+    engine.run(torch.utils.data.DataLoader(dataset, batch_size=2))
+    assert engine.state.iteration == epoch_length * max_epochs
+    assert batch_checker.counter == epoch_length * max_epochs
+    # samples before the resume position are not read again
+    assert num_reads[0] == 15 - 2 * (resume_iteration - epoch_length)
+
+
+def test_resume_resumable_iterator_from_iter():
+    class ResumableCounter:
+        def __init__(self):
+            self.i = 0
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            self.i += 1
+            return self.i - 1
+
+        def state_dict(self):
+            return {"i": self.i}
+
+        def load_state_dict(self, state_dict):
+            self.i = state_dict["i"]
+
+    epoch_length = 10
+    max_epochs = 3
+    resume_iteration = 17
+
+    engine = DeterministicEngine(lambda e, b: None)
+
+    @engine.on(Events.ITERATION_COMPLETED(once=resume_iteration))
+    def save_state():
+        engine.state.saved_state_dict = engine.state_dict()
+
+    engine.run(ResumableCounter(), max_epochs=max_epochs, epoch_length=epoch_length)
+    saved_state_dict = engine.state.saved_state_dict
+    assert saved_state_dict["dataflow_state"] == {"i": resume_iteration}
+
+    seen_batchs = []
+    engine = DeterministicEngine(lambda e, b: seen_batchs.append(b))
+    engine.load_state_dict(saved_state_dict)
+    engine.run(ResumableCounter())
+    assert seen_batchs == list(range(resume_iteration, epoch_length * max_epochs))
+
+
+def test_resume_dataflow_state_not_resumable_data():
+    data = list(range(10))
+    seen_batchs = []
+    engine = DeterministicEngine(lambda e, b: seen_batchs.append(b))
+    engine.load_state_dict(
+        {"iteration": 4, "epoch_length": 10, "max_epochs": 1, "rng_states": None, "dataflow_state": {"i": 4}}
+    )
+    with pytest.warns(UserWarning, match=r"does not implement the resumable dataflow protocol"):
+        engine.run(data)
+    assert seen_batchs == list(range(4, 10))
+
+
+class _RandomAugmentedDataset(torch.utils.data.Dataset):
+    def __len__(self):
+        return 20
+
+    def __getitem__(self, index):
+        return index + torch.rand(1).item()
+
+
+@pytest.mark.skipif(
+    "persistent_workers" not in inspect.signature(torch.utils.data.DataLoader).parameters,
+    reason="Skip if no persistent workers",
+)
+def test_persistent_workers():
+    worker_init_fn = WorkerInitCounter(num_workers=2)
+    dataloader = torch.utils.data.DataLoader(
+        _RandomAugmentedDataset(), batch_size=4, num_workers=2, shuffle=True, worker_init_fn=worker_init_fn
+    )
+
+    def _setup_engine(batches):
+        engine = DeterministicEngine(lambda e, b: b)
+        engine.add_event_handler(Events.ITERATION_COMPLETED, lambda e: batches.append(e.state.output))
+        return engine
+
+    manual_seed(12)
+    seen_batchs = []
+    engine = _setup_engine(seen_batchs)
+    engine.run(dataloader, max_epochs=3, persistent_workers=True)
+    reproducible_dataloader = engine.state.dataloader
+    assert isinstance(reproducible_dataloader.batch_sampler, ReproducibleBatchSampler)
+    assert reproducible_dataloader.persistent_workers
+
+    engine.run(dataloader, max_epochs=3, persistent_workers=True)
+    assert engine.state.dataloader is reproducible_dataloader
+    assert worker_init_fn.counter.tolist() == [1, 1]
+
+    # live workers are seeded at every epoch, as if they were respawned
+    manual_seed(12)
+    resumed_seen_batchs = []
+    engine = _setup_engine(resumed_seen_batchs)
+    engine.load_state_dict({"epoch": 2, "epoch_length": 5, "max_epochs": 3, "rng_states": None})
+    engine.run(dataloader, persistent_workers=True)
+    assert worker_init_fn.counter.tolist() == [2, 2]
+    assert torch.cat(resumed_seen_batchs).tolist() == torch.cat(seen_batchs[10:15]).tolist()
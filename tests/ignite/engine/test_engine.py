@@ -1,4 +1,6 @@
+import inspect
 import os
+import threading
 import time
 from unittest.mock import MagicMock, Mock, call
 
@@ -9,7 +11,7 @@ import torch
 from ignite.engine import Engine, Events, State
 from ignite.engine.deterministic import keep_random_state
 from ignite.metrics import Average
-from tests.ignite.engine import BatchChecker, EpochCounter, IterationCounter
+from tests.ignite.engine import BatchChecker, EpochCounter, IterationCounter, WorkerInitCounter
 
 
 def test_terminate():
@@ -394,7 +396,7 @@ def test_time_stored_in_state():
     _test(list(range(200)), max_epochs=5, epoch_length=100)
 
 
-def _test_check_triggered_events(data, max_epochs, epoch_length, exp_iter_stops=None):
+def _test_check_triggered_events(data, max_epochs, epoch_length, exp_iter_stops=None, prefetch=0):
     engine = Engine(lambda e, b: 1)
     events = [
         Events.STARTED,
@@ -413,7 +415,7 @@ def _test_check_triggered_events(data, max_epochs, epoch_length, exp_iter_stops=
     for e, handler in handlers.items():
         engine.add_event_handler(e, handler)
 
-    engine.run(data, max_epochs=max_epochs, epoch_length=epoch_length)
+    engine.run(data, max_epochs=max_epochs, epoch_length=epoch_length, prefetch=prefetch)
 
     expected_num_calls = {
         Events.STARTED: 1,
@@ -534,6 +536,42 @@ def test_engine_with_iterable_dataloader():
     assert counter[0] == 50
 
 
+@pytest.mark.skipif(
+    "persistent_workers" not in inspect.signature(torch.utils.data.DataLoader).parameters,
+    reason="Skip if no persistent workers",
+)
+def test_run_persistent_workers():
+    worker_init_fn = WorkerInitCounter(num_workers=2)
+    data_loader = torch.utils.data.DataLoader(
+        torch.arange(20), batch_size=4, num_workers=2, worker_init_fn=worker_init_fn
+    )
+
+    engine = Engine(lambda e, b: b)
+    batches = []
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda e: batches.append(e.state.output))
+
+    for _ in range(3):
+        engine.run(data_loader, max_epochs=2, persistent_workers=True)
+        assert engine.state.dataloader is not data_loader
+        assert engine.state.dataloader.persistent_workers
+
+    # workers are started once and survive epochs and runs
+    assert worker_init_fn.counter.tolist() == [1, 1]
+    assert torch.cat(batches).tolist() == list(range(20)) * 6
+
+    engine.run(data_loader, max_epochs=2)
+    assert engine.state.dataloader is data_loader
+    assert worker_init_fn.counter.tolist() == [3, 3]
+
+    # data without workers is used as is
+    data = [0, 1, 2]
+    engine.run(data, persistent_workers=True)
+    assert engine.state.dataloader is data
+    data_loader = torch.utils.data.DataLoader(torch.arange(20), batch_size=4)
+    engine.run(data_loader, persistent_workers=True)
+    assert engine.state.dataloader is data_loader
+
+
 def test_engine_random_state():
     def random_data_generator():
         while True:
@@ -895,3 +933,90 @@ def test_set_data():
         trainer.set_data(data2)
 
     trainer.run(data1, max_epochs=10)
+
+
+def test_run_with_prefetch():
+    def _test(data, max_epochs, epoch_length, prefetch_device=None):
+        def get_batches(prefetch):
+            batches = []
+            engine = Engine(lambda e, b: batches.append((e.state.iteration, b)))
+            kwargs = {"prefetch": prefetch, "prefetch_device": prefetch_device}
+            engine.run(data, max_epochs=max_epochs, epoch_length=epoch_length, **kwargs)
+            assert engine._dataloader_iter is None
+            return batches
+
+        expected = get_batches(0)
+        for prefetch in [1, 3]:
+            batches = get_batches(prefetch)
+            assert len(batches) == len(expected)
+            for (i1, b1), (i2, b2) in zip(batches, expected):
+                assert i1 == i2
+                assert torch.equal(b1, b2) if isinstance(b1, torch.Tensor) else b1 == b2
+
+    _test(list(range(10)), max_epochs=3, epoch_length=None)
+    _test(list(range(100)), max_epochs=3, epoch_length=30)
+    _test(list(range(100)), max_epochs=2, epoch_length=150)
+    data = torch.utils.data.DataLoader(torch.arange(40), batch_size=4)
+    _test(data, max_epochs=2, epoch_length=None)
+    _test(data, max_epochs=2, epoch_length=None, prefetch_device="cpu")
+
+
+def test_run_with_prefetch_check_triggered_events():
+    _test_check_triggered_events(list(range(10)), max_epochs=4, epoch_length=10, prefetch=2)
+    _test_check_triggered_events(list(range(100)), max_epochs=5, epoch_length=50, exp_iter_stops=2, prefetch=2)
+    _test_check_triggered_events(list(range(100)), max_epochs=5, epoch_length=150, exp_iter_stops=7, prefetch=2)
+
+
+def test_run_with_prefetch_overlaps_data_and_processing():
+    sleep_time = 0.05
+    num_iters = 10
+
+    def slow_data():
+        for i in range(num_iters):
+            time.sleep(sleep_time)
+            yield i
+
+    engine = Engine(lambda e, b: time.sleep(sleep_time))
+    start = time.time()
+    engine.run(slow_data(), prefetch=2)
+    elapsed = time.time() - start
+    assert engine.state.iteration == num_iters
+    assert elapsed < 2 * num_iters * sleep_time * 0.8
+
+
+def test_run_with_prefetch_raises():
+    engine = Engine(lambda e, b: 1)
+    with pytest.raises(ValueError, match=r"Argument prefetch should be non-negative"):
+        engine.run([1, 2, 3], prefetch=-1)
+
+    def faulty_data():
+        yield 1
+        raise RuntimeError("faulty data")
+
+    with pytest.raises(RuntimeError, match=r"faulty data"):
+        engine.run(faulty_data(), prefetch=2)
+
+    engine = Engine(lambda e, b: e.terminate() if e.state.iteration == 5 else None)
+    engine.run(list(range(100)), prefetch=3)
+    assert engine.state.iteration == 5
+    assert engine._dataloader_iter is None
+
+
+def test_prefetch_iterator_close_blocked_data():
+    from ignite.engine.utils import _PrefetchIterator
+
+    event = threading.Event()
+
+    def blocked_data():
+        yield 0
+        event.wait()
+        yield 1
+
+    it = _PrefetchIterator(blocked_data(), num_batches=1)
+    assert next(it) == 0
+    with pytest.warns(UserWarning, match=r"Prefetching thread did not stop within"):
+        it.close(timeout=0.1)
+    event.set()
+    it._thread.join()
+    with pytest.raises(StopIteration):
+        next(it)
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, call, create_autospec
 import pytest
 from pytest import raises
 
-from ignite.engine import Engine, Events, State
+from ignite.engine import Engine, EventEnum, Events, State
 from ignite.engine.events import EventsList
 
 
@@ -471,3 +471,131 @@ def test_custom_exception_handler():
 
     # only one call from _run_once_over_data, since the exception is swallowed
     assert len(counter.exceptions) == 1 and counter.exceptions[0] == value_error
+
+
+@pytest.mark.parametrize("compile_event_handlers", [False, True])
+def test_compiled_event_handlers_calls(compile_event_handlers):
+    engine = Engine(lambda e, b: b, compile_event_handlers=compile_event_handlers)
+
+    calls = []
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda e, x: calls.append(("a", e.state.iteration, x)), 1)
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=2), lambda: calls.append(("b",)))
+    engine.add_event_handler(Events.EPOCH_COMPLETED, lambda e, a=0: calls.append(("c", e.state.epoch, a)), a=2)
+
+    def on_exception(engine, e, value):
+        calls.append(("d", type(e), value))
+
+    engine.add_event_handler(Events.EXCEPTION_RAISED, on_exception, 3)
+    engine.run([0, 1, 2, 3], max_epochs=2)
+
+    assert calls == [
+        ("a", 1, 1),
+        ("a", 2, 1),
+        ("b",),
+        ("a", 3, 1),
+        ("a", 4, 1),
+        ("b",),
+        ("c", 1, 2),
+        ("a", 5, 1),
+        ("a", 6, 1),
+        ("b",),
+        ("a", 7, 1),
+        ("a", 8, 1),
+        ("b",),
+        ("c", 2, 2),
+    ]
+
+    calls.clear()
+    engine._process_function = MagicMock(side_effect=ValueError())
+    engine.run([0, 1])
+    # exception is handled inside the epoch, thus the epoch is completed
+    assert calls == [("d", ValueError, 3), ("c", 1, 2)]
+
+
+def test_compiled_event_handlers_filter_evaluated_once():
+    engine = Engine(lambda e, b: b, compile_event_handlers=True)
+
+    num_filter_calls = [0]
+
+    def custom_filter(_, event):
+        num_filter_calls[0] += 1
+        return event % 3 == 0
+
+    event = Events.ITERATION_COMPLETED(event_filter=custom_filter)
+    h1 = MagicMock()
+    h2 = MagicMock()
+    h3 = MagicMock()
+    engine.add_event_handler(event, h1)
+    engine.add_event_handler(Events.ITERATION_COMPLETED, h2)
+    engine.add_event_handler(event, h3)
+
+    engine.run(list(range(9)))
+
+    assert num_filter_calls[0] == 9
+    assert h1.call_count == 3
+    assert h2.call_count == 9
+    assert h3.call_count == 3
+
+
+def test_compiled_event_handlers_are_rebuilt():
+    engine = Engine(lambda e, b: b, compile_event_handlers=True)
+    engine.state = State()
+
+    h1 = MagicMock(spec_set=True)
+    h2 = MagicMock(spec_set=True)
+    engine.add_event_handler(Events.EPOCH_STARTED, h1)
+    engine.fire_event(Events.EPOCH_STARTED)
+    assert Events.EPOCH_STARTED in engine._compiled_event_handlers
+    assert h1.call_count == 1
+
+    engine.add_event_handler(Events.EPOCH_STARTED, h2)
+    assert Events.EPOCH_STARTED not in engine._compiled_event_handlers
+    engine.fire_event(Events.EPOCH_STARTED)
+    assert h1.call_count == 2
+    assert h2.call_count == 1
+
+    h3 = MagicMock(spec_set=True)
+    with engine.add_event_handler(Events.EPOCH_STARTED, h3):
+        engine.fire_event(Events.EPOCH_STARTED)
+    assert h1.call_count == 3
+    assert h3.call_count == 1
+    engine.fire_event(Events.EPOCH_STARTED)
+    assert h1.call_count == 4
+    assert h3.call_count == 1
+
+    engine.remove_event_handler(h1, Events.EPOCH_STARTED)
+    engine.fire_event(Events.EPOCH_STARTED)
+    assert h1.call_count == 4
+    assert h2.call_count == 4
+
+    class CustomEvents(EventEnum):
+        CUSTOM_EVENT = "custom_event"
+
+    engine.fire_event(CustomEvents.CUSTOM_EVENT)
+    engine.register_events(*CustomEvents)
+    engine.add_event_handler(CustomEvents.CUSTOM_EVENT, h1)
+    engine.fire_event(CustomEvents.CUSTOM_EVENT)
+    assert h1.call_count == 5
+
+
+def test_add_first_event_handler():
+    engine = Engine(lambda e, b: b, compile_event_handlers=True)
+
+    calls = []
+    engine.add_event_handler(Events.EPOCH_COMPLETED(every=2), lambda: calls.append("a"))
+    engine.run([0], max_epochs=2)
+    assert calls == ["a"]
+
+    calls.clear()
+    handler = MagicMock(side_effect=lambda e, x: calls.append(("first", x)))
+    engine._add_first_event_handler(Events.EPOCH_COMPLETED, handler, 1)
+    assert Events.EPOCH_COMPLETED not in engine._compiled_event_handlers
+    engine.run([0], max_epochs=2)
+    assert calls == [("first", 1), ("first", 1), "a"]
+    handler.assert_called_with(engine, 1)
+
+    # wrappers of handlers on filtered events are resolved to the input handlers
+    handlers = engine._get_event_handlers(Events.EPOCH_COMPLETED)
+    assert handlers[0] is handler
+    assert handlers[1] is not engine._event_handlers[Events.EPOCH_COMPLETED][1][0]
+    assert engine._get_event_handlers(Events.COMPLETED) == []
@@ -1,14 +1,23 @@
 import os
 import warnings
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import torch
+import torch.distributed as dist
 import torch.nn as nn
 
 from ignite.engine import Engine, Events, State
-from ignite.handlers import Checkpoint, DiskSaver, ModelCheckpoint
-from ignite.handlers.checkpoint import BaseSaveHandler
+from ignite.handlers import (
+    AsyncSaver,
+    Checkpoint,
+    DiskSaver,
+    IncrementalDiskSaver,
+    ModelCheckpoint,
+    ShardedDiskSaver,
+    TieredSaver,
+)
+from ignite.handlers.checkpoint import BaseSaveHandler, _load_mmap, _save_mmap
 
 _PREFIX = "PREFIX"
 
@@ -839,3 +848,498 @@ def test_disksaver_wrong_input(dirname):
             DiskSaver(dirname, require_empty=True)
 
     _test(".pt")
+
+
+def test_save_load_mmap(dirname):
+    path = os.path.join(dirname, "test.pt")
+    t = torch.rand(3, 4)
+    checkpoint = {
+        "float": t,
+        "tied": [t, t.t()],
+        "double": torch.rand(5, dtype=torch.float64),
+        "bool": torch.tensor([True, False, True]),
+        "bfloat16": torch.rand(7).to(torch.bfloat16),
+        "scalar": torch.tensor(3, dtype=torch.int8),
+        "empty": torch.zeros(0, 2),
+        "value": 1.5,
+    }
+    _save_mmap(checkpoint, path)
+
+    loaded = _load_mmap(path)
+    assert loaded["value"] == 1.5
+    for k in ["float", "double", "bool", "bfloat16", "scalar", "empty"]:
+        assert loaded[k].dtype == checkpoint[k].dtype
+        assert loaded[k].shape == checkpoint[k].shape
+        assert (loaded[k] == checkpoint[k]).all()
+    assert (loaded["tied"][0] == t).all() and (loaded["tied"][1] == t.t()).all()
+
+    # loaded tensors are writable and not written back to the file
+    loaded["float"].fill_(0.0)
+    assert (_load_mmap(path)["float"] == t).all()
+
+    # other formats
+    torch.save(checkpoint, path)
+    assert _load_mmap(path) is None
+
+
+def test_disk_saver_mmap(dirname):
+    model = DummyPretrainedModel()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+    model(torch.rand(4, 4)).sum().backward()
+    optimizer.step()
+    to_save = {"model": model, "optimizer": optimizer}
+
+    checkpointer = Checkpoint(to_save, DiskSaver(dirname, create_dir=False, mmap=True))
+    trainer = Engine(lambda e, b: None)
+    trainer.state = State(epoch=0, iteration=1)
+    checkpointer(trainer)
+    path = os.path.join(dirname, checkpointer.last_checkpoint)
+
+    model2 = DummyPretrainedModel()
+    optimizer2 = torch.optim.SGD(model2.parameters(), lr=0.1, momentum=0.9)
+    Checkpoint.load_objects({"model": model2, "optimizer": optimizer2}, path)
+    for p, p2 in zip(model.parameters(), model2.parameters()):
+        assert (p == p2).all()
+    state = optimizer.state_dict()["state"]
+    state2 = optimizer2.state_dict()["state"]
+    for k in state:
+        assert (state[k]["momentum_buffer"] == state2[k]["momentum_buffer"]).all()
+
+    # partial loading
+    features = nn.Linear(4, 2, bias=False)
+    Checkpoint.load_objects({"model": features}, path, prefix="features.")
+    assert (features.weight == model.features.weight).all()
+
+    # files saved by torch.save
+    checkpointer = Checkpoint({"model": model}, DiskSaver(dirname, create_dir=False, require_empty=False))
+    checkpointer(trainer)
+    features = nn.Linear(4, 2, bias=False)
+    path = os.path.join(dirname, checkpointer.last_checkpoint)
+    Checkpoint.load_objects({"model": features}, path, prefix="features.")
+    assert (features.weight == model.features.weight).all()
+
+
+def test_disk_saver_mmap_without_numpy(dirname):
+    model = DummyPretrainedModel()
+    path = os.path.join(dirname, "model.pt")
+    torch.save({"model": model.state_dict()}, path)
+
+    with patch.dict("sys.modules", {"numpy": None}):
+        with pytest.raises(RuntimeError, match=r"Argument mmap=True requires numpy to be installed"):
+            DiskSaver(dirname, require_empty=False, mmap=True)
+
+        # files saved by torch.save are loaded without numpy
+        model2 = DummyPretrainedModel()
+        Checkpoint.load_objects({"model": model2}, path)
+        for p, p2 in zip(model.parameters(), model2.parameters()):
+            assert (p == p2).all()
+
+
+def test_incremental_disk_saver_wrong_input(dirname):
+    with pytest.raises(ValueError, match=r"Argument min_blob_size should be non-negative"):
+        IncrementalDiskSaver(dirname, min_blob_size=-1)
+
+
+class DummyFinetunedModel(nn.Module):
+    def __init__(self):
+        super(DummyFinetunedModel, self).__init__()
+        self.embedding = nn.Embedding(100, 16)
+        self.embedding.weight.requires_grad_(False)
+        self.net = nn.Linear(16, 16)
+
+
+def test_incremental_disk_saver(dirname):
+    model = DummyFinetunedModel()
+    saver = IncrementalDiskSaver(dirname, create_dir=False)
+    checkpointer = Checkpoint({"model": model}, saver, n_saved=2)
+
+    trainer = Engine(lambda e, b: None)
+    trainer.state = State(epoch=0, iteration=0)
+
+    def blobs():
+        return sorted(f for f in os.listdir(os.path.join(dirname, "blobs")) if f != "refs.json")
+
+    for i in range(1, 4):
+        trainer.state.iteration = i
+        with torch.no_grad():
+            model.net.weight.fill_(i)
+        checkpointer(trainer)
+        # frozen embedding is stored once, small bias is stored in the manifest
+        assert len(blobs()) == min(i, 2) + 1
+
+    assert sorted(os.listdir(dirname)) == ["blobs", "model_2.pt", "model_3.pt"]
+
+    manifest = torch.load(os.path.join(dirname, "model_3.pt"))
+    assert isinstance(manifest["net.bias"], torch.Tensor)
+    assert hasattr(manifest, "_metadata")
+
+    checkpoint = saver.load("model_3.pt")
+    assert hasattr(checkpoint, "_metadata")
+    model2 = DummyFinetunedModel()
+    Checkpoint.load_objects({"model": model2}, checkpoint)
+    assert (model2.net.weight == 3.0).all()
+    assert (model2.embedding.weight == model.embedding.weight).all()
+    assert (model2.net.bias == model.net.bias).all()
+
+    # references are restored by a new saver
+    saver = IncrementalDiskSaver(dirname, create_dir=False, require_empty=False)
+    saver.remove("model_2.pt")
+    assert len(blobs()) == 2
+    saver.remove("model_3.pt")
+    assert len(blobs()) == 0
+
+
+def test_incremental_disk_saver_same_content(dirname):
+    saver = IncrementalDiskSaver(dirname, create_dir=False, min_blob_size=0)
+    t = torch.rand(10)
+    saver({"a": t, "b": t.clone(), "c": [t, 1]}, "test.pt")
+    assert len(os.listdir(os.path.join(dirname, "blobs"))) == 2
+
+    checkpoint = saver.load("test.pt")
+    assert checkpoint["c"][1] == 1
+    for v in [checkpoint["a"], checkpoint["b"], checkpoint["c"][0]]:
+        assert (v == t).all()
+    # loaded tensors do not share memory
+    checkpoint["a"].fill_(0.0)
+    assert (checkpoint["b"] == t).all()
+
+
+def _setup_sharded_objects():
+    torch.manual_seed(12)
+    model = nn.Sequential(nn.Embedding(30, 64), nn.Linear(64, 4))
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+    model(torch.arange(10)).sum().backward()
+    optimizer.step()
+    return model, optimizer
+
+
+def _check_loaded_sharded_objects(model, optimizer, checkpoint):
+    model2, optimizer2 = _setup_sharded_objects()
+    with torch.no_grad():
+        for p in model2.parameters():
+            p.fill_(0.0)
+    Checkpoint.load_objects({"model": model2, "optimizer": optimizer2}, checkpoint)
+    for p, p2 in zip(model.parameters(), model2.parameters()):
+        assert (p == p2).all()
+    state = optimizer.state_dict()["state"]
+    state2 = optimizer2.state_dict()["state"]
+    for k in state:
+        assert (state[k]["momentum_buffer"] == state2[k]["momentum_buffer"]).all()
+
+
+def test_sharded_disk_saver_different_world_size(dirname):
+    model, optimizer = _setup_sharded_objects()
+    checkpoint = {"model": model.state_dict(), "optimizer": optimizer.state_dict()}
+
+    # simulate a save by 3 processes
+    saver = ShardedDiskSaver(dirname, create_dir=False)
+    for rank in range(3):
+        manifest, shard = saver._split(checkpoint, "test.pt", rank, 3)
+        saver._save(shard, os.path.join(dirname, saver._shard_filename("test.pt", rank, 3)))
+    saver._save(manifest, os.path.join(dirname, "test.pt"))
+
+    # largest tensors are split between all shards
+    assert [f for f, _ in manifest["model"]["0.weight"].chunks] == [
+        "test_shard0-of-3.pt",
+        "test_shard1-of-3.pt",
+        "test_shard2-of-3.pt",
+    ]
+    assert len(manifest["model"]["1.bias"].chunks) == 1
+
+    _check_loaded_sharded_objects(model, optimizer, saver.load("test.pt"))
+
+
+def test_sharded_disk_saver_error(dirname):
+    saver = ShardedDiskSaver(dirname, create_dir=False)
+    saver._save = MagicMock(side_effect=RuntimeError("write error"))
+    with pytest.raises(RuntimeError, match=r"write error"):
+        saver({"a": torch.rand(10)}, "test.pt")
+    assert saver._save.call_count == 1
+
+
+def _test_sharded_disk_saver(dirname):
+    rank, world_size = 0, 1
+    if dist.is_available() and dist.is_initialized():
+        rank, world_size = dist.get_rank(), dist.get_world_size()
+        # use the directory of rank 0
+        t = torch.zeros(1024, dtype=torch.uint8)
+        if rank == 0:
+            encoded = dirname.encode()
+            t[: len(encoded)] = torch.tensor(list(encoded), dtype=torch.uint8)
+        dist.broadcast(t, src=0)
+        dirname = bytes(t.tolist()).rstrip(b"\x00").decode()
+
+    model, optimizer = _setup_sharded_objects()
+    saver = ShardedDiskSaver(dirname, create_dir=False, require_empty=False)
+    checkpointer = Checkpoint({"model": model, "optimizer": optimizer}, saver, n_saved=1)
+
+    trainer = Engine(lambda e, b: None)
+    trainer.state = State(epoch=0, iteration=0)
+    for i in range(1, 3):
+        trainer.state.iteration = i
+        checkpointer(trainer)
+
+    if world_size > 1:
+        dist.barrier()
+    expected = ["checkpoint_2_shard{}-of-{}.pt".format(r, world_size) for r in range(world_size)]
+    assert sorted(os.listdir(dirname)) == sorted(expected + ["checkpoint_2.pt"])
+    _check_loaded_sharded_objects(model, optimizer, saver.load(checkpointer.last_checkpoint))
+    if world_size > 1:
+        dist.barrier()
+
+
+def test_sharded_disk_saver(dirname):
+    _test_sharded_disk_saver(dirname)
+
+
+@pytest.mark.distributed
+def test_sharded_disk_saver_distrib_cpu(dirname, distributed_context_single_node_gloo):
+    _test_sharded_disk_saver(dirname)
+
+
+def test_async_saver_wrong_input():
+    with pytest.raises(TypeError, match=r"Argument `save_handler` should be callable"):
+        AsyncSaver(12)
+
+    with pytest.raises(ValueError, match=r"Argument max_pending should be positive"):
+        AsyncSaver(MagicMock(), max_pending=0)
+
+    with pytest.raises(TypeError, match=r"Argument engine should be ignite.engine.Engine"):
+        AsyncSaver(MagicMock()).attach(None)
+
+
+def test_async_saver(dirname):
+    model = DummyModel()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+    model(torch.rand(4, 1)).sum().backward()
+    optimizer.step()
+    to_save = {"model": model, "optimizer": optimizer}
+
+    saver = AsyncSaver(DiskSaver(dirname, create_dir=False), max_pending=2)
+    checkpointer = Checkpoint(to_save, saver, n_saved=2)
+
+    trainer = Engine(lambda e, b: None)
+    trainer.state = State(epoch=0, iteration=0)
+
+    for i in range(1, 6):
+        trainer.state.iteration = i
+        checkpointer(trainer)
+        # snapshot is taken at call time
+        model.net.weight.data.fill_(i)
+
+    saver.wait()
+    assert sorted(os.listdir(dirname)) == ["checkpoint_4.pt", "checkpoint_5.pt"]
+
+    checkpoint = torch.load(os.path.join(dirname, "checkpoint_5.pt"))
+    assert checkpoint["model"]["net.weight"].item() == 4.0
+    assert hasattr(checkpoint["model"], "_metadata")
+    model2 = DummyModel()
+    optimizer2 = torch.optim.SGD(model2.parameters(), lr=0.1, momentum=0.9)
+    Checkpoint.load_objects({"model": model2, "optimizer": optimizer2}, checkpoint)
+    assert model2.net.weight.item() == 4.0
+    assert optimizer2.state_dict()["state"][0]["momentum_buffer"] is not None
+
+
+def test_async_saver_raises_background_error():
+    save_handler = MagicMock(side_effect=RuntimeError("write error"))
+    saver = AsyncSaver(save_handler)
+
+    saver({"a": torch.tensor([1.0])}, "test.pt")
+    with pytest.raises(RuntimeError, match=r"write error"):
+        saver.wait()
+    saver.wait()
+
+
+def test_async_saver_attach(dirname):
+    model = DummyModel()
+
+    saver = AsyncSaver(DiskSaver(dirname, create_dir=False))
+    trainer = Engine(lambda e, b: None)
+    saver.attach(trainer)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, Checkpoint({"model": model}, saver, n_saved=None))
+    trainer.run([0, 1, 2])
+
+    assert saver._futures == []
+    # background thread is stopped and started again by the next run
+    assert saver._executor is None
+    assert sorted(os.listdir(dirname)) == ["model_1.pt", "model_2.pt", "model_3.pt"]
+
+    def update_fn(engine, batch):
+        if engine.state.iteration == 2:
+            raise ValueError("update error")
+
+    trainer = Engine(update_fn)
+    saver.attach(trainer)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, Checkpoint({"model": model}, saver, filename_prefix="a"))
+    with pytest.raises(ValueError, match=r"update error"):
+        trainer.run([0, 1, 2])
+
+    assert saver._futures == []
+    assert saver._executor is None
+    assert os.path.exists(os.path.join(dirname, "a_model_1.pt"))
+
+
+def test_async_savers_reraise(dirname):
+    def update_fn(engine, batch):
+        if engine.state.iteration == 2:
+            raise ZeroDivisionError("update error")
+
+    def _test(savers, handler=None):
+        trainer = Engine(update_fn)
+        for i, saver in enumerate(savers):
+            saver.attach(trainer)
+            checkpoint = Checkpoint({"model": DummyModel()}, saver, filename_prefix=str(i), n_saved=None)
+            trainer.add_event_handler(Events.ITERATION_COMPLETED, checkpoint)
+        if handler is not None:
+            trainer.add_event_handler(Events.EXCEPTION_RAISED, handler)
+        return trainer.run([0, 1, 2])
+
+    def _get_savers(name):
+        path = os.path.join(dirname, name)
+        return [
+            AsyncSaver(DiskSaver(os.path.join(path, "async"))),
+            TieredSaver(DiskSaver(os.path.join(path, "fast")), DiskSaver(os.path.join(path, "durable"))),
+        ]
+
+    # exception is not swallowed by several savers
+    savers = _get_savers("a")
+    with pytest.raises(ZeroDivisionError, match=r"update error"):
+        _test(savers)
+    assert all(saver._executor is None for saver in savers)
+    with pytest.raises(ZeroDivisionError, match=r"update error"):
+        _test([AsyncSaver(DiskSaver(os.path.join(dirname, "b", str(i)))) for i in range(2)])
+
+    # exception is handled by another handler
+    handler = MagicMock()
+    savers = _get_savers("c")
+    state = _test(savers, handler)
+    assert state.iteration == 2
+    assert handler.call_count == 1
+    assert all(saver._executor is None for saver in savers)
+
+
+def test_disk_saver_atomic_fsync(dirname):
+    saver = DiskSaver(dirname, create_dir=False)
+    with patch("os.fsync", wraps=os.fsync) as fsync:
+        saver({"a": torch.tensor([1.0])}, "test.pt")
+    # temporary file and directory
+    assert fsync.call_count == 2
+    assert torch.load(os.path.join(dirname, "test.pt"))["a"].item() == 1.0
+
+
+def test_tiered_saver_wrong_input(dirname):
+    disk_saver = DiskSaver(dirname, create_dir=False)
+    with pytest.raises(TypeError, match=r"Argument `fast_saver` should be callable"):
+        TieredSaver(12, disk_saver)
+
+    with pytest.raises(TypeError, match=r"Argument `save_handler` should be callable"):
+        TieredSaver(disk_saver, 12)
+
+    with pytest.raises(ValueError, match=r"Argument persist_every should be positive"):
+        TieredSaver(disk_saver, disk_saver, persist_every=0)
+
+    with pytest.raises(ValueError, match=r"Argument n_fast should be positive or None"):
+        TieredSaver(disk_saver, disk_saver, n_fast=0)
+
+    with pytest.raises(TypeError, match=r"Argument n_saved requires a save handler inheriting from BaseSaveHandler"):
+        TieredSaver(disk_saver, MagicMock(), n_saved=1)
+
+    with pytest.raises(TypeError, match=r"Argument score_function should be a function"):
+        TieredSaver(disk_saver, disk_saver, score_function=12)
+
+    saver = TieredSaver(disk_saver, MagicMock(), n_saved=None, score_function=lambda e: 0)
+    with pytest.raises(RuntimeError, match=r"TieredSaver with score_function should be attached to an engine"):
+        saver({"a": torch.tensor([1.0])}, "test.pt")
+
+
+def test_tiered_saver(dirname):
+    fast_dirname = os.path.join(dirname, "fast")
+    durable_dirname = os.path.join(dirname, "durable")
+    saver = TieredSaver(DiskSaver(fast_dirname), DiskSaver(durable_dirname), persist_every=2, n_fast=2, n_saved=2)
+
+    model = DummyModel()
+    checkpointer = Checkpoint({"model": model}, saver, n_saved=None)
+    trainer = Engine(lambda e, b: None)
+    trainer.state = State(epoch=0, iteration=0)
+    for i in range(1, 6):
+        trainer.state.iteration = i
+        with torch.no_grad():
+            model.net.weight.fill_(i)
+        checkpointer(trainer)
+
+    saver.wait()
+    assert sorted(os.listdir(fast_dirname)) == ["model_4.pt", "model_5.pt"]
+    assert sorted(os.listdir(durable_dirname)) == ["model_2.pt", "model_4.pt"]
+    assert torch.load(os.path.join(durable_dirname, "model_4.pt"))["net.weight"].item() == 4.0
+
+    # recovery
+    assert saver.find_latest() == os.path.join(fast_dirname, "model_5.pt")
+    for fname in os.listdir(fast_dirname):
+        os.remove(os.path.join(fast_dirname, fname))
+    saver = TieredSaver(DiskSaver(fast_dirname, require_empty=False), DiskSaver(durable_dirname, require_empty=False))
+    assert saver.find_latest() == os.path.join(durable_dirname, "model_4.pt")
+    # files not named as checkpoints are ignored
+    with open(os.path.join(durable_dirname, "notes.txt"), "w") as f:
+        f.write("newer file")
+    assert saver.find_latest() == os.path.join(durable_dirname, "model_4.pt")
+    assert saver.find_latest(filename_prefix="best") is None
+    # truncated files are ignored
+    with open(os.path.join(durable_dirname, "model_4.pt"), "rb") as f:
+        data = f.read()
+    with open(os.path.join(durable_dirname, "model_4.pt"), "wb") as f:
+        f.write(data[: len(data) // 2])
+    assert saver.find_latest() == os.path.join(durable_dirname, "model_2.pt")
+    with open(os.path.join(durable_dirname, "model_4.pt"), "wb") as f:
+        f.write(b"corrupted")
+    assert saver.find_latest() == os.path.join(durable_dirname, "model_2.pt")
+    model2 = DummyModel()
+    Checkpoint.load_objects({"model": model2}, saver.find_latest())
+    assert model2.net.weight.item() == 2.0
+
+
+def test_tiered_saver_score_function(dirname):
+    fast_dirname = os.path.join(dirname, "fast")
+    durable_dirname = os.path.join(dirname, "durable")
+    scores = [0.5, 0.7, 0.6, 0.9, 0.8]
+    saver = TieredSaver(
+        DiskSaver(fast_dirname),
+        DiskSaver(durable_dirname),
+        persist_every=100,
+        n_saved=None,
+        score_function=lambda e: scores[e.state.iteration - 1],
+    )
+    trainer = Engine(lambda e, b: None)
+    saver.attach(trainer)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, Checkpoint({"model": DummyModel()}, saver, n_saved=None))
+    trainer.run([0] * len(scores))
+
+    assert saver._futures == []
+    assert sorted(os.listdir(durable_dirname)) == ["model_1.pt", "model_2.pt", "model_4.pt"]
+    assert sorted(os.listdir(fast_dirname)) == ["model_4.pt", "model_5.pt"]
+
+
+def test_tiered_saver_keeps_best(dirname):
+    fast_dirname = os.path.join(dirname, "fast")
+    durable_dirname = os.path.join(dirname, "durable")
+    scores = [0.9, 0.5, 0.6, 0.7, 0.95, 0.8, 0.7]
+    saver = TieredSaver(
+        DiskSaver(fast_dirname),
+        DiskSaver(durable_dirname),
+        persist_every=1,
+        n_saved=2,
+        score_function=lambda e: scores[e.state.iteration - 1],
+    )
+    trainer = Engine(lambda e, b: None)
+    saver.attach(trainer)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, Checkpoint({"model": DummyModel()}, saver, n_saved=None))
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_durable_saves(engine):
+        saver.wait()
+        if engine.state.iteration == 4:
+            # best save is not removed by periodic migrations
+            assert sorted(os.listdir(durable_dirname)) == ["model_1.pt", "model_3.pt", "model_4.pt"]
+
+    trainer.run([0] * len(scores))
+
+    assert sorted(os.listdir(durable_dirname)) == ["model_5.pt", "model_6.pt", "model_7.pt"]
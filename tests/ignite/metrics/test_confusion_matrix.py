@@ -5,6 +5,7 @@ import pytest
 import torch
 from sklearn.metrics import accuracy_score, confusion_matrix, precision_score, recall_score
 
+from ignite.engine import Engine, Events
 from ignite.exceptions import NotComputableError
 from ignite.metrics import ConfusionMatrix, IoU, mIoU
 from ignite.metrics.confusion_matrix import DiceCoefficient, cmAccuracy, cmPrecision, cmRecall
@@ -187,7 +188,7 @@ def test_ignored_out_of_num_classes_indices():
     cm = ConfusionMatrix(num_classes=num_classes)
 
     y_pred = torch.rand(4, num_classes, 12, 10)
-    y = torch.randint(0, 255, size=(4, 12, 10)).long()
+    y = torch.randint(-10, 255, size=(4, 12, 10)).long()
     cm.update((y_pred, y))
     np_y_pred = y_pred.numpy().argmax(axis=1).ravel()
     np_y = y.numpy().ravel()
@@ -364,6 +365,38 @@ def test_miou():
         assert res == true_res_, "{}: {} vs {}".format(ignore_index, res, true_res_)
 
 
+def test_cm_wrong_input():
+    for fn in [cmAccuracy, cmPrecision, cmRecall]:
+        with pytest.raises(TypeError, match="Argument cm should be instance of ConfusionMatrix"):
+            fn(None)
+
+
+def test_cm_metrics_share_single_update():
+    num_classes = 5
+    y_pred = torch.rand(40, num_classes)
+    y = torch.randint(0, num_classes, size=(40,)).long()
+    np_y_pred = y_pred.numpy().argmax(axis=1).ravel()
+    np_y = y.numpy().ravel()
+
+    def update_fn(engine, batch):
+        return y_pred[batch * 10 : (batch + 1) * 10], y[batch * 10 : (batch + 1) * 10]
+
+    engine = Engine(update_fn)
+    cm = ConfusionMatrix(num_classes=num_classes)
+    cmAccuracy(cm).attach(engine, "accuracy")
+    cmPrecision(cm, average=True).attach(engine, "precision")
+    cmRecall(cm, average=False).attach(engine, "recall")
+
+    # confusion matrix is updated once per iteration
+    handlers = [h for h, _, _ in engine._event_handlers[Events.ITERATION_COMPLETED]]
+    assert len(handlers) == 1
+
+    state = engine.run(list(range(4)))
+    assert state.metrics["accuracy"] == pytest.approx(accuracy_score(np_y, np_y_pred))
+    assert state.metrics["precision"] == pytest.approx(precision_score(np_y, np_y_pred, average="macro"))
+    np.testing.assert_allclose(state.metrics["recall"].numpy(), recall_score(np_y, np_y_pred, average=None))
+
+
 def test_cm_accuracy():
 
     y_true, y_pred = get_y_true_y_pred()
@@ -534,6 +567,58 @@ def test_dice_coefficient():
         assert np.all(res == true_res_), "{}: {} vs {}".format(ignore_index, res, true_res_)
 
 
+def test_sparse_confusion_matrix():
+    num_classes = 21
+    y_pred = torch.rand(64, num_classes, 6, 5)
+    y = torch.randint(-2, 25, size=(64, 6, 5)).long()
+
+    cm = ConfusionMatrix(num_classes=num_classes, sparse=True)
+    dense_cm = ConfusionMatrix(num_classes=num_classes)
+    for i in range(4):
+        batch = (y_pred[i * 16 : (i + 1) * 16], y[i * 16 : (i + 1) * 16])
+        cm.update(batch)
+        dense_cm.update(batch)
+
+    res = cm.compute()
+    assert res.is_sparse
+    # only non-zero entries are stored
+    assert cm.confusion_matrix is None
+    assert cm._indices.shape == cm._counts.shape
+    assert cm._indices.shape[0] == res._nnz() == int((dense_cm.compute() > 0).sum())
+
+    np_y_pred = y_pred.numpy().argmax(axis=1).ravel()
+    np_y = y.numpy().ravel()
+    true_res = confusion_matrix(np_y, np_y_pred, labels=list(range(num_classes)))
+    assert np.all(true_res == res.to_dense().numpy())
+
+    for average in ("samples", "recall", "precision"):
+        cm.average = dense_cm.average = average
+        np.testing.assert_allclose(cm.compute().to_dense().numpy(), dense_cm.compute().numpy(), rtol=1e-5)
+
+
+def test_sparse_cm_metrics():
+    num_classes = 10
+    y_pred = torch.rand(50, num_classes, 4)
+    y = torch.randint(0, num_classes, size=(50, 4)).long()
+
+    cm = ConfusionMatrix(num_classes=num_classes, sparse=True)
+    dense_cm = ConfusionMatrix(num_classes=num_classes)
+    metrics = [
+        (IoU(cm), IoU(dense_cm)),
+        (IoU(cm, ignore_index=0), IoU(dense_cm, ignore_index=0)),
+        (mIoU(cm), mIoU(dense_cm)),
+        (DiceCoefficient(cm), DiceCoefficient(dense_cm)),
+        (cmAccuracy(cm), cmAccuracy(dense_cm)),
+        (cmPrecision(cm, average=False), cmPrecision(dense_cm, average=False)),
+        (cmRecall(cm), cmRecall(dense_cm)),
+    ]
+    cm.update((y_pred, y))
+    dense_cm.update((y_pred, y))
+
+    for sparse_metric, dense_metric in metrics:
+        np.testing.assert_allclose(sparse_metric.compute().numpy(), dense_metric.compute().numpy())
+
+
 def _test_distrib_multiclass_images(device):
 
     import torch.distributed as dist
@@ -607,12 +692,38 @@ def _test_distrib_multiclass_images(device):
     assert np.all(true_res == res)
 
 
+def _test_distrib_sparse(device):
+
+    import torch.distributed as dist
+
+    rank = dist.get_rank()
+    torch.manual_seed(12)
+
+    num_classes = 15
+    y_pred = torch.rand(10 * dist.get_world_size(), num_classes, 8).to(device)
+    y = torch.randint(0, num_classes, size=(10 * dist.get_world_size(), 8)).to(device)
+
+    cm = ConfusionMatrix(num_classes=num_classes, sparse=True, device=device)
+    cm.update((y_pred[rank * 10 : (rank + 1) * 10], y[rank * 10 : (rank + 1) * 10]))
+    res = cm.compute()
+    # reduction happens once
+    res2 = cm.compute()
+
+    np_y_pred = y_pred.cpu().numpy().argmax(axis=1).ravel()
+    np_y = y.cpu().numpy().ravel()
+    true_res = confusion_matrix(np_y, np_y_pred, labels=list(range(num_classes)))
+    assert np.all(true_res == res.to_dense().cpu().numpy())
+    assert np.all(true_res == res2.to_dense().cpu().numpy())
+    assert cm._num_examples == 10 * dist.get_world_size()
+
+
 @pytest.mark.distributed
 @pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
 def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
 
     device = "cuda:{}".format(local_rank)
     _test_distrib_multiclass_images(device)
+    _test_distrib_sparse(device)
 
 
 @pytest.mark.distributed
@@ -620,6 +731,7 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
 
     device = "cpu"
     _test_distrib_multiclass_images(device)
+    _test_distrib_sparse(device)
 
 
 @pytest.mark.multinode_distributed
@@ -627,6 +739,7 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
 def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
     device = "cpu"
     _test_distrib_multiclass_images(device)
+    _test_distrib_sparse(device)
 
 
 @pytest.mark.multinode_distributed
@@ -634,3 +747,4 @@ def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
 def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
     device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
     _test_distrib_multiclass_images(device)
+    _test_distrib_sparse(device)
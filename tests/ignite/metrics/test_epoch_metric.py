@@ -3,6 +3,7 @@ import os
 import pytest
 import torch
 
+from ignite.exceptions import NotComputableError
 from ignite.metrics import EpochMetric
 from ignite.metrics.epoch_metric import EpochMetricWarning
 
@@ -16,8 +17,17 @@ def test_epoch_metric_wrong_setup_or_input():
     def compute_fn(y_preds, y_targets):
         return 0.0
 
+    with pytest.raises(ValueError, match=r"Arguments pin_memory and mmap_dir are mutually exclusive"):
+        EpochMetric(compute_fn, pin_memory=True, mmap_dir=".")
+
+    with pytest.raises(ValueError, match=r"Argument mmap_dir should be an existing directory"):
+        EpochMetric(compute_fn, mmap_dir="/path/does/not/exist")
+
     em = EpochMetric(compute_fn)
 
+    with pytest.raises(NotComputableError, match=r"EpochMetric must have at least one example"):
+        em.compute()
+
     # Wrong input dims
     with pytest.raises(ValueError, match=r"Predictions should be of shape"):
         output = (torch.tensor(0), torch.tensor(0))
@@ -50,6 +60,10 @@ def test_epoch_metric_wrong_setup_or_input():
         output2 = (torch.rand(4, 3), torch.randint(0, 2, size=(4, 3)).to(torch.int32))
         em.update(output2)
 
+    with pytest.raises(ValueError, match=r"Incoherent shapes between input and stored data"):
+        output2 = (torch.rand(4, 4), torch.randint(0, 2, size=(4, 4), dtype=torch.long))
+        em.update(output2)
+
 
 def test_epoch_metric():
     def compute_fn(y_preds, y_targets):
@@ -63,11 +77,9 @@ def test_epoch_metric():
     output2 = (torch.rand(4, 3), torch.randint(0, 2, size=(4, 3), dtype=torch.long))
     em.update(output2)
 
-    assert all([t.device.type == "cpu" for t in em._predictions + em._targets])
-    assert torch.equal(em._predictions[0], output1[0])
-    assert torch.equal(em._predictions[1], output2[0])
-    assert torch.equal(em._targets[0], output1[1])
-    assert torch.equal(em._targets[1], output2[1])
+    assert all([t.device.type == "cpu" for t in (em._predictions.data(), em._targets.data())])
+    assert torch.equal(em._predictions.data(), torch.cat([output1[0], output2[0]]))
+    assert torch.equal(em._targets.data(), torch.cat([output1[1], output2[1]]))
     assert em.compute() == 0.0
 
     # test when y and y_pred are (batch_size, 1) that are squeezed to (batch_size, )
@@ -77,11 +89,9 @@ def test_epoch_metric():
     output2 = (torch.rand(4, 1), torch.randint(0, 2, size=(4, 1), dtype=torch.long))
     em.update(output2)
 
-    assert all([t.device.type == "cpu" for t in em._predictions + em._targets])
-    assert torch.equal(em._predictions[0], output1[0][:, 0])
-    assert torch.equal(em._predictions[1], output2[0][:, 0])
-    assert torch.equal(em._targets[0], output1[1][:, 0])
-    assert torch.equal(em._targets[1], output2[1][:, 0])
+    assert all([t.device.type == "cpu" for t in (em._predictions.data(), em._targets.data())])
+    assert torch.equal(em._predictions.data(), torch.cat([output1[0][:, 0], output2[0][:, 0]]))
+    assert torch.equal(em._targets.data(), torch.cat([output1[1][:, 0], output2[1][:, 0]]))
     assert em.compute() == 0.0
 
 
@@ -135,65 +145,99 @@ def test_bad_compute_fn():
         em.update(output1)
 
 
-def _test_warning():
+@pytest.mark.parametrize("storage", ["memory", "mmap"])
+def test_epoch_metric_storage(storage, tmpdir):
+    received = []
+
     def compute_fn(y_preds, y_targets):
+        received.append((y_preds, y_targets))
         return 0.0
 
-    with pytest.warns(RuntimeWarning, match="EpochMetric class does not support distributed setting"):
-        EpochMetric(compute_fn)
+    mmap_dir = str(tmpdir) if storage == "mmap" else None
+    em = EpochMetric(compute_fn, mmap_dir=mmap_dir)
 
+    # buffers grow over the initial capacity
+    outputs = [(torch.rand(300, 3), torch.randint(0, 2, size=(300, 3), dtype=torch.long)) for _ in range(10)]
+    for output in outputs:
+        em.update(output)
+    assert em._predictions._buffer.shape[0] >= 3000
 
-@pytest.mark.distributed
-@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
-def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
+    em.compute()
+    y_preds, y_targets = received[-1]
+    assert torch.equal(y_preds, torch.cat([o[0] for o in outputs]))
+    assert torch.equal(y_targets, torch.cat([o[1] for o in outputs]))
+    # compute_fn receives views on stored data
+    assert y_preds.data_ptr() == em._predictions._buffer.data_ptr()
+    assert y_targets.data_ptr() == em._targets._buffer.data_ptr()
 
-    _test_warning()
+    if storage == "mmap":
+        # temporary files are removed once mapped
+        assert len(tmpdir.listdir()) == 0
 
-    # Perform some ops otherwise, next tests fail
+
+def _test_distrib_variable_size(device):
     import torch.distributed as dist
 
-    device = "cuda:{}".format(local_rank)
+    rank = dist.get_rank()
+    world_size = dist.get_world_size()
 
-    def _gather(y):
-        output = [torch.zeros_like(y) for i in range(dist.get_world_size())]
-        dist.all_gather(output, y)
-        y = torch.cat(output, dim=0)
-        return y
+    def compute_fn(y_preds, y_targets):
+        return y_preds, y_targets
 
-    y = torch.rand(10, 12, device=device)
-    y = _gather(y)
-    assert isinstance(y, torch.Tensor)
+    em = EpochMetric(compute_fn, device=device)
 
+    torch.manual_seed(12)
+    sizes = [10 + 3 * i for i in range(world_size)]
+    y_preds = [torch.rand(size, 3) for size in sizes]
+    y_targets = [torch.randint(0, 2, size=(size, 3), dtype=torch.long) for size in sizes]
 
-@pytest.mark.distributed
-def test_distrib_cpu(local_rank, distributed_context_single_node_gloo):
+    em.update((y_preds[rank].to(device), y_targets[rank].to(device)))
+    res_preds, res_targets = em.compute()
 
-    _test_warning()
+    assert res_preds.device.type == "cpu"
+    assert torch.equal(res_preds, torch.cat(y_preds))
+    assert torch.equal(res_targets, torch.cat(y_targets))
 
-    # Perform some ops otherwise, next tests fail
+
+def _test_distrib_empty_process(device):
     import torch.distributed as dist
 
-    device = "cpu"
+    em = EpochMetric(lambda y_preds, y_targets: 0.0, device=device)
+    # first process has no examples: all processes raise instead of blocking in the gather
+    if dist.get_rank() > 0:
+        em.update((torch.rand(4, 3, device=device), torch.randint(0, 2, size=(4, 3), device=device)))
+    with pytest.raises(NotComputableError, match=r"EpochMetric must have at least one example"):
+        em.compute()
 
-    def _gather(y):
-        output = [torch.zeros_like(y) for i in range(dist.get_world_size())]
-        dist.all_gather(output, y)
-        y = torch.cat(output, dim=0)
-        return y
 
-    y = torch.rand(10, 12, device=device)
-    y = _gather(y)
-    assert isinstance(y, torch.Tensor)
+@pytest.mark.distributed
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
+
+    device = "cuda:{}".format(local_rank)
+    _test_distrib_variable_size(device)
+    _test_distrib_empty_process(device)
+
+
+@pytest.mark.distributed
+def test_distrib_cpu(local_rank, distributed_context_single_node_gloo):
+
+    device = "cpu"
+    _test_distrib_variable_size(device)
+    _test_distrib_empty_process(device)
 
 
 @pytest.mark.multinode_distributed
 @pytest.mark.skipif("MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
 def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
-
-    _test_warning()
+    device = "cpu"
+    _test_distrib_variable_size(device)
+    _test_distrib_empty_process(device)
 
 
 @pytest.mark.multinode_distributed
 @pytest.mark.skipif("GPU_MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
 def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
-    _test_warning()
+    device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
+    _test_distrib_variable_size(device)
+    _test_distrib_empty_process(device)
@@ -6,7 +6,7 @@ import torch
 from sklearn.metrics import fbeta_score
 
 from ignite.engine import Engine
-from ignite.metrics import Fbeta, Precision, Recall
+from ignite.metrics import ConfusionMatrix, Fbeta, Precision, Recall, cmPrecision, cmRecall
 
 torch.manual_seed(12)
 
@@ -86,6 +86,10 @@ def test_integration():
     recall = Recall(average=False)
     _test(precision, recall, False, None)
     _test(precision, recall, True, None)
+    cm = ConfusionMatrix(num_classes=10)
+    _test(cmPrecision(cm, average=False), cmRecall(cm, average=False), False, None)
+    cm = ConfusionMatrix(num_classes=10)
+    _test(cmPrecision(cm, average=False), cmRecall(cm, average=False), True, None)
 
 
 def _test_distrib_itegration(device):
@@ -4,7 +4,7 @@ import pytest
 import torch.distributed as dist
 
 from ignite.engine import Engine, Events
-from ignite.metrics import Frequency
+from ignite.metrics import Frequency, RunningAverage
 
 
 def test_nondistributed_average():
@@ -70,3 +70,34 @@ def test_frequency_with_engine_distributed_with_every(distributed_context_single
     device = "cpu"
     _test_frequency_with_engine(device, workers=dist.get_world_size(), every=1)
     _test_frequency_with_engine(device, workers=dist.get_world_size(), every=10)
+
+
+def _test_frequency_with_running_average_all_reduce():
+    engine = Engine(lambda e, b: {"ntokens": 10, "loss": 1.0})
+    # Frequency is read first at iterations 3, 6 and 9 and reduced with the running average
+    Frequency(output_transform=lambda x: x["ntokens"]).attach(
+        engine, "wps", event_name=Events.ITERATION_COMPLETED(every=3)
+    )
+    RunningAverage(output_transform=lambda x: x["loss"], sync_every=3).attach(engine, "loss")
+
+    num_all_reduce = [0]
+    all_reduce = dist.all_reduce
+
+    def counting_all_reduce(*args, **kwargs):
+        num_all_reduce[0] += 1
+        return all_reduce(*args, **kwargs)
+
+    dist.all_reduce = counting_all_reduce
+    try:
+        engine.run(list(range(10)), max_epochs=1)
+    finally:
+        dist.all_reduce = all_reduce
+
+    # first value of the running average, then a single collective at iterations 3, 6 and 9
+    assert num_all_reduce[0] == 4
+    assert engine.state.metrics["loss"] == pytest.approx(dist.get_world_size())
+
+
+@pytest.mark.distributed
+def test_frequency_with_running_average_all_reduce_distributed(distributed_context_single_node_gloo):
+    _test_frequency_with_running_average_all_reduce()
@@ -74,6 +74,26 @@ def test_reset():
         loss.compute()
 
 
+def test_accumulator_device():
+    devices = ["cpu"] + (["cuda"] if torch.cuda.is_available() else [])
+    for metric_device in devices:
+        loss = Loss(nll_loss, device=metric_device)
+        for data_device in devices:
+            y_pred = torch.tensor([[0.1, 0.4, 0.5], [0.1, 0.7, 0.2]]).log().to(data_device)
+            y = torch.tensor([2, 2]).long().to(data_device)
+            loss.reset()
+            loss.update((y_pred, y))
+
+            # state is a Python number on CPU, otherwise it is kept on the metric's device until compute
+            if metric_device == "cpu":
+                assert isinstance(loss._sum, float)
+            else:
+                assert isinstance(loss._sum, torch.Tensor)
+                assert loss._sum.device.type == torch.device(metric_device).type
+                assert loss._sum.dtype == torch.float64
+            assert_almost_equal(loss.compute(), 1.1512925625)
+
+
 def _test_distrib_compute_on_criterion(device):
     import torch.distributed as dist
 
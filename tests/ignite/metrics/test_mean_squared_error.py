@@ -30,6 +30,24 @@ def test_compute():
     assert mse.compute() == 9.0
 
 
+def test_accumulator_device():
+    devices = ["cpu"] + (["cuda"] if torch.cuda.is_available() else [])
+    for metric_device in devices:
+        mse = MeanSquaredError(device=metric_device)
+        for data_device in devices:
+            y_pred = torch.Tensor([[2.0], [-2.0]]).to(data_device)
+            y = torch.zeros(2).to(data_device)
+            mse.reset()
+            mse.update((y_pred, y))
+
+            if metric_device == "cpu":
+                assert isinstance(mse._sum_of_squared_errors, float)
+            else:
+                assert mse._sum_of_squared_errors.device.type == torch.device(metric_device).type
+            assert isinstance(mse.compute(), float)
+            assert mse.compute() == 4.0
+
+
 def _test_distrib_itegration(device):
     import numpy as np
     import torch.distributed as dist
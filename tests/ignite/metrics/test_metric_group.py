@@ -0,0 +1,170 @@
+import os
+from unittest.mock import patch
+
+import pytest
+import torch
+import torch.distributed as dist
+
+from ignite.engine import Engine, Events
+from ignite.metrics import Accuracy, ConfusionMatrix, EpochMetric, Loss, MetricGroup, Precision, Recall
+
+
+def test_wrong_input():
+    with pytest.raises(TypeError, match=r"Argument engine should be ignite.engine.Engine"):
+        MetricGroup().attach(None)
+
+
+def _create_evaluator(data, device):
+    def update_fn(engine, batch):
+        return batch
+
+    evaluator = Engine(update_fn)
+    Accuracy(device=device).attach(evaluator, "acc")
+    precision = Precision(average=False, device=device)
+    recall = Recall(average=False, device=device)
+    F1 = precision * recall * 2 / (precision + recall + 1e-20)
+    F1.attach(evaluator, "f1")
+    Precision(average=True, device=device).attach(evaluator, "avg_precision")
+    ConfusionMatrix(num_classes=3, device=device).attach(evaluator, "cm")
+    Loss(torch.nn.NLLLoss(), device=device).attach(evaluator, "nll")
+    EpochMetric(lambda y_pred, y: (y_pred.argmax(dim=1) == y).sum().item()).attach(evaluator, "epoch_metric")
+    return evaluator
+
+
+def _get_data(device, n=16, seed=12):
+    torch.manual_seed(seed)
+    y_pred = torch.rand(n, 3).log_softmax(dim=1).to(device)
+    y = torch.randint(0, 3, size=(n,)).to(device)
+    return [(y_pred[i : i + 4], y[i : i + 4]) for i in range(0, n, 4)]
+
+
+def _assert_equal_metrics(m1, m2):
+    assert m1.keys() == m2.keys()
+    for k in m1:
+        if isinstance(m1[k], torch.Tensor):
+            assert torch.allclose(m1[k].cpu().double(), m2[k].cpu().double()), k
+        else:
+            assert m1[k] == pytest.approx(m2[k]), k
+
+
+def test_attach_detach():
+    evaluator = _create_evaluator(_get_data("cpu"), "cpu")
+    group = MetricGroup()
+    group.attach(evaluator)
+    assert evaluator.has_event_handler(group._reduce, Events.EPOCH_COMPLETED)
+    assert evaluator._event_handlers[Events.EPOCH_COMPLETED][0][0] == group._reduce
+    group.detach(evaluator)
+    assert not evaluator.has_event_handler(group._reduce, Events.EPOCH_COMPLETED)
+
+
+def test_non_distributed_results():
+    data = _get_data("cpu")
+
+    expected = _create_evaluator(data, "cpu").run(data).metrics
+
+    evaluator = _create_evaluator(data, "cpu")
+    MetricGroup().attach(evaluator)
+    _assert_equal_metrics(evaluator.run(data).metrics, expected)
+
+
+def test_share_inputs():
+    data = _get_data("cpu")
+
+    expected = _create_evaluator(data, "cpu").run(data).metrics
+
+    evaluator = _create_evaluator(data, "cpu")
+    group = MetricGroup(share_inputs=True)
+    group.attach(evaluator)
+    assert len(evaluator._event_handlers[Events.ITERATION_STARTED]) == 1
+    assert evaluator._metric_input_cache is not None
+    _assert_equal_metrics(evaluator.run(data).metrics, expected)
+
+    group.detach(evaluator)
+    assert len(evaluator._event_handlers[Events.ITERATION_STARTED]) == 0
+    assert evaluator._metric_input_cache is None
+
+
+def _test_share_inputs_transform(share_inputs):
+    num_calls = [0]
+
+    def thresholded_output_transform(output):
+        num_calls[0] += 1
+        y_pred, y = output
+        return (y_pred > 0.5).long(), y
+
+    def another_thresholded_output_transform(output):
+        num_calls[0] += 1
+        y_pred, y = output
+        return (y_pred > 0.5).long(), y
+
+    thresholded_output_transform.cache_key = "thresholded"
+    another_thresholded_output_transform.cache_key = "thresholded"
+
+    evaluator = Engine(lambda engine, batch: batch)
+    Accuracy(thresholded_output_transform).attach(evaluator, "acc")
+    Precision(thresholded_output_transform).attach(evaluator, "precision")
+    Recall(another_thresholded_output_transform).attach(evaluator, "recall")
+    if share_inputs:
+        MetricGroup(share_inputs=True).attach(evaluator)
+
+    torch.manual_seed(12)
+    data = [(torch.rand(4), torch.randint(0, 2, size=(4,))) for _ in range(5)]
+    metrics = evaluator.run(data).metrics
+    return metrics, num_calls[0]
+
+
+def test_share_inputs_transform_once():
+    expected, num_calls = _test_share_inputs_transform(share_inputs=False)
+    assert num_calls == 3 * 5
+
+    metrics, num_calls = _test_share_inputs_transform(share_inputs=True)
+    assert num_calls == 5
+    _assert_equal_metrics(metrics, expected)
+
+
+def _test_distrib_coalesced_reduction(device):
+    data = _get_data(device, seed=12 + dist.get_rank())
+
+    expected = _create_evaluator(data, device).run(data).metrics
+
+    evaluator = _create_evaluator(data, device)
+    MetricGroup().attach(evaluator)
+
+    with patch("ignite.metrics.metric_group.dist.all_reduce", wraps=dist.all_reduce) as all_reduce, patch(
+        "ignite.metrics.metric.dist.barrier", wraps=dist.barrier
+    ) as barrier:
+        state = evaluator.run(data)
+
+    # int64 (counts, confusion matrix) and float64 (precision, recall, loss)
+    assert all_reduce.call_count == 2
+    assert barrier.call_count == 0
+    _assert_equal_metrics(state.metrics, expected)
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
+
+    device = "cuda:{}".format(local_rank)
+    _test_distrib_coalesced_reduction(device)
+
+
+@pytest.mark.distributed
+def test_distrib_cpu(distributed_context_single_node_gloo):
+
+    device = "cpu"
+    _test_distrib_coalesced_reduction(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
+    device = "cpu"
+    _test_distrib_coalesced_reduction(device)
+
+
+@pytest.mark.multinode_distributed
+@pytest.mark.skipif("GPU_MULTINODE_DISTRIB" not in os.environ, reason="Skip if not multi-node distributed")
+def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
+    device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
+    _test_distrib_coalesced_reduction(device)
@@ -6,8 +6,10 @@ import torch
 from pytest import approx
 from sklearn.metrics import f1_score, precision_score, recall_score
 
-from ignite.engine import Engine
+from ignite.contrib.handlers import StreamingTimeProfiler
+from ignite.engine import Engine, Events
 from ignite.metrics import Metric, MetricsLambda, Precision, Recall
+from ignite.metrics.metrics_lambda import _ComputeCache
 
 
 class ListGatherMetric(Metric):
@@ -98,6 +100,93 @@ def test_metrics_lambda_reset():
     assert m2.list_ is None
 
 
+class CountingMetric(ListGatherMetric):
+    def __init__(self, index):
+        self.num_computes = 0
+        super(CountingMetric, self).__init__(index)
+
+    def compute(self):
+        self.num_computes += 1
+        return super(CountingMetric, self).compute()
+
+
+def test_compute_once():
+    precision = CountingMetric(0)
+    recall = CountingMetric(1)
+    f1 = precision * recall * 2 / (precision + recall)
+
+    precision.update([0.5, 0.25])
+    recall.update([0.5, 0.25])
+    assert f1.compute() == approx(1.0 / 3.0)
+    assert precision.num_computes == 1
+    assert recall.num_computes == 1
+
+    # a new computation does not use values of the previous one
+    precision.update([1.0, 1.0])
+    assert f1.compute() == approx(0.4)
+    assert precision.num_computes == 2
+    assert recall.num_computes == 2
+
+
+def test_shared_subexpressions():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+    num_calls = [0]
+
+    def ratio(x, y):
+        num_calls[0] += 1
+        return x / y
+
+    # common sub-expression built twice
+    r1 = MetricsLambda(ratio, m0, m1)
+    r2 = MetricsLambda(ratio, m0, m1)
+    assert r1 is not r2
+
+    def process_function(engine, data):
+        return data
+
+    engine = Engine(process_function)
+    (r1 + 1).attach(engine, "a")
+    (r2 * 2).attach(engine, "b")
+    m0_plus_2 = MetricsLambda(lambda x, y: x + y, m0, 2)
+    m0_plus_2.attach(engine, "c")
+
+    engine.run([[2.0, 4.0]], max_epochs=2)
+    assert engine.state.metrics["a"] == approx(1.5)
+    assert engine.state.metrics["b"] == approx(1.0)
+    assert engine.state.metrics["c"] == approx(4.0)
+    # once per epoch for all attached lambdas
+    assert m0.num_computes == 2
+    assert m1.num_computes == 2
+    assert num_calls[0] == 2
+
+
+def test_shared_subexpressions_with_profiler():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+    num_calls = [0]
+
+    def ratio(x, y):
+        num_calls[0] += 1
+        return x / y
+
+    engine = Engine(lambda e, b: b)
+    StreamingTimeProfiler().attach(engine)
+    (MetricsLambda(ratio, m0, m1) + 1).attach(engine, "a")
+
+    # handlers are wrapped by the profiler when the second lambda is attached
+    @engine.on(Events.STARTED)
+    def attach_second_lambda():
+        (MetricsLambda(ratio, m0, m1) * 2).attach(engine, "b")
+
+    engine.run([[2.0, 4.0]])
+    assert engine.state.metrics["a"] == approx(1.5)
+    assert engine.state.metrics["b"] == approx(1.0)
+    assert num_calls[0] == 1
+    caches = [h for h in engine._get_event_handlers(Events.EPOCH_COMPLETED) if hasattr(h, "__self__")]
+    assert len([h for h in caches if isinstance(h.__self__, _ComputeCache)]) == 1
+
+
 def test_integration():
     np.random.seed(1)
 
@@ -464,6 +464,27 @@ def test_multiclass_input_NHW():
         _test(average=False)
 
 
+def test_multiclass_large_num_classes():
+    num_classes = 20000
+    y_pred = torch.rand(64, num_classes)
+    y = torch.randint(0, num_classes, size=(64,)).long()
+    # make some predictions correct
+    y_pred[torch.arange(32), y[:32]] += 10.0
+
+    metric = Precision(average=False)
+    metric.update((y_pred[:32], y[:32]))
+    metric.update((y_pred[32:], y[32:]))
+    assert metric._true_positives.shape == (num_classes,)
+    assert metric._true_positives.dtype == torch.float64
+
+    np_y_pred = y_pred.argmax(dim=1).numpy()
+    np_y = y.numpy()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        sk_compute = precision_score(np_y, np_y_pred, labels=range(num_classes), average=None)
+    assert sk_compute == pytest.approx(metric.compute().numpy())
+
+
 def test_multilabel_wrong_inputs():
     pr = Precision(average=True, is_multilabel=True)
 
@@ -503,10 +524,10 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(10, 4))
@@ -515,10 +536,10 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         # Batched Updates
         pr.reset()
@@ -535,22 +556,26 @@ def test_multilabel_input_NC():
         np_y = y.numpy()
         np_y_pred = y_pred.numpy()
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    pr1 = Precision(is_multilabel=True, average=True)
-    pr2 = Precision(is_multilabel=True, average=False)
+    pr = Precision(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    pr1.update((y_pred, y))
-    pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    pr.update((y_pred, y))
+    pr_compute = pr.compute()
+    assert pr_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert precision_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            pr_compute.numpy()
+        )
 
 
 def test_multilabel_input_NCL():
@@ -563,10 +588,10 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(15, 4, 10))
@@ -575,10 +600,10 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         # Batched Updates
         pr.reset()
@@ -595,22 +620,26 @@ def test_multilabel_input_NCL():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    pr1 = Precision(is_multilabel=True, average=True)
-    pr2 = Precision(is_multilabel=True, average=False)
+    pr = Precision(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    pr1.update((y_pred, y))
-    pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    pr.update((y_pred, y))
+    pr_compute = pr.compute()
+    assert pr_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert precision_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            pr_compute.numpy()
+        )
 
 
 def test_multilabel_input_NCHW():
@@ -623,10 +652,10 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         pr.reset()
         y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
@@ -635,10 +664,10 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
         # Batched Updates
         pr.reset()
@@ -655,22 +684,48 @@ def test_multilabel_input_NCHW():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert pr._type == "multilabel"
-        pr_compute = pr.compute() if average else pr.compute().mean().item()
+        pr_compute = pr.compute() if average else pr.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert precision_score(np_y, np_y_pred, average="samples") == pytest.approx(pr_compute)
+            assert precision_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(pr_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    pr1 = Precision(is_multilabel=True, average=True)
-    pr2 = Precision(is_multilabel=True, average=False)
+    pr = Precision(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    pr1.update((y_pred, y))
-    pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    pr.update((y_pred, y))
+    pr_compute = pr.compute()
+    assert pr_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert precision_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            pr_compute.numpy()
+        )
+
+
+def test_multilabel_average_false_constant_memory():
+    pr = Precision(average=False, is_multilabel=True)
+
+    y_pred = torch.randint(0, 2, size=(100, 6, 8))
+    y = torch.randint(0, 2, size=(100, 6, 8)).long()
+
+    batch_size = 10
+    for i in range(y.shape[0] // batch_size):
+        idx = i * batch_size
+        pr.update((y_pred[idx : idx + batch_size], y[idx : idx + batch_size]))
+        # sufficient statistics do not grow with the number of samples
+        assert pr._true_positives.shape == (6,)
+        assert pr._positives.shape == (6,)
+
+    assert pr._reducible_attrs() == ("_true_positives", "_positives")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert precision_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            pr.compute().numpy()
+        )
 
 
 def test_incorrect_type():
@@ -692,13 +747,17 @@ def test_incorrect_type():
     _test(average=True)
     _test(average=False)
 
-    pr1 = Precision(is_multilabel=True, average=True)
-    pr2 = Precision(is_multilabel=True, average=False)
+    pr = Precision(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    pr1.update((y_pred, y))
-    pr2.update((y_pred, y))
-    assert pr1.compute() == pytest.approx(pr2.compute().mean().item())
+    pr.update((y_pred, y))
+    pr_compute = pr.compute()
+    assert pr_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert precision_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            pr_compute.numpy()
+        )
 
 
 def test_incorrect_y_classes():
@@ -815,20 +874,16 @@ def _test_distrib_itegration_multilabel(device):
     for _ in range(2):
         _test(average=True, n_epochs=1)
         _test(average=True, n_epochs=2)
+        _test(average=False, n_epochs=1)
+        _test(average=False, n_epochs=2)
 
-    with pytest.warns(
-        RuntimeWarning,
-        match="Precision/Recall metrics do not work in distributed setting when "
-        "average=False and is_multilabel=True",
-    ):
-        pr = Precision(average=False, is_multilabel=True, device=device)
-
+    pr = Precision(average=False, is_multilabel=True, device=device)
     y_pred = torch.randint(0, 2, size=(4, 3, 6, 8))
     y = torch.randint(0, 2, size=(4, 3, 6, 8)).long()
     pr.update((y_pred, y))
     pr_compute1 = pr.compute()
     pr_compute2 = pr.compute()
-    assert len(pr_compute1) == 4 * 6 * 8
+    assert len(pr_compute1) == 3
     assert (pr_compute1 == pr_compute2).all()
 
 
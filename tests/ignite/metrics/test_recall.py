@@ -463,6 +463,27 @@ def test_multiclass_input_NHW():
         _test(average=False)
 
 
+def test_multiclass_large_num_classes():
+    num_classes = 20000
+    y_pred = torch.rand(64, num_classes)
+    y = torch.randint(0, num_classes, size=(64,)).long()
+    # make some predictions correct
+    y_pred[torch.arange(32), y[:32]] += 10.0
+
+    metric = Recall(average=False)
+    metric.update((y_pred[:32], y[:32]))
+    metric.update((y_pred[32:], y[32:]))
+    assert metric._true_positives.shape == (num_classes,)
+    assert metric._true_positives.dtype == torch.float64
+
+    np_y_pred = y_pred.argmax(dim=1).numpy()
+    np_y = y.numpy()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        sk_compute = recall_score(np_y, np_y_pred, labels=range(num_classes), average=None)
+    assert sk_compute == pytest.approx(metric.compute().numpy())
+
+
 def test_multilabel_wrong_inputs():
     re = Recall(average=True, is_multilabel=True)
 
@@ -502,10 +523,10 @@ def test_multilabel_input_NC():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(10, 4))
@@ -514,10 +535,10 @@ def test_multilabel_input_NC():
         np_y_pred = y_pred.numpy()
         np_y = y.numpy()
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         # Batched Updates
         re.reset()
@@ -534,22 +555,26 @@ def test_multilabel_input_NC():
         np_y = y.numpy()
         np_y_pred = y_pred.numpy()
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    re1 = Recall(is_multilabel=True, average=True)
-    re2 = Recall(is_multilabel=True, average=False)
+    re = Recall(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4))
     y = torch.randint(0, 2, size=(10, 4)).long()
-    re1.update((y_pred, y))
-    re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    re.update((y_pred, y))
+    re_compute = re.compute()
+    assert re_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert recall_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            re_compute.numpy()
+        )
 
 
 def test_multilabel_input_NCL():
@@ -562,10 +587,10 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(15, 4, 10))
@@ -574,10 +599,10 @@ def test_multilabel_input_NCL():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         # Batched Updates
         re.reset()
@@ -594,22 +619,26 @@ def test_multilabel_input_NCL():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    re1 = Recall(is_multilabel=True, average=True)
-    re2 = Recall(is_multilabel=True, average=False)
+    re = Recall(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20))
     y = torch.randint(0, 2, size=(10, 4, 20)).long()
-    re1.update((y_pred, y))
-    re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    re.update((y_pred, y))
+    re_compute = re.compute()
+    assert re_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert recall_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            re_compute.numpy()
+        )
 
 
 def test_multilabel_input_NCHW():
@@ -622,10 +651,10 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         re.reset()
         y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
@@ -634,10 +663,10 @@ def test_multilabel_input_NCHW():
         np_y_pred = to_numpy_multilabel(y_pred)
         np_y = to_numpy_multilabel(y)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
         # Batched Updates
         re.reset()
@@ -654,22 +683,48 @@ def test_multilabel_input_NCHW():
         np_y = to_numpy_multilabel(y)
         np_y_pred = to_numpy_multilabel(y_pred)
         assert re._type == "multilabel"
-        re_compute = re.compute() if average else re.compute().mean().item()
+        re_compute = re.compute() if average else re.compute().numpy()
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=UndefinedMetricWarning)
-            assert recall_score(np_y, np_y_pred, average="samples") == pytest.approx(re_compute)
+            assert recall_score(np_y, np_y_pred, average="samples" if average else None) == pytest.approx(re_compute)
 
     for _ in range(5):
         _test(average=True)
         _test(average=False)
 
-    re1 = Recall(is_multilabel=True, average=True)
-    re2 = Recall(is_multilabel=True, average=False)
+    re = Recall(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    re1.update((y_pred, y))
-    re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    re.update((y_pred, y))
+    re_compute = re.compute()
+    assert re_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert recall_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            re_compute.numpy()
+        )
+
+
+def test_multilabel_average_false_constant_memory():
+    re = Recall(average=False, is_multilabel=True)
+
+    y_pred = torch.randint(0, 2, size=(100, 6, 8))
+    y = torch.randint(0, 2, size=(100, 6, 8)).long()
+
+    batch_size = 10
+    for i in range(y.shape[0] // batch_size):
+        idx = i * batch_size
+        re.update((y_pred[idx : idx + batch_size], y[idx : idx + batch_size]))
+        # sufficient statistics do not grow with the number of samples
+        assert re._true_positives.shape == (6,)
+        assert re._positives.shape == (6,)
+
+    assert re._reducible_attrs() == ("_true_positives", "_positives")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert recall_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            re.compute().numpy()
+        )
 
 
 def test_incorrect_type():
@@ -691,13 +746,17 @@ def test_incorrect_type():
     _test(average=True)
     _test(average=False)
 
-    re1 = Recall(is_multilabel=True, average=True)
-    re2 = Recall(is_multilabel=True, average=False)
+    re = Recall(is_multilabel=True, average=False)
     y_pred = torch.randint(0, 2, size=(10, 4, 20, 23))
     y = torch.randint(0, 2, size=(10, 4, 20, 23)).long()
-    re1.update((y_pred, y))
-    re2.update((y_pred, y))
-    assert re1.compute() == pytest.approx(re2.compute().mean().item())
+    re.update((y_pred, y))
+    re_compute = re.compute()
+    assert re_compute.shape == (4,)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UndefinedMetricWarning)
+        assert recall_score(to_numpy_multilabel(y), to_numpy_multilabel(y_pred), average=None) == pytest.approx(
+            re_compute.numpy()
+        )
 
 
 def test_incorrect_y_classes():
@@ -814,20 +873,16 @@ def _test_distrib_itegration_multilabel(device):
     for _ in range(2):
         _test(average=True, n_epochs=1)
         _test(average=True, n_epochs=2)
+        _test(average=False, n_epochs=1)
+        _test(average=False, n_epochs=2)
 
-    with pytest.warns(
-        RuntimeWarning,
-        match="Precision/Recall metrics do not work in distributed setting when "
-        "average=False and is_multilabel=True",
-    ):
-        re = Recall(average=False, is_multilabel=True, device=device)
-
+    re = Recall(average=False, is_multilabel=True, device=device)
     y_pred = torch.randint(0, 2, size=(4, 3, 6, 8))
     y = torch.randint(0, 2, size=(4, 3, 6, 8)).long()
     re.update((y_pred, y))
     re_compute1 = re.compute()
     re_compute2 = re.compute()
-    assert len(re_compute1) == 4 * 6 * 8
+    assert len(re_compute1) == 3
     assert (re_compute1 == re_compute2).all()
 
 
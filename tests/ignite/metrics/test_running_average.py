@@ -25,6 +25,12 @@ def test_wrong_input_args():
     with pytest.raises(ValueError, match=r"Argument device should be None if src is a Metric"):
         RunningAverage(Accuracy(), device="cpu")
 
+    with pytest.raises(ValueError, match=r"Argument sync_every should be a positive integer"):
+        RunningAverage(output_transform=lambda x: x, sync_every=0)
+
+    with pytest.raises(ValueError, match=r"Argument sync_every should be 1 if src is a Metric"):
+        RunningAverage(Accuracy(), sync_every=10)
+
 
 def test_integration():
 
@@ -296,6 +302,57 @@ def _test_distrib_on_output(device):
     trainer.run(data, max_epochs=3)
 
 
+def _test_distrib_on_output_sync_every(device):
+    import torch.distributed as dist
+
+    rank = dist.get_rank()
+    n_iters = 10
+    sync_every = 3
+    alpha = 0.9
+
+    all_values = torch.rand(dist.get_world_size(), 2, n_iters, dtype=torch.float64)
+
+    def update_fn(engine, batch):
+        i = engine.state.iteration - 1
+        return all_values[rank, 0, i].item(), all_values[rank, 1, i].item()
+
+    trainer = Engine(update_fn)
+    for j, name in enumerate(["a", "b"]):
+        RunningAverage(
+            output_transform=partial(lambda x, j: x[j], j=j), alpha=alpha, device=device, sync_every=sync_every
+        ).attach(trainer, name)
+
+    expected = {}
+
+    @trainer.on(Events.ITERATION_COMPLETED)
+    def check_values(engine):
+        i = engine.state.iteration - 1
+        # running average is linear, thus the sum of local running averages is the running average of sums
+        for j, name in enumerate(["a", "b"]):
+            o = all_values[:, j, i].sum().item()
+            value = o if i == 0 else expected[name + "_local"] * alpha + (1.0 - alpha) * o
+            expected[name + "_local"] = value
+            if i == 0 or engine.state.iteration % sync_every == 0:
+                expected[name] = value
+            assert engine.state.metrics[name] == pytest.approx(expected[name])
+
+    num_all_reduce = [0]
+    all_reduce = dist.all_reduce
+
+    def counting_all_reduce(*args, **kwargs):
+        num_all_reduce[0] += 1
+        return all_reduce(*args, **kwargs)
+
+    dist.all_reduce = counting_all_reduce
+    try:
+        trainer.run(list(range(n_iters)), max_epochs=1)
+    finally:
+        dist.all_reduce = all_reduce
+
+    # both running averages are reduced in a single collective at iterations 1, 3, 6 and 9
+    assert num_all_reduce[0] == 4
+
+
 def _test_distrib_on_metric(device):
     import torch.distributed as dist
 
@@ -368,6 +425,7 @@ def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
 
     device = "cuda:{}".format(local_rank)
     _test_distrib_on_output(device)
+    _test_distrib_on_output_sync_every(device)
     _test_distrib_on_metric(device)
 
 
@@ -376,6 +434,7 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
 
     device = "cpu"
     _test_distrib_on_output(device)
+    _test_distrib_on_output_sync_every(device)
     _test_distrib_on_metric(device)
 
 
@@ -384,6 +443,7 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
 def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
     device = "cpu"
     _test_distrib_on_output(device)
+    _test_distrib_on_output_sync_every(device)
     _test_distrib_on_metric(device)
 
 
@@ -392,4 +452,5 @@ def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
 def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
     device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
     _test_distrib_on_output(device)
+    _test_distrib_on_output_sync_every(device)
     _test_distrib_on_metric(device)
@@ -30,6 +30,25 @@ def test_compute():
     assert acc.compute() == 1.0
 
 
+def test_accumulator_device():
+    devices = ["cpu"] + (["cuda"] if torch.cuda.is_available() else [])
+    for metric_device in devices:
+        acc = TopKCategoricalAccuracy(2, device=metric_device)
+        for data_device in devices:
+            y_pred = torch.FloatTensor([[0.2, 0.4, 0.6, 0.8], [0.8, 0.6, 0.4, 0.2]]).to(data_device)
+            y = torch.ones(2).long().to(data_device)
+            acc.reset()
+            acc.update((y_pred, y))
+
+            if metric_device == "cpu":
+                assert isinstance(acc._num_correct, int)
+            else:
+                assert acc._num_correct.device.type == torch.device(metric_device).type
+                assert acc._num_correct.dtype == torch.int64
+            assert isinstance(acc.compute(), float)
+            assert acc.compute() == 0.5
+
+
 def top_k_accuracy(y_true, y_pred, k=5, normalize=True):
     import numpy as np
 